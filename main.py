@@ -1,7 +1,11 @@
+from src.currency_converter import CurrencyConverter
+from src.dictionaries import DictionaryCache
 from src.file_worker import JsonWorker, CsvWorker, ExcelWorker
 from src.headhunter_api import HeadHunterAPI
 from src.json_saver import JsonSaver
-from src.vacancy import Validator, Vacancy
+from src.quarantine import Quarantine
+from src.vacancy import VACANCY_ERRORS, Validator, Vacancy
+from src.vacancy_store import VacancyStore
 
 from tqdm import tqdm
 
@@ -220,8 +224,8 @@ def user_interaction() -> None:
     user_input = input("Введите поисковый запрос (default 'Python') >>: ")  # Пример: "Python"
     keyword = "Python" if not user_input else user_input
 
-    user_input = input("Ведите количество желаемых страниц (default 100) >>: ")
-    vacancies_number = 100 if not user_input else int(user_input)
+    user_input = input("Ведите количество желаемых страниц (default 1, 0 - все страницы) >>: ")
+    pages_number = 1 if not user_input else int(user_input)
 
     user_input = input("Введите количество вакансий для вывода в топ N по зарплате (default 5) >>: ")
     top_n = 5 if not user_input else int(user_input)
@@ -245,33 +249,47 @@ def user_interaction() -> None:
     # "https://api.headhunter.kg/vacancies" т.д. Подробнее в документации на сайте компании.
     print("Получим сырые данные из API")
     try:
-        hh_api = HeadHunterAPI(url=BASE_URL, per_page=vacancies_number)
+        hh_api = HeadHunterAPI(url=BASE_URL, per_page=100, max_workers=4)
     except ConnectionError:
         print("Дальше нет смысла... Выходим")
         exit(1)
 
     # Получение вакансий с hh.ru в формате JSON
     # Аргумент query, полученный от пользователя, определяет слово, по которому будет осуществлён поиск.
-    # Аргумент pages определяет количество страниц, в которых будет осуществлён поиск.
-    print("Загрузим вакансии из API в json-объект")
-    hh_vacancies = hh_api.load_vacancies(keyword=keyword)
-
-    print("Выведем элементы полученного json-объекта по одному для демонстрации")
-    for vacancy in hh_vacancies:
-        print(vacancy, end="\n")
-
-    # Пример работы конструктора класса со списком вакансий, полученных из API
+    # Аргумент pages определяет количество страниц, в которых будет осуществлён поиск (0 - все страницы).
+    # Вакансии отдаются генератором по мере загрузки страниц, поэтому валидация и создание экземпляров класса Vacancy
+    # идут параллельно с загрузкой следующих страниц, а весь список сырых вакансий в памяти не хранится.
+    print("Загрузим вакансии из API и по мере загрузки страниц создадим из них экземпляры класса Vacancy")
     print("#" + "*" * 100)
     print("Задача 2 - из полученных из API данных создадим экземпляры класса Vacancy")
-    print("Создадим список объектов", end=" ")
-    validated_vacancies = [validator.validate(item) for item in hh_vacancies]
-    Vacancy.cast_to_object_list(validated_vacancies)
-    print("и выведем его на экран")
-    print(Vacancy.print_obj_vacancies_list())
+    # Зарплаты пересчитываются в рубли по курсам из справочника валют hh.ru, чтобы сортировать и фильтровать вакансии
+    # в разных валютах. Если справочник не загрузился, то зарплаты сравниваются в валюте вакансии.
+    try:
+        converter: CurrencyConverter | None = CurrencyConverter.from_dictionaries(DictionaryCache(hh_api))
+    except ValueError as e:
+        print(e)
+        converter = None
+    # Вакансии, которые не удалось обработать, отправляются в карантин, а загрузка продолжается
+    quarantine = Quarantine()
+    store = VacancyStore()
+    for item in hh_api.iter_vacancies(keyword=keyword, pages=pages_number or None):
+        print(item, end="\n")
+        try:
+            record = validator.validate(item)
+            if converter is not None:
+                converter.normalize([record])
+            store.add(Vacancy(record))
+        except VACANCY_ERRORS as e:
+            quarantine.reject(item, e)
+    if len(quarantine):
+        print(f"В карантин ({quarantine.file_name}) отправлено вакансий: {len(quarantine)}, {quarantine.stats()}")
+
+    print("Выведем на экран список созданных объектов")
+    store.print_vacancies()
 
     # Запишем экземпляры класса Vacancy в json-объект
     print("Запишем экземпляры класса Vacancy в json-объект")
-    for vacancy in Vacancy.obj_vacancies_list:
+    for vacancy in store:
         json_saver.add_vacancy(vacancy)
 
     # Запишем в json-файл
@@ -312,17 +330,18 @@ def user_interaction() -> None:
 
     # Выведем на экран список ТОП вакансий отсортированных по заработной плате
     print(f"Отсортируем вакансии по заработной плате и выведем на экран ТОП-{top_n} вакансий")
-    Vacancy.sort_vacancies_by_keyword("salary_from", top_n)
+    salary_key = "salary_mid_base" if store.normalized else "salary_from"
+    Vacancy.print_vacancies_list(store.sort_by_keyword(salary_key), top_n)
     print()
 
     # Выведем на экран список вакансий отфильтрованных по ключевым словам
     print(f"Выведем на экран список вакансий отфильтрованных по словам {filter_words}")
-    Vacancy.filter_vacancies_by_keyword(filter_words)
+    Vacancy.print_vacancies_list(store.filter_by_keyword(filter_words))
     print()
 
     # Выведем на экран список вакансий отфильтрованный по диапазону зарплат
     print(f"Выведем на экран список вакансий отфильтрованных по диапазону зарплат {salary_range}")
-    Vacancy.filter_vacancies_by_salary_diapason(salary_range)
+    Vacancy.print_vacancies_list(store.filter_by_salary_diapason(salary_range))
     print()
 
 
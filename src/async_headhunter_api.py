@@ -0,0 +1,166 @@
+import asyncio
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+
+from src.headhunter_api import BASE_URL, HeadHunterAPI, count_pages
+from src.rate_limiter import TokenBucket
+from src.single_flight import AsyncSingleFlight
+
+
+class AsyncBaseAPI(ABC):
+    """Абстрактный класс для асинхронной работы с API сервиса с вакансиями"""
+
+    @abstractmethod
+    async def load_vacancies(self, keyword: str) -> list:
+        """Обязательный метод для получения списка вакансий.
+        @param keyword: Строковая переменная, содержащая ключевое слово, по которому осуществляется первичный отбор
+        вакансий.
+        @return: Список вакансий.
+        """
+        ...
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+class AsyncHeadHunterAPI(AsyncBaseAPI):
+    """
+    Класс для асинхронной работы с API HeadHunter.
+    Блокирующие запросы HeadHunterAPI выполняются в собственном пуле потоков, поэтому цикл событий не блокируется.
+    Количество одновременных запросов ограничивается семафором. Возвращаемые вакансии - те же словари, что и у
+    HeadHunterAPI, поэтому их можно передавать в Validator.validate и Vacancy.cast_to_object_list без изменений.
+    Экземпляр класса предназначен для работы внутри одного цикла событий.
+    """
+
+    def __init__(
+        self,
+        url: str = BASE_URL,
+        per_page: int = 1,
+        concurrency: int = 10,
+        rate_limiter: TokenBucket | None = None,
+        adaptive: bool = False,
+    ) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param url: URL-адрес для GET-запроса. По умолчанию "https://api.hh.ru/vacancies".
+        @param per_page: Количество вакансий на странице. По умолчанию - 1.
+        @param concurrency: Максимальное количество одновременных запросов к API. По умолчанию - 10.
+        @param rate_limiter: Ограничитель частоты запросов (см. HeadHunterAPI). По умолчанию - без ограничения.
+        @param adaptive: Адаптивный режим ограничения одновременных запросов (см. HeadHunterAPI).
+        """
+        self.__api = HeadHunterAPI(
+            url=url,
+            per_page=per_page,
+            max_workers=concurrency,
+            pool_size=concurrency,
+            rate_limiter=rate_limiter,
+            adaptive=adaptive,
+        )
+        self.__per_page = per_page
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        self.__executor = ThreadPoolExecutor(max_workers=concurrency)
+        self.__single_flight = AsyncSingleFlight()
+
+    async def __aenter__(self) -> "AsyncHeadHunterAPI":
+        """
+        Вход в асинхронный контекстный менеджер.
+        @return: Экземпляр класса.
+        """
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """
+        Выход из асинхронного контекстного менеджера: останавливает пул потоков.
+        @param args: Параметры исключения (не используются).
+        @return: None
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Останавливает пул потоков экземпляра класса.
+        @return: None
+        """
+        self.__executor.shutdown(wait=False)
+
+    async def get_page(self, keyword: str, page: int = 0) -> dict:
+        """
+        Метод для получения одной страницы выдачи. Одинаковые одновременные запросы выполняются один раз (ожидающие
+        задачи не занимают ни поток, ни место в семафоре), результат общий и изменять его нельзя.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param page: Номер страницы выдачи (нумерация с нуля).
+        @return: Страница выдачи в виде словаря. Пустой словарь, если запрос завершился ошибкой.
+        """
+        page_data: dict = await self.__single_flight.do((keyword, page), lambda: self.__fetch_page(keyword, page))
+        return page_data
+
+    async def __fetch_page(self, keyword: str, page: int) -> dict:
+        """
+        Метод выполняет запрос страницы выдачи в пуле потоков.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param page: Номер страницы выдачи (нумерация с нуля).
+        @return: Страница выдачи в виде словаря. Пустой словарь, если запрос завершился ошибкой.
+        """
+        async with self.__semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.__executor, self.__api.get_page, keyword, page)
+
+    async def iter_pages(self, keyword: str, pages: int | None = 1) -> AsyncIterator[list[dict]]:
+        """
+        Асинхронный итератор по страницам выдачи. После загрузки первой страницы запросы всех остальных страниц
+        запускаются сразу (до того, как первая страница отдана), а страницы отдаются по порядку по мере их
+        готовности.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param pages: Количество страниц выдачи для загрузки. None - все доступные страницы.
+        @return: Асинхронный итератор списков вакансий (по одному списку на страницу).
+        """
+        first_page = await self.get_page(keyword)
+        if not first_page:
+            return
+
+        pages_total = count_pages(first_page.get("pages", 1), self.__per_page, pages)
+        tasks = [asyncio.ensure_future(self.get_page(keyword, page)) for page in range(1, pages_total)]
+        try:
+            yield first_page.get("items", [])
+            for task in tasks:
+                page_data = await task
+                yield page_data.get("items", [])
+        finally:
+            # Если итерацию прервали, отменим оставшиеся запросы
+            for task in tasks:
+                task.cancel()
+
+    async def load_vacancies(self, keyword: str = "Python", pages: int | None = 1) -> list[dict]:
+        """
+        Метод для получения списка вакансий.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param pages: Количество страниц выдачи для загрузки. None - все доступные страницы.
+        @return: Список вакансий.
+        """
+        vacancies = []
+        async for items in self.iter_pages(keyword, pages):
+            vacancies.extend(items)
+
+        return vacancies
+
+    async def load_many(self, keywords: list[str], pages: int | None = 1) -> dict[str, list[dict]]:
+        """
+        Метод для параллельного получения вакансий по нескольким ключевым словам.
+        @param keywords: Список ключевых слов.
+        @param pages: Количество страниц выдачи для каждого ключевого слова. None - все доступные страницы.
+        @return: Словарь: ключевое слово - список вакансий.
+        """
+        results = await asyncio.gather(*(self.load_vacancies(keyword, pages) for keyword in keywords))
+
+        return dict(zip(keywords, results))
+
+
+if __name__ == "__main__":
+
+    async def main() -> None:
+        async with AsyncHeadHunterAPI(per_page=100, concurrency=10) as hh_api:
+            results = await hh_api.load_many(["Python", "Java", "Go"], pages=2)
+        for keyword, vacancies in results.items():
+            print(f"{keyword}: {len(vacancies)} вакансий")
+
+    asyncio.run(main())
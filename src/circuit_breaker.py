@@ -0,0 +1,151 @@
+import re
+import time
+
+from threading import Lock
+from urllib.parse import urlsplit
+
+
+class CircuitBreaker:
+    """
+    Предохранитель эндпоинта API. В замкнутом состоянии запросы выполняются. После failure_threshold ошибок подряд
+    предохранитель размыкается, и запросы сразу завершаются ошибкой без ожидания таймаута. Через reset_timeout секунд
+    предохранитель переходит в полуразомкнутое состояние и пропускает пробный запрос: если он успешен, предохранитель
+    замыкается, если нет - снова размыкается.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, half_open_max_calls: int = 1) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param failure_threshold: Количество ошибок подряд, после которого предохранитель размыкается.
+        По умолчанию - 5.
+        @param reset_timeout: Время в секундах, через которое разомкнутый предохранитель пропускает пробный запрос.
+        По умолчанию - 30.
+        @param half_open_max_calls: Количество одновременных пробных запросов. По умолчанию - 1.
+        """
+        self.__failure_threshold = failure_threshold
+        self.__reset_timeout = reset_timeout
+        self.__half_open_max_calls = half_open_max_calls
+        self.__state = self.CLOSED
+        self.__failures = 0
+        self.__opened_at = 0.0
+        self.__probes = 0
+        self.__lock = Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        Текущее состояние предохранителя.
+        @return: 'closed', 'open' или 'half_open'.
+        """
+        with self.__lock:
+            if self.__state == self.OPEN and time.monotonic() - self.__opened_at >= self.__reset_timeout:
+                return self.HALF_OPEN
+            return self.__state
+
+    def allow_request(self) -> bool:
+        """
+        Проверяет, можно ли выполнить запрос. В полуразомкнутом состоянии занимает место пробного запроса, которое
+        освобождается вызовом record_success, record_failure или release.
+        @return: True, если запрос можно выполнить.
+        """
+        with self.__lock:
+            if self.__state == self.CLOSED:
+                return True
+            if self.__state == self.OPEN:
+                if time.monotonic() - self.__opened_at < self.__reset_timeout:
+                    return False
+                self.__state = self.HALF_OPEN
+                self.__probes = 0
+            if self.__probes >= self.__half_open_max_calls:
+                return False
+            self.__probes += 1
+            return True
+
+    def record_success(self) -> None:
+        """
+        Сообщает об успешном запросе: предохранитель замыкается.
+        @return: None
+        """
+        with self.__lock:
+            self.__state = self.CLOSED
+            self.__failures = 0
+            self.__probes = 0
+
+    def release(self) -> None:
+        """
+        Сообщает о запросе, который не говорит о доступности эндпоинта (например, ответ 429): состояние предохранителя
+        и счётчик ошибок не меняются, освобождается только место пробного запроса.
+        @return: None
+        """
+        with self.__lock:
+            if self.__state == self.HALF_OPEN and self.__probes:
+                self.__probes -= 1
+
+    def record_failure(self) -> None:
+        """
+        Сообщает об ошибке запроса: после серии ошибок (или ошибки пробного запроса) предохранитель размыкается.
+        @return: None
+        """
+        with self.__lock:
+            self.__failures += 1
+            if self.__state == self.HALF_OPEN or self.__failures >= self.__failure_threshold:
+                self.__state = self.OPEN
+                self.__opened_at = time.monotonic()
+                self.__probes = 0
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+class CircuitBreakerRegistry:
+    """
+    Набор предохранителей: по одному на эндпоинт (хост и путь запроса, в котором числовые идентификаторы заменены на
+    '{id}', поэтому все запросы "/vacancies/{id}" относятся к одному эндпоинту).
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param failure_threshold: Количество ошибок подряд, после которого предохранитель размыкается.
+        По умолчанию - 5.
+        @param reset_timeout: Время в секундах до пробного запроса. По умолчанию - 30.
+        """
+        self.__failure_threshold = failure_threshold
+        self.__reset_timeout = reset_timeout
+        self.__breakers: dict[str, CircuitBreaker] = {}
+        self.__lock = Lock()
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        """
+        Определяет эндпоинт по URL-адресу.
+        @param url: URL-адрес запроса.
+        @return: Эндпоинт (например, "api.hh.ru/vacancies/{id}").
+        """
+        parts = urlsplit(url)
+        return parts.netloc + re.sub(r"/\d+(?=/|$)", "/{id}", parts.path.rstrip("/"))
+
+    def get(self, url: str) -> CircuitBreaker:
+        """
+        Возвращает предохранитель эндпоинта, создавая его при первом обращении.
+        @param url: URL-адрес запроса.
+        @return: Предохранитель эндпоинта.
+        """
+        endpoint = self.endpoint(url)
+        with self.__lock:
+            breaker = self.__breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(self.__failure_threshold, self.__reset_timeout)
+                self.__breakers[endpoint] = breaker
+            return breaker
+
+    def health(self) -> dict[str, str]:
+        """
+        Возвращает состояние предохранителей всех эндпоинтов.
+        @return: Словарь: эндпоинт - состояние предохранителя.
+        """
+        with self.__lock:
+            breakers = dict(self.__breakers)
+        return {endpoint: breaker.state for endpoint, breaker in breakers.items()}
@@ -0,0 +1,134 @@
+import json
+
+from src.dictionaries import DictionaryCache
+
+BASE_CURRENCY = "RUR"  # Код рубля в справочниках hh.ru
+
+
+class CurrencyConverter:
+    """
+    Класс для пересчёта зарплат вакансий в базовую валюту. Курсы задаются так же, как в справочнике валют hh.ru:
+    код валюты - сколько единиц валюты стоит один рубль. Пересчёт выполняется для всего списка вакансий за один
+    проход: множитель для каждой валюты вычисляется один раз, а в вакансии добавляются ключи 'salary_from_base',
+    'salary_to_base' и 'salary_mid_base', по которым можно сортировать и фильтровать вакансии в разных валютах.
+    Как и в остальных полях зарплаты, 0 означает, что значение неизвестно (зарплата не указана или валюты нет в
+    таблице курсов).
+    """
+
+    def __init__(self, rates: dict[str, float], base: str = BASE_CURRENCY) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param rates: Таблица курсов валют: код валюты - курс относительно рубля.
+        @param base: Код базовой валюты. По умолчанию - рубль ('RUR').
+        """
+        if not rates.get(base):
+            raise ValueError(f"Курс базовой валюты '{base}' не найден в таблице курсов!")
+
+        self.__base = base
+        self.__factors = {code: rates[base] / rate for code, rate in rates.items() if rate}
+        self.__unknown: dict[str, int] = {}
+
+    @classmethod
+    def from_dictionaries(cls, dictionaries: DictionaryCache, base: str = BASE_CURRENCY) -> "CurrencyConverter":
+        """
+        Создаёт экземпляр класса по справочнику валют hh.ru.
+        @param dictionaries: Справочники API HeadHunter.
+        @param base: Код базовой валюты. По умолчанию - рубль ('RUR').
+        @return: Экземпляр класса.
+        """
+        return cls(dictionaries.currency_rates, base)
+
+    @classmethod
+    def from_file(cls, file_name: str, base: str = BASE_CURRENCY) -> "CurrencyConverter":
+        """
+        Создаёт экземпляр класса по таблице курсов из json-файла (словарь: код валюты - курс относительно рубля).
+        @param file_name: Путь к файлу курсов.
+        @param base: Код базовой валюты. По умолчанию - рубль ('RUR').
+        @return: Экземпляр класса.
+        """
+        with open(file_name, "r", encoding="utf-8") as file:
+            return cls(json.load(file), base)
+
+    @property
+    def base(self) -> str:
+        """
+        Код базовой валюты.
+        @return: Код валюты.
+        """
+        return self.__base
+
+    def factor(self, code: str) -> float | None:
+        """
+        Возвращает множитель для пересчёта суммы в базовую валюту.
+        @param code: Код валюты.
+        @return: Множитель или None, если валюты нет в таблице курсов.
+        """
+        return self.__factors.get(code)
+
+    def convert(self, amount: int | float, code: str) -> float:
+        """
+        Пересчитывает сумму в базовую валюту.
+        @param amount: Сумма.
+        @param code: Код валюты суммы.
+        @return: Сумма в базовой валюте. 0, если сумма не указана или валюты нет в таблице курсов.
+        """
+        factor = self.__factors.get(code)
+        return amount * factor if amount and factor else 0.0
+
+    def normalize(self, vacancies: list[dict]) -> list[dict]:
+        """
+        Добавляет в вакансии зарплаты в базовой валюте: 'salary_from_base', 'salary_to_base' и 'salary_mid_base'.
+        Вакансии изменяются на месте.
+        @param vacancies: Вакансии, прошедшие валидацию.
+        @return: Те же вакансии.
+        """
+        factors = self.__factors
+        for vacancy in vacancies:
+            code = vacancy.get("currency_code") or vacancy.get("currency")
+            factor = factors.get(code, 0.0) if code else 0.0
+            if not factor and code:
+                self.__unknown[code] = self.__unknown.get(code, 0) + 1
+            salary_from = (vacancy.get("salary_from") or 0) * factor
+            salary_to = (vacancy.get("salary_to") or 0) * factor
+            vacancy["salary_from_base"] = salary_from
+            vacancy["salary_to_base"] = salary_to
+            vacancy["salary_mid_base"] = (
+                (salary_from + salary_to) / 2 if salary_from and salary_to else salary_from or salary_to
+            )
+
+        return vacancies
+
+    def normalize_columns(self, columns: dict[str, list]) -> dict[str, list]:
+        """
+        Добавляет столбцы зарплат в базовой валюте в результат Validator.validate_many(..., columns=True).
+        @param columns: Словарь столбцов вакансий.
+        @return: Тот же словарь столбцов.
+        """
+        factors = [self.__factors.get(code, 0.0) for code in columns["currency_code"]]
+        salaries_from = [(amount or 0) * factor for amount, factor in zip(columns["salary_from"], factors)]
+        salaries_to = [(amount or 0) * factor for amount, factor in zip(columns["salary_to"], factors)]
+        columns["salary_from_base"] = salaries_from
+        columns["salary_to_base"] = salaries_to
+        columns["salary_mid_base"] = [
+            (low + high) / 2 if low and high else low or high for low, high in zip(salaries_from, salaries_to)
+        ]
+
+        return columns
+
+    def unknown_currencies(self) -> dict[str, int]:
+        """
+        Возвращает валюты, которых не оказалось в таблице курсов, и количество вакансий с ними.
+        @return: Словарь: код валюты - количество вакансий.
+        """
+        return dict(self.__unknown)
+
+
+if __name__ == "__main__":
+    from src.headhunter_api import HeadHunterAPI
+    from src.vacancy import Validator
+
+    hh_api = HeadHunterAPI(per_page=100)
+    converter = CurrencyConverter.from_dictionaries(DictionaryCache(hh_api))
+    hh_vacancies = converter.normalize(Validator.validate_many(hh_api.load_vacancies("Python", pages=2)))
+    for hh_vacancy in sorted(hh_vacancies, key=lambda item: item["salary_mid_base"], reverse=True)[:10]:
+        print(hh_vacancy["name"], hh_vacancy["salary_mid_base"], converter.base)
@@ -0,0 +1,200 @@
+import json
+import os
+import time
+
+from urllib.parse import urlsplit
+
+from src.headhunter_api import HeadHunterAPI
+
+DICTIONARIES_VERSION = 1  # Версия формата файла справочников. При изменении формата файл загружается заново
+DICTIONARIES_KEYS = ("dictionaries", "areas", "professional_roles")  # Ответы API, из которых состоят справочники
+
+
+class DictionaryCache:
+    """
+    Класс справочников API HeadHunter: валюты и прочие справочники ("/dictionaries"), регионы ("/areas") и
+    профессиональные роли ("/professional_roles"). Справочники загружаются один раз и сохраняются на диск вместе с
+    версией формата и временем загрузки. Пока файл не устарел (ttl), справочники читаются с диска без обращения к API.
+    Для поиска по справочникам строятся таблицы (словари), поэтому каждый поиск выполняется за O(1).
+    """
+
+    def __init__(
+        self,
+        api: HeadHunterAPI | None = None,
+        file_name: str = "data/dictionaries.json",
+        ttl: float = 86400,
+        retry_interval: float = 300,
+    ) -> None:
+        """
+        Инициализатор экземпляра класса. Справочники загружаются при первом обращении к ним.
+        @param api: Экземпляр класса HeadHunterAPI, через который выполняются запросы. По умолчанию - новый
+        экземпляр для "https://api.hh.ru".
+        @param file_name: Путь к файлу справочников. По умолчанию - "data/dictionaries.json".
+        @param ttl: Время жизни файла справочников в секундах. По умолчанию - сутки.
+        @param retry_interval: Пауза в секундах перед повторной загрузкой справочников, если часть из них не
+        загрузилась. До её окончания поиск выполняется по уже загруженным таблицам без запросов к API. По умолчанию -
+        5 минут.
+        """
+        self.__api = api or HeadHunterAPI()
+        self.__file_name = os.path.abspath(file_name)
+        self.__ttl = ttl
+        self.__retry_interval = retry_interval
+        self.__loaded = False
+        self.__failed_at: float | None = None  # Время (time.monotonic) последней неудачной загрузки
+        self.__currency_rates: dict[str, float] = {}
+        self.__currency_names: dict[str, str] = {}
+        self.__area_paths: dict[str, tuple[str, ...]] = {}
+        self.__role_names: dict[str, str] = {}
+
+    def __read_file(self) -> dict | None:
+        """
+        Читает справочники с диска, если файл существует, имеет текущую версию формата и не устарел.
+        @return: Справочники или None, если их нужно загрузить из API.
+        """
+        try:
+            with open(self.__file_name, "r", encoding="utf-8") as file:
+                data: dict = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != DICTIONARIES_VERSION
+            or time.time() - data.get("fetched_at", 0) >= self.__ttl
+        ):
+            return None
+
+        return data
+
+    def __fetch(self) -> dict:
+        """
+        Загружает справочники из API и сохраняет их на диск.
+        @return: Справочники.
+        """
+        parts = urlsplit(self.__api.url)
+        base_url = f"{parts.scheme}://{parts.netloc}"
+        data = {
+            "version": DICTIONARIES_VERSION,
+            "fetched_at": time.time(),
+            "dictionaries": self.__api.get_json(f"{base_url}/dictionaries"),
+            "areas": self.__api.get_json(f"{base_url}/areas"),
+            "professional_roles": self.__api.get_json(f"{base_url}/professional_roles"),
+        }
+        # Пустой ответ означает ошибку запроса: такие справочники на диск не сохраняем
+        if all(data[key] for key in DICTIONARIES_KEYS):
+            os.makedirs(os.path.dirname(self.__file_name), exist_ok=True)
+            tmp_name = f"{self.__file_name}.tmp"
+            with open(tmp_name, "w", encoding="utf-8") as file:
+                json.dump(data, file, ensure_ascii=False)
+            os.replace(tmp_name, self.__file_name)
+
+        return data
+
+    def load(self, force: bool = False) -> None:
+        """
+        Загружает справочники (с диска или из API) и строит таблицы для поиска. Таблицы строятся только по
+        загруженным справочникам: если запрос одного из них завершился ошибкой, то его прежняя таблица сохраняется, а
+        загрузка повторяется при обращении к справочникам не раньше, чем через retry_interval секунд.
+        @param force: Загрузить справочники из API, даже если файл на диске не устарел.
+        @return: None
+        """
+        data = None if force else self.__read_file()
+        if data is None:
+            data = self.__fetch()
+
+        if data["dictionaries"]:
+            self.__currency_rates = {}
+            self.__currency_names = {}
+            for currency in data["dictionaries"].get("currency", []):
+                self.__currency_rates[currency["code"]] = currency["rate"]
+                self.__currency_names[currency["code"]] = currency["name"]
+
+        if data["areas"]:
+            self.__area_paths = {}
+            stack: list[tuple[dict, tuple[str, ...]]] = [(area, ()) for area in data["areas"]]
+            while stack:
+                area, parent_path = stack.pop()
+                path = parent_path + (area["name"],)
+                self.__area_paths[area["id"]] = path
+                stack.extend((child, path) for child in area.get("areas", []))
+
+        if data["professional_roles"]:
+            self.__role_names = {
+                role["id"]: role["name"]
+                for category in data["professional_roles"].get("categories", [])
+                for role in category.get("roles", [])
+            }
+
+        self.__loaded = all(data[key] for key in DICTIONARIES_KEYS)
+        self.__failed_at = None if self.__loaded else time.monotonic()
+
+    def __ensure_loaded(self) -> None:
+        """
+        Загружает справочники, если они ещё не загружены, а после неудачной загрузки - если прошло retry_interval
+        секунд, поэтому поиск в цикле не выполняет запросов к API при каждом обращении.
+        @return: None
+        """
+        if self.__loaded:
+            return
+        if self.__failed_at is not None and time.monotonic() - self.__failed_at < self.__retry_interval:
+            return
+        self.load()
+
+    @property
+    def currency_rates(self) -> dict[str, float]:
+        """
+        Таблица курсов валют: код валюты (например, 'USD') - курс относительно рубля (сколько единиц валюты в рубле).
+        @return: Словарь курсов валют.
+        """
+        self.__ensure_loaded()
+        return self.__currency_rates
+
+    @property
+    def area_paths(self) -> dict[str, tuple[str, ...]]:
+        """
+        Таблица регионов: идентификатор региона - путь от страны до региона (например, ('Россия', 'Москва')).
+        @return: Словарь путей регионов.
+        """
+        self.__ensure_loaded()
+        return self.__area_paths
+
+    def currency_rate(self, code: str) -> float | None:
+        """
+        Возвращает курс валюты.
+        @param code: Код валюты.
+        @return: Курс валюты или None, если валюта не найдена.
+        """
+        return self.currency_rates.get(code)
+
+    def currency_name(self, code: str) -> str | None:
+        """
+        Возвращает название валюты.
+        @param code: Код валюты.
+        @return: Название валюты или None, если валюта не найдена.
+        """
+        self.__ensure_loaded()
+        return self.__currency_names.get(code)
+
+    def area_path(self, area_id: str) -> tuple[str, ...]:
+        """
+        Возвращает путь региона от страны.
+        @param area_id: Идентификатор региона.
+        @return: Путь региона или пустой кортеж, если регион не найден.
+        """
+        return self.area_paths.get(area_id, ())
+
+    def role_name(self, role_id: str) -> str | None:
+        """
+        Возвращает название профессиональной роли.
+        @param role_id: Идентификатор профессиональной роли.
+        @return: Название роли или None, если роль не найдена.
+        """
+        self.__ensure_loaded()
+        return self.__role_names.get(role_id)
+
+
+if __name__ == "__main__":
+    dictionaries = DictionaryCache()
+    print("Курсы валют:", dictionaries.currency_rates)
+    print("Регион 26:", " / ".join(dictionaries.area_path("26")))
+    print("Роль 96:", dictionaries.role_name("96"))
@@ -0,0 +1,98 @@
+from collections.abc import Iterable
+from urllib.parse import urlsplit
+
+from src.headhunter_api import HeadHunterAPI
+from src.id_cache_fetcher import IdCacheFetcher
+
+
+def employer_summary(employer: dict) -> dict:
+    """
+    Выбирает из описания работодателя ("/employers/{id}") поля, которые нужны для отчётов.
+    @param employer: Полное описание работодателя.
+    @return: Словарь с ключами 'id', 'name', 'type', 'industries', 'area', 'open_vacancies', 'trusted',
+    'accredited_it_employer'.
+    """
+    return {
+        "id": employer.get("id"),
+        "name": employer.get("name"),
+        "type": employer.get("type"),
+        "industries": [industry["name"] for industry in employer.get("industries") or []],
+        "area": (employer.get("area") or {}).get("name"),
+        "open_vacancies": employer.get("open_vacancies"),
+        "trusted": employer.get("trusted"),
+        "accredited_it_employer": employer.get("accredited_it_employer"),
+    }
+
+
+class EmployerEnricher:
+    """
+    Класс для дополнения вакансий сведениями о работодателях. Из вакансий выбираются уникальные идентификаторы
+    работодателей (тысячи вакансий обычно относятся к нескольким сотням работодателей), каждый работодатель
+    загружается по адресу "/employers/{id}" один раз параллельно пулом потоков и сохраняется на диск (см.
+    IdCacheFetcher). Пока запись на диске не устарела (ttl), работодатель берётся с диска без запроса к API.
+    """
+
+    def __init__(
+        self,
+        api: HeadHunterAPI,
+        cache_dir: str = "data/employers",
+        ttl: float = 7 * 86400,
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param api: Экземпляр класса HeadHunterAPI, через который выполняются запросы.
+        @param cache_dir: Каталог для хранения сведений о работодателях. По умолчанию - "data/employers".
+        @param ttl: Время жизни записи о работодателе в секундах. По умолчанию - неделя.
+        @param max_workers: Количество потоков для загрузки работодателей. По умолчанию - 8.
+        """
+        parts = urlsplit(api.url)
+        base_url = f"{parts.scheme}://{parts.netloc}/employers"
+        self.__fetcher = IdCacheFetcher(
+            api.get_json,
+            lambda employer_id: f"{base_url}/{employer_id}",
+            cache_dir,
+            ttl=ttl,
+            transform=employer_summary,
+            max_workers=max_workers,
+        )
+
+    def fetch(self, employer_ids: Iterable[str]) -> dict[str, dict]:
+        """
+        Возвращает сведения о работодателях. Каждый идентификатор загружается не больше одного раза.
+        @param employer_ids: Идентификаторы работодателей (могут повторяться).
+        @return: Словарь: идентификатор работодателя - сведения о работодателе.
+        """
+        return self.__fetcher.fetch(dict.fromkeys(employer_ids))
+
+    def enrich(self, vacancies: list[dict]) -> list[dict]:
+        """
+        Дополняет вакансии сведениями о работодателях (ключ 'employer'). Вакансии изменяются на месте.
+        @param vacancies: Вакансии, прошедшие валидацию (с ключом 'employer_id').
+        @return: Те же вакансии.
+        """
+        employers = self.fetch(vacancy["employer_id"] for vacancy in vacancies if vacancy.get("employer_id"))
+        for vacancy in vacancies:
+            employer_id = vacancy.get("employer_id")
+            vacancy["employer"] = employers.get(employer_id) if employer_id else None
+
+        return vacancies
+
+    def stats(self) -> dict:
+        """
+        Возвращает счётчики работы: 'fetched' - загружено из API, 'cached' - взято с диска, 'failed' - ошибки.
+        @return: Словарь счётчиков.
+        """
+        return self.__fetcher.stats()
+
+
+if __name__ == "__main__":
+    from src.vacancy import Validator
+
+    hh_api = HeadHunterAPI(per_page=100)
+    enricher = EmployerEnricher(hh_api, max_workers=8)
+
+    hh_vacancies = [Validator.validate(item) for item in hh_api.load_vacancies("Python", pages=5)]
+    for hh_vacancy in enricher.enrich(hh_vacancies)[:10]:
+        print(hh_vacancy["name"], "-", hh_vacancy["employer"])
+    print(f"Вакансий: {len(hh_vacancies)}, {enricher.stats()}")
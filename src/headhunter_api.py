@@ -1,8 +1,41 @@
+import json
+import time
+
 import requests
 
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, cast
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+
+from src.circuit_breaker import CircuitBreakerRegistry
+from src.rate_limiter import RETRY_STATUSES, THROTTLE_STATUSES, AdaptiveConcurrency, TokenBucket, backoff_delay
+from src.response_cache import ResponseCache
+from src.single_flight import SingleFlight
+from src.sync_state import SyncState
 
 BASE_URL = "https://api.hh.ru/vacancies"
+MAX_DEPTH = 2000  # Глубина выдачи: API не отдаёт больше 2000 вакансий на один поисковый запрос
+
+
+def count_pages(found_pages: int, per_page: int, pages: int | None) -> int:
+    """
+    Функция определяет количество страниц, которые нужно загрузить, с учётом ограничения глубины выдачи API.
+    @param found_pages: Количество страниц, которое вернул API для запроса.
+    @param per_page: Количество вакансий на странице.
+    @param pages: Количество страниц, запрошенное пользователем. None - все доступные страницы.
+    @return: Количество страниц для загрузки.
+    """
+    pages_limit = min(found_pages, max(MAX_DEPTH // per_page, 1))
+    if pages is not None:
+        pages_limit = min(pages_limit, pages)
+
+    return pages_limit
 
 
 class BaseAPI(ABC):
@@ -22,7 +55,28 @@ class BaseAPI(ABC):
 class HeadHunterAPI(BaseAPI):
     """Класс для работы с API HeadHunter."""
 
-    def __init__(self, url: str = BASE_URL, per_page: int = 1) -> None:
+    # Пул сессий с keep-alive соединениями, общий для всех экземпляров класса. Ключ - (хост, размер пула).
+    __sessions: dict[tuple[str, int], requests.Session] = {}
+    __sessions_lock = Lock()
+    # Одинаковые одновременные запросы (URL-адрес и параметры) всех экземпляров класса выполняются один раз
+    __single_flight = SingleFlight()
+    # Предохранители эндпоинтов по умолчанию, общие для всех экземпляров класса
+    __default_breakers = CircuitBreakerRegistry()
+
+    def __init__(
+        self,
+        url: str = BASE_URL,
+        per_page: int = 1,
+        max_workers: int = 4,
+        pool_size: int = 10,
+        rate_limiter: TokenBucket | None = None,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        adaptive: bool = False,
+        cache: ResponseCache | None = None,
+        timeout: tuple[float, float] = (3.05, 10.0),
+        breakers: CircuitBreakerRegistry | None = None,
+    ) -> None:
         """
         Инициализатор экземпляра класса.
         @param url: URL-адрес для GET-запроса. По умолчанию "https://api.hh.ru/vacancies" - все сайты группы компаний.
@@ -30,54 +84,371 @@ class HeadHunterAPI(BaseAPI):
         на сайте компании).
         @param per_page: Количество вакансий на странице. По умолчанию - 1 (Подробнее в документации на сайте
         компании).
+        @param max_workers: Количество потоков для параллельной загрузки страниц выдачи. По умолчанию - 4.
+        @param pool_size: Максимальное количество keep-alive соединений с хостом. По умолчанию - 10. Экземпляры класса
+        с одинаковым хостом и размером пула используют одну и ту же сессию.
+        @param rate_limiter: Ограничитель частоты запросов. Один ограничитель можно передать нескольким экземплярам
+        класса. По умолчанию - без ограничения.
+        @param max_retries: Количество повторов запроса при ответах 429/5xx и сетевых ошибках. По умолчанию - 3.
+        @param backoff: Базовая задержка (в секундах) экспоненциальной паузы между повторами. По умолчанию - 0.5.
+        Если API вернул заголовок Retry-After, то пауза берётся из него.
+        @param adaptive: Адаптивный режим: количество одновременных запросов (не больше max_workers) уменьшается при
+        ответах 429/503 и увеличивается, когда API отвечает без ошибок. По умолчанию - выключен.
+        @param cache: Дисковый кэш ответов API. Устаревшие записи проверяются условными запросами
+        (If-None-Match/If-Modified-Since). По умолчанию - без кэша.
+        @param timeout: Таймауты запроса в секундах: (подключение, чтение ответа). По умолчанию - (3.05, 10).
+        @param breakers: Предохранители эндпоинтов. После серии ошибок эндпоинта запросы к нему сразу завершаются
+        ошибкой, пока пробный запрос не пройдёт успешно. По умолчанию - общие предохранители всех экземпляров класса.
         """
         self.__url = url
         self.__headers = {"User-Agent": "HH-User-Agent"}
         self.__params = {"text": "", "page": 0, "per_page": per_page, "only_with_salary": True}
         self.__vacancies: list = []
+        self.__per_page = per_page
+        self.__max_workers = max_workers
+        self.__session = self.__get_session(url, pool_size)
+        self.__rate_limiter = rate_limiter
+        self.__max_retries = max_retries
+        self.__backoff = backoff
+        self.__concurrency = AdaptiveConcurrency(max_workers, adaptive=adaptive)
+        self.__cache = cache
+        self.__timeout = timeout
+        self.__breakers = breakers or self.__default_breakers
+
+    @classmethod
+    def __get_session(cls, url: str, pool_size: int) -> requests.Session:
+        """
+        Метод возвращает общую сессию для хоста из URL-адреса. Если сессии ещё нет, то создаёт её.
+        @param url: URL-адрес для GET-запроса.
+        @param pool_size: Максимальное количество keep-alive соединений с хостом.
+        @return: Сессия requests с пулом соединений.
+        """
+        key = (urlsplit(url).netloc, pool_size)
+        with cls.__sessions_lock:
+            session = cls.__sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls.__sessions[key] = session
+
+        return session
 
-    def __connect_to_api(self) -> requests.models.Response | None:
+    def __connect_to_api(
+        self, params: dict, headers: dict | None = None, url: str | None = None
+    ) -> requests.models.Response | None:
         """
-        Метод для подключения к API и проверки статус-кода.
-        @return:
+        Метод для выполнения запроса к API и проверки статус-кода. При ответах 429/5xx и сетевых ошибках запрос
+        повторяется с экспоненциальной паузой (или паузой из заголовка Retry-After).
+        @param params: Параметры GET-запроса.
+        @param headers: Дополнительные заголовки запроса.
+        @param url: URL-адрес запроса. По умолчанию - URL-адрес поиска вакансий экземпляра класса.
+        @return: Ответ API или None, если запрос завершился ошибкой.
         """
-        try:
-            response = requests.get(self.__url)
-            response.raise_for_status()
+        url = url or self.__url
+        headers = {**self.__headers, **(headers or {})}
+        breaker = self.__breakers.get(url)
+        error: Exception | None = None
+        retry_after: str | None = None
+        for attempt in range(self.__max_retries + 1):
+            if attempt:
+                time.sleep(backoff_delay(attempt - 1, self.__backoff, retry_after))
+            retry_after = None
+
+            # Пока предохранитель эндпоинта разомкнут, запрос сразу завершается ошибкой
+            if not breaker.allow_request():
+                print(f"Эндпоинт {CircuitBreakerRegistry.endpoint(url)} недоступен, запрос не выполнен")
+                return None
+
+            if self.__rate_limiter is not None:
+                self.__rate_limiter.acquire()
+            try:
+                with self.__concurrency:
+                    response = self.__session.get(url, headers=headers, params=params, timeout=self.__timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                breaker.record_failure()
+                error = e
+                continue
+            except requests.exceptions.RequestException as e:
+                breaker.record_failure()
+                print(e)
+                return None
+
+            if response.status_code in RETRY_STATUSES:
+                # 429 - API ограничивает запросы и ничего не говорит о доступности эндпоинта: пробный запрос
+                # полуразомкнутого предохранителя не должен его замыкать; 5xx - ошибка на стороне API
+                if response.status_code == 429:
+                    breaker.release()
+                else:
+                    breaker.record_failure()
+                if response.status_code in THROTTLE_STATUSES:
+                    self.__concurrency.on_throttle()
+                error = requests.exceptions.HTTPError(f"{response.status_code} Error for url: {response.url}")
+                retry_after = response.headers.get("Retry-After")
+                continue
+
+            breaker.record_success()
+            try:
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                print(e)
+                return None
+            self.__concurrency.on_success()
+
             return response
-        except requests.exceptions.RequestException as e:
-            print(e)
-            return None
 
-    def load_vacancies(self, keyword: str = "Python") -> list[dict]:
+        print(error)
+        return None
+
+    @property
+    def url(self) -> str:
+        """
+        URL-адрес поиска вакансий экземпляра класса.
+        @return: URL-адрес.
+        """
+        return self.__url
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Сессия requests, через которую выполняются запросы (общая для экземпляров класса с тем же хостом и размером
+        пула соединений).
+        @return: Сессия requests.
+        """
+        return self.__session
+
+    def get_json(self, url: str, params: dict | None = None) -> Any:
+        """
+        Метод для получения произвольного ресурса API (например, "https://api.hh.ru/vacancies/93353083") через
+        сессию, ограничители и повторы экземпляра класса. Одинаковые одновременные запросы выполняются один раз.
+        @param url: URL-адрес ресурса.
+        @param params: Параметры GET-запроса.
+        @return: Ответ API (словарь или список, например, для "/areas"). Пустой словарь, если запрос завершился
+        ошибкой.
+        """
+        params = params or {}
+        return self.__single_flight.do(self.__request_key(url, params), lambda: self.__fetch_json(url, params))
+
+    def __fetch_json(self, url: str, params: dict) -> Any:
+        """
+        Метод выполняет запрос к API и разбирает ответ.
+        @param url: URL-адрес ресурса.
+        @param params: Параметры GET-запроса.
+        @return: Ответ API. Пустой словарь, если запрос завершился ошибкой.
+        """
+        response = self.__connect_to_api(params, url=url)
+        if response is None:
+            return {}
+
+        return response.json()
+
+    @staticmethod
+    def __request_key(url: str, params: dict) -> tuple:
+        """
+        Метод формирует ключ запроса для объединения одинаковых одновременных запросов.
+        @param url: URL-адрес запроса.
+        @param params: Параметры GET-запроса.
+        @return: Ключ запроса.
         """
-        Метод для получения списка вакансий.
+        return url, tuple(sorted((key, str(value)) for key, value in params.items()))
+
+    def get_page(self, keyword: str, page: int = 0, filters: dict | None = None) -> dict:
+        """
+        Метод для получения одной страницы выдачи. Если такая же страница уже запрашивается в другом потоке (любым
+        экземпляром класса), то повторный запрос не выполняется, а используется общий результат. Результат нельзя
+        изменять.
         @param keyword: Строковая переменная, содержащая ключевое слово, по которому осуществляется первичный отбор
         вакансий.
-        @return: Список вакансий.
+        @param page: Номер страницы выдачи (нумерация с нуля).
+        @param filters: Дополнительные параметры поиска (например, 'area', 'date_from', 'date_to').
+        @return: Страница выдачи в виде словаря с ключами 'items', 'found', 'pages' и др. Пустой словарь, если
+        запрос завершился ошибкой.
+        """
+        params = {**self.__params, **(filters or {}), "text": keyword, "page": page}
+        return cast(
+            dict, self.__single_flight.do(self.__request_key(self.__url, params), lambda: self.__fetch_page(params))
+        )
+
+    def __fetch_page(self, params: dict) -> dict:
+        """
+        Метод выполняет запрос страницы выдачи (через кэш, если он задан).
+        @param params: Параметры GET-запроса.
+        @return: Страница выдачи. Пустой словарь, если запрос завершился ошибкой.
         """
-        response = self.__connect_to_api()
+        if self.__cache is not None:
+            return self.__get_cached(self.__cache, params)
+
+        response = self.__connect_to_api(params)
+        if response is None:
+            return {}
+
+        return cast(dict, response.json())
+
+    def __get_cached(self, cache: ResponseCache, params: dict) -> dict:
+        """
+        Метод для получения ответа API через кэш. Свежая запись отдаётся без запроса, устаревшая проверяется условным
+        запросом: при ответе 304 используется тело из кэша.
+        @param cache: Дисковый кэш ответов API.
+        @param params: Параметры GET-запроса.
+        @return: Ответ API в виде словаря. Пустой словарь, если запрос завершился ошибкой.
+        """
+        entry = cache.get(self.__url, params)
+        if entry is not None and cache.is_fresh(entry):
+            cache.record("hits")
+            return cast(dict, json.loads(entry["body"]))
+
+        headers: dict = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.__connect_to_api(params, headers)
         if response is None:
-            return []
+            return {}
+
+        if entry is not None and response.status_code == 304:
+            cache.record("revalidations")
+            cache.refresh(self.__url, params, entry)
+            return cast(dict, json.loads(entry["body"]))
+
+        cache.record("misses")
+        cache.put(
+            self.__url, params, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
 
+        return cast(dict, response.json())
+
+    def iter_pages(
+        self,
+        keyword: str = "Python",
+        pages: int | None = 1,
+        filters: dict | None = None,
+        first_page: dict | None = None,
+    ) -> Iterator[dict]:
+        """
+        Генератор страниц выдачи: отдаёт страницы по порядку по мере загрузки. Следующие страницы загружаются
+        параллельно пулом потоков, но одновременно загружается (и хранится в памяти) не больше max_workers страниц.
+        Страница, запрос которой завершился ошибкой, отдаётся пустым словарём; если ошибкой завершился запрос первой
+        страницы, то генератор ничего не отдаёт.
+        @param keyword: Строковая переменная, содержащая ключевое слово, по которому осуществляется первичный отбор
+        вакансий.
+        @param pages: Количество страниц выдачи для загрузки. По умолчанию - 1. None - все страницы, которые отдаёт
+        API (но не глубже MAX_DEPTH вакансий).
+        @param filters: Дополнительные параметры поиска (например, 'area', 'date_from', 'date_to').
+        @param first_page: Уже загруженная первая страница выдачи (например, при подсчёте найденных вакансий, см.
+        QuerySharder). По умолчанию - загружается.
+        @return: Итератор страниц выдачи.
+        """
         self.__params["text"] = keyword
-        response = requests.get(self.__url, headers=self.__headers, params=self.__params)
-        vacancies = response.json()
-        self.__vacancies = vacancies.get("items", [])
+        if first_page is None:
+            first_page = self.get_page(keyword, 0, filters)
+        if not first_page:
+            return
+
+        pages_total = count_pages(first_page.get("pages", 1), self.__per_page, pages)
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            pending: deque[Future] = deque()
+            next_page = 1
+            try:
+                while next_page < pages_total and len(pending) < self.__max_workers:
+                    pending.append(executor.submit(self.get_page, keyword, next_page, filters))
+                    next_page += 1
+                yield first_page
+                del first_page
+
+                while pending:
+                    page_data = pending.popleft().result()
+                    if next_page < pages_total:
+                        pending.append(executor.submit(self.get_page, keyword, next_page, filters))
+                        next_page += 1
+                    yield page_data
+            finally:
+                # Если итерацию прервали, не будем загружать страницы, запросы которых ещё не начались
+                for future in pending:
+                    future.cancel()
+
+    def iter_vacancies(
+        self, keyword: str = "Python", pages: int | None = 1, filters: dict | None = None
+    ) -> Generator[dict, None, None]:
+        """
+        Генератор вакансий: отдаёт вакансии постранично по мере загрузки страниц (см. iter_pages), поэтому обработка
+        вакансий идёт параллельно с загрузкой, а расход памяти не зависит от размера выдачи.
+        @param keyword: Строковая переменная, содержащая ключевое слово, по которому осуществляется первичный отбор
+        вакансий.
+        @param pages: Количество страниц выдачи для загрузки. По умолчанию - 1. None - все страницы, которые отдаёт
+        API (но не глубже MAX_DEPTH вакансий).
+        @param filters: Дополнительные параметры поиска (например, 'area', 'date_from', 'date_to').
+        @return: Генератор вакансий в порядке страниц выдачи.
+        """
+        for page_data in self.iter_pages(keyword, pages, filters):
+            yield from page_data.get("items", [])
+
+    def load_vacancies(
+        self, keyword: str = "Python", pages: int | None = 1, filters: dict | None = None
+    ) -> list[dict]:
+        """
+        Метод для получения списка вакансий. Первая страница загружается сразу, остальные страницы загружаются
+        параллельно пулом потоков и объединяются в порядке следования страниц.
+        @param keyword: Строковая переменная, содержащая ключевое слово, по которому осуществляется первичный отбор
+        вакансий.
+        @param pages: Количество страниц выдачи для загрузки. По умолчанию - 1. None - все страницы, которые отдаёт
+        API (но не глубже MAX_DEPTH вакансий).
+        @param filters: Дополнительные параметры поиска (например, 'area', 'date_from', 'date_to').
+        @return: Список вакансий.
+        """
+        self.__vacancies = list(self.iter_vacancies(keyword, pages, filters))
 
         return self.__vacancies
 
+    def load_new_vacancies(
+        self, keyword: str, state: SyncState, pages: int | None = None, filters: dict | None = None
+    ) -> list[dict]:
+        """
+        Метод для инкрементальной загрузки: запрашивает только вакансии, опубликованные начиная с отметки прошлой
+        загрузки по этому запросу (параметр 'date_from'), и сдвигает отметку, если загружены все страницы выдачи
+        (иначе при следующей загрузке вакансии запрашиваются от прежней отметки). При первом запуске загружаются все
+        вакансии. Новые вакансии можно объединить с ранее сохранёнными функцией merge_vacancies модуля sync_state.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param state: Состояние инкрементальной загрузки (отметки запросов).
+        @param pages: Количество страниц выдачи для загрузки. По умолчанию - все страницы.
+        @param filters: Дополнительные параметры поиска.
+        @return: Список вакансий, которые не были загружены ранее.
+        """
+        key = state.make_key(keyword, filters)
+        mark = state.get(key)
+        query_filters = dict(filters or {})
+        if mark is not None:
+            query_filters["date_from"] = mark["published_at"]
+
+        pages_data = list(self.iter_pages(keyword, pages, query_filters))
+        vacancies = [
+            vacancy for page_data in pages_data for vacancy in page_data.get("items", []) if state.is_new(key, vacancy)
+        ]
+
+        # Отметку сдвигаем, только если загружены все страницы выдачи: иначе вакансии с незагруженных страниц (из-за
+        # ошибки запроса, ограничения глубины выдачи MAX_DEPTH или параметра pages) не попали бы в следующую загрузку
+        found_pages = pages_data[0].get("pages", 1) if pages_data else None
+        if found_pages is not None and all(pages_data) and len(pages_data) >= found_pages:
+            state.update(key, vacancies)
+        else:
+            print(f"Загружены не все страницы выдачи по запросу '{keyword}', отметка загрузки не сдвинута")
+
+        return vacancies
+
 
 if __name__ == "__main__":
     # Создание экземпляра класса для работы с API сайтов с вакансиями
     print("Получим сырые данные из API")
-    hh_api = HeadHunterAPI(url=BASE_URL, per_page=100)
+    hh_api = HeadHunterAPI(url=BASE_URL, per_page=100, max_workers=4)
 
     # Получение вакансий с hh.ru в формате JSON
     # -----------------------------------------------------------------------------------------------------------------
     # Аргумент keyword определяет слово, по которому будет осуществлён поиск.
-    # Аргумент pages определяет количество страниц, в которых будет осуществлён поиск.
+    # Аргумент pages определяет количество страниц, в которых будет осуществлён поиск (None - все страницы).
     # -----------------------------------------------------------------------------------------------------------------
-    hh_vacancies = hh_api.load_vacancies(keyword="Python")
+    hh_vacancies = hh_api.load_vacancies(keyword="Python", pages=3)
     for vacancy in hh_vacancies:
         print(vacancy, end="\n")
@@ -0,0 +1,141 @@
+import json
+import os
+import re
+import time
+
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any
+
+# Идентификаторы вакансий и работодателей hh.ru - числа. Идентификаторы приходят из ответов API и становятся именами
+# файлов, поэтому всё остальное (например, "../x") отбрасывается.
+ID_PATTERN = re.compile(r"[0-9]+")
+
+
+class IdCacheFetcher:
+    """
+    Класс для загрузки ресурсов API по идентификатору (например, "/vacancies/{id}" или "/employers/{id}") с кэшем на
+    диске по одному файлу на идентификатор. Повторяющиеся идентификаторы загружаются один раз, остальные -
+    параллельно пулом потоков. Запись на диске используется без запроса к API, пока совпадает её версия (например,
+    дата публикации вакансии) и она не устарела (ttl).
+    """
+
+    def __init__(
+        self,
+        get_json: Callable[[str], Any],
+        make_url: Callable[[str], str],
+        cache_dir: str,
+        ttl: float | None = None,
+        transform: Callable[[dict], dict] | None = None,
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param get_json: Функция запроса к API по URL-адресу (например, метод get_json класса HeadHunterAPI). Должна
+        возвращать пустой словарь, если запрос завершился ошибкой.
+        @param make_url: Функция, которая возвращает URL-адрес ресурса по идентификатору.
+        @param cache_dir: Каталог для хранения ресурсов.
+        @param ttl: Время жизни записи в секундах. По умолчанию - без ограничения.
+        @param transform: Функция, которая выбирает из ответа API сохраняемые поля. По умолчанию - ответ целиком.
+        @param max_workers: Количество потоков для загрузки. По умолчанию - 8.
+        """
+        self.__get_json = get_json
+        self.__make_url = make_url
+        self.__cache_dir = os.path.abspath(cache_dir)
+        self.__ttl = ttl
+        self.__transform = transform
+        self.__max_workers = max_workers
+        self.__lock = Lock()
+        self.__counters = {"fetched": 0, "cached": 0, "failed": 0}
+        os.makedirs(self.__cache_dir, exist_ok=True)
+
+    def __path(self, resource_id: str) -> str:
+        """
+        Возвращает путь к файлу ресурса.
+        @param resource_id: Идентификатор ресурса (проверенный по ID_PATTERN).
+        @return: Путь к файлу.
+        """
+        return os.path.join(self.__cache_dir, f"{resource_id}.json")
+
+    def __read_cached(self, resource_id: str, version: Hashable) -> dict | None:
+        """
+        Читает ресурс с диска, если запись сохранена для той же версии и не устарела.
+        @param resource_id: Идентификатор ресурса.
+        @param version: Версия ресурса.
+        @return: Ресурс или None, если его нужно загрузить (в том числе, если файл повреждён).
+        """
+        try:
+            with open(self.__path(resource_id), "r", encoding="utf-8") as file:
+                entry = json.load(file)
+            if entry["version"] != version:
+                return None
+            if self.__ttl is not None and time.time() - entry["fetched_at"] >= self.__ttl:
+                return None
+            data: dict = entry["data"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        return data
+
+    def __fetch_one(self, resource_id: str, version: Hashable) -> dict:
+        """
+        Загружает один ресурс из API и сохраняет его на диск.
+        @param resource_id: Идентификатор ресурса.
+        @param version: Версия ресурса.
+        @return: Ресурс. Пустой словарь, если запрос завершился ошибкой.
+        """
+        response = self.__get_json(self.__make_url(resource_id))
+        with self.__lock:
+            self.__counters["fetched" if response else "failed"] += 1
+        if not response:
+            return {}
+
+        data = self.__transform(response) if self.__transform is not None else response
+        tmp_path = f"{self.__path(resource_id)}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"version": version, "fetched_at": time.time(), "data": data}, file, ensure_ascii=False)
+        os.replace(tmp_path, self.__path(resource_id))
+
+        return data
+
+    def fetch(self, versions: dict[str, Hashable]) -> dict[str, dict]:
+        """
+        Возвращает ресурсы по идентификаторам: ресурсы с действующей записью на диске берутся с диска, остальные
+        загружаются параллельно. Идентификаторы, которые не соответствуют ID_PATTERN, не загружаются и учитываются
+        как ошибки.
+        @param versions: Словарь: идентификатор ресурса - версия ресурса (None, если версия не отслеживается).
+        @return: Словарь: идентификатор ресурса - ресурс.
+        """
+        result = {}
+        to_fetch = {}
+        invalid = 0
+        for resource_id, version in versions.items():
+            if not isinstance(resource_id, str) or not ID_PATTERN.fullmatch(resource_id):
+                invalid += 1
+                continue
+            cached = self.__read_cached(resource_id, version)
+            if cached is None:
+                to_fetch[resource_id] = version
+            else:
+                result[resource_id] = cached
+        with self.__lock:
+            self.__counters["cached"] += len(result)
+            self.__counters["failed"] += invalid
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            fetched = executor.map(lambda item: self.__fetch_one(*item), to_fetch.items())
+            for resource_id, data in zip(to_fetch, fetched):
+                if data:
+                    result[resource_id] = data
+
+        return result
+
+    def stats(self) -> dict:
+        """
+        Возвращает счётчики работы: 'fetched' - загружено из API, 'cached' - взято с диска, 'failed' - ошибки (в том
+        числе недопустимые идентификаторы).
+        @return: Словарь счётчиков.
+        """
+        with self.__lock:
+            return dict(self.__counters)
@@ -0,0 +1,318 @@
+import random
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from heapq import merge
+from operator import itemgetter
+
+from src.sorted_lists import remove_many
+from src.vacancy import Vacancy
+
+INFINITY = float("inf")
+
+
+class IntervalNode:
+    """
+    Узел интервального дерева: вилка зарплат одной вакансии.
+    """
+
+    __slots__ = ("key", "end", "max_end", "priority", "left", "right")
+
+    def __init__(self, key: tuple, end: float, priority: float) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param key: Ключ узла - пара (нижняя граница вилки, 'id' вакансии).
+        @param end: Верхняя граница вилки.
+        @param priority: Случайный приоритет узла (дерево - декартово, по приоритетам узлы образуют кучу).
+        """
+        self.key = key
+        self.end = end
+        self.max_end = end  # Наибольшая верхняя граница в поддереве узла
+        self.priority = priority
+        self.left: IntervalNode | None = None
+        self.right: IntervalNode | None = None
+
+    def update(self) -> None:
+        """
+        Пересчитывает наибольшую верхнюю границу в поддереве узла после изменения потомков.
+        @return: None
+        """
+        max_end = self.end
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+class IntervalIndex:
+    """
+    Интервальное дерево вакансий по вилке зарплат. Вилка - отрезок [нижняя граница, верхняя граница]; неуказанная
+    граница (0) считается открытой: вакансия "от 120000" - отрезок [120000, бесконечность), "до 110000" - [0, 110000].
+    Вакансии без зарплаты в индекс не попадают.
+    Вилки с верхней границей хранятся в декартовом дереве (treap) по нижней границе вилки, в каждом узле которого
+    хранится наибольшая верхняя граница поддерева, поэтому поддеревья, в которых заведомо нет подходящих вилок, при
+    поиске пропускаются. Вилки без верхней границы хранятся в отдельном отсортированном списке: в дереве они
+    сделали бы наибольшую верхнюю границу почти каждого поддерева бесконечной. Добавление и удаление вакансии
+    выполняются за O(log n) (удаление вилки без верхней границы - за O(n) сдвиг списка), запросы пересечения и
+    вложения - за O(log n + k) в среднем, где k - количество найденных вакансий.
+    """
+
+    def __init__(self, from_field: str = "salary_from", to_field: str = "salary_to") -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param from_field: Атрибут вакансии с нижней границей вилки. По умолчанию - 'salary_from'.
+        @param to_field: Атрибут вакансии с верхней границей вилки. По умолчанию - 'salary_to' (для зарплат в базовой
+        валюте - 'salary_from_base' и 'salary_to_base').
+        """
+        self.__from_field = from_field
+        self.__to_field = to_field
+        self.__root: IntervalNode | None = None
+        self.__open: list[tuple] = []  # Отсортированные пары (нижняя граница, 'id') вилок без верхней границы
+        self.__entries: dict[str, tuple] = {}  # 'id' вакансии - вилка на момент добавления
+        self.__random = random.Random()
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество вакансий в индексе.
+        @return: Количество вакансий.
+        """
+        return len(self.__entries)
+
+    def __interval(self, vacancy: Vacancy) -> tuple | None:
+        """
+        Определяет вилку зарплат вакансии.
+        @param vacancy: Экземпляр класса Vacancy.
+        @return: Пара (нижняя граница, верхняя граница) или None, если зарплата не указана.
+        """
+        start = getattr(vacancy, self.__from_field, 0) or 0
+        end = getattr(vacancy, self.__to_field, 0) or 0
+        if not start and not end:
+            return None
+        return start, end or INFINITY
+
+    @staticmethod
+    def __split(node: IntervalNode | None, key: tuple) -> tuple:
+        """
+        Разделяет дерево на два: с ключами меньше key и с ключами не меньше key.
+        @param node: Корень дерева.
+        @param key: Ключ разделения.
+        @return: Пара корней (левое дерево, правое дерево).
+        """
+        if node is None:
+            return None, None
+        if node.key < key:
+            node.right, right = IntervalIndex.__split(node.right, key)
+            node.update()
+            return node, right
+        left, node.left = IntervalIndex.__split(node.left, key)
+        node.update()
+        return left, node
+
+    @staticmethod
+    def __merge(left: IntervalNode | None, right: IntervalNode | None) -> IntervalNode | None:
+        """
+        Объединяет два дерева (все ключи левого дерева меньше ключей правого).
+        @param left: Корень левого дерева.
+        @param right: Корень правого дерева.
+        @return: Корень объединённого дерева.
+        """
+        if left is None:
+            return right
+        if right is None:
+            return left
+        if left.priority > right.priority:
+            left.right = IntervalIndex.__merge(left.right, right)
+            left.update()
+            return left
+        right.left = IntervalIndex.__merge(left, right.left)
+        right.update()
+        return right
+
+    @staticmethod
+    def __delete(node: IntervalNode | None, key: tuple) -> IntervalNode | None:
+        """
+        Удаляет узел с ключом key из дерева.
+        @param node: Корень дерева.
+        @param key: Ключ узла.
+        @return: Корень дерева без узла.
+        """
+        if node is None:
+            return None
+        if node.key == key:
+            return IntervalIndex.__merge(node.left, node.right)
+        if key < node.key:
+            node.left = IntervalIndex.__delete(node.left, key)
+        else:
+            node.right = IntervalIndex.__delete(node.right, key)
+        node.update()
+        return node
+
+    def __build(self, items: list[tuple]) -> IntervalNode | None:
+        """
+        Строит дерево из отсортированного списка вилок за O(n) (узлы со случайными приоритетами добавляются по
+        правой ветви дерева с помощью стека).
+        @param items: Отсортированный список пар (ключ, верхняя граница).
+        @return: Корень дерева.
+        """
+        stack: list[IntervalNode] = []
+        for key, end in items:
+            node = IntervalNode(key, end, self.__random.random())
+            last = None
+            while stack and stack[-1].priority < node.priority:
+                last = stack.pop()
+                last.update()
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+
+        root = None
+        while stack:
+            root = stack.pop()
+            root.update()
+        return root
+
+    def add(self, vacancy: Vacancy) -> None:
+        """
+        Добавляет вакансию в индекс. Если вакансия с таким 'id' уже есть в индексе, то она заменяется.
+        @param vacancy: Экземпляр класса Vacancy.
+        @return: None
+        """
+        self.remove(vacancy.id)
+        interval = self.__interval(vacancy)
+        if interval is None:
+            return
+
+        start, end = interval
+        self.__entries[vacancy.id] = interval
+        if end == INFINITY:
+            insort(self.__open, (start, vacancy.id))
+            return
+
+        node = IntervalNode((start, vacancy.id), end, self.__random.random())
+        left, right = self.__split(self.__root, node.key)
+        self.__root = self.__merge(self.__merge(left, node), right)
+
+    def add_many(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавляет вакансии в индекс пакетом. В пустой индекс (например, при создании хранилища) дерево строится из
+        отсортированного списка вилок за один проход; в заполненный индекс вакансии добавляются по одной за O(log n).
+        @param vacancies: Экземпляры класса Vacancy.
+        @return: None
+        """
+        if self.__entries:
+            for vacancy in vacancies:
+                self.add(vacancy)
+            return
+
+        for vacancy in vacancies:
+            self.__entries.pop(vacancy.id, None)
+            interval = self.__interval(vacancy)
+            if interval is not None:
+                self.__entries[vacancy.id] = interval
+
+        items = sorted(((start, vacancy_id), end) for vacancy_id, (start, end) in self.__entries.items())
+        self.__root = self.__build([item for item in items if item[1] != INFINITY])
+        self.__open = [key for key, end in items if end == INFINITY]
+
+    def remove(self, vacancy_id: str) -> None:
+        """
+        Удаляет вакансию из индекса.
+        @param vacancy_id: Идентификатор вакансии.
+        @return: None
+        """
+        self.remove_many((vacancy_id,))
+
+    def remove_many(self, vacancy_ids: Iterable[str]) -> None:
+        """
+        Удаляет вакансии из индекса пакетом: вилки с верхней границей удаляются из дерева за O(log n) каждая, а
+        список вилок без верхней границы фильтруется не больше одного раза (см. remove_many модуля sorted_lists).
+        @param vacancy_ids: Идентификаторы вакансий (отсутствующие в индексе пропускаются).
+        @return: None
+        """
+        old_open = []
+        for vacancy_id in set(vacancy_ids):
+            interval = self.__entries.pop(vacancy_id, None)
+            if interval is None:
+                continue
+            key = (interval[0], vacancy_id)
+            if interval[1] == INFINITY:
+                old_open.append(key)
+            else:
+                self.__root = self.__delete(self.__root, key)
+
+        if old_open:
+            remove_many(self.__open, old_open)
+
+    def __search(self, start_low: float, start_high: float, end_low: float, end_high: float) -> list[str]:
+        """
+        Находит вакансии, нижняя граница вилки которых находится в диапазоне [start_low, start_high], а верхняя - в
+        диапазоне [end_low, end_high]. Поддеревья, наибольшая верхняя граница которых меньше end_low, пропускаются.
+        @param start_low: Наименьшая нижняя граница вилки.
+        @param start_high: Наибольшая нижняя граница вилки.
+        @param end_low: Наименьшая верхняя граница вилки.
+        @param end_high: Наибольшая верхняя граница вилки.
+        @return: Список 'id' вакансий в порядке возрастания нижней границы вилки.
+        """
+        keys: list[tuple] = []
+
+        def visit(node: IntervalNode | None) -> None:
+            """
+            Обходит поддерево по возрастанию ключей.
+            @param node: Корень поддерева.
+            @return: None
+            """
+            if node is None or node.max_end < end_low:
+                return
+            start = node.key[0]
+            if start >= start_low:
+                visit(node.left)
+                if start <= start_high and end_low <= node.end <= end_high:
+                    keys.append(node.key)
+            if start <= start_high:
+                visit(node.right)
+
+        visit(self.__root)
+        if end_high == INFINITY:
+            # Вилки без верхней границы подходят по верхней границе всегда
+            start = bisect_left(self.__open, start_low, key=itemgetter(0))
+            end = bisect_right(self.__open, start_high, key=itemgetter(0))
+            return [vacancy_id for _, vacancy_id in merge(keys, self.__open[start:end])]
+
+        return [vacancy_id for _, vacancy_id in keys]
+
+    def overlaps(self, low: float | None = None, high: float | None = None) -> list[str]:
+        """
+        Возвращает вакансии, вилка зарплат которых пересекается с диапазоном [low, high]: вакансия "от 120000"
+        пересекается с диапазоном 100000 - 150000, а "до 90000" - нет.
+        @param low: Нижняя граница диапазона. None - без ограничения.
+        @param high: Верхняя граница диапазона. None - без ограничения.
+        @return: Список 'id' вакансий в порядке возрастания нижней границы вилки.
+        """
+        low = 0 if low is None else low
+        high = INFINITY if high is None else high
+        return self.__search(0, high, low, INFINITY)
+
+    def contains(self, low: float, high: float | None = None) -> list[str]:
+        """
+        Возвращает вакансии, вилка зарплат которых целиком содержит диапазон [low, high] (зарплата по вакансии
+        может быть любой из диапазона).
+        @param low: Нижняя граница диапазона.
+        @param high: Верхняя граница диапазона. None - без ограничения (подходят только вилки без верхней границы).
+        @return: Список 'id' вакансий в порядке возрастания нижней границы вилки.
+        """
+        high = INFINITY if high is None else high
+        return self.__search(0, low, high, INFINITY)
+
+    def within(self, low: float, high: float | None = None) -> list[str]:
+        """
+        Возвращает вакансии, вилка зарплат которых целиком находится в диапазоне [low, high]. Вилки с неуказанной
+        верхней границей открыты, поэтому в диапазон с конечной верхней границей не входят.
+        @param low: Нижняя граница диапазона.
+        @param high: Верхняя граница диапазона. None - без ограничения.
+        @return: Список 'id' вакансий в порядке возрастания нижней границы вилки.
+        """
+        high = INFINITY if high is None else high
+        return self.__search(low, high, low, high)
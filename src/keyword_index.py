@@ -0,0 +1,225 @@
+import re
+import sys
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from itertools import count
+
+from src.sorted_lists import insort_many, remove_many
+from src.vacancy import Vacancy
+
+# Текстовые поля вакансии, по которым можно построить индекс
+TEXT_FIELDS = ("name", "requirement", "responsibility")
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: object) -> list[str]:
+    """
+    Разбивает текст на слова в нижнем регистре (например, "Python/Django developer" - 'python', 'django',
+    'developer').
+    @param text: Текст.
+    @return: Список слов. Пустой список, если текст не задан (например, 0 или None).
+    """
+    return TOKEN_PATTERN.findall(text.lower()) if isinstance(text, str) else []
+
+
+class KeywordIndex:
+    """
+    Инвертированный индекс вакансий по словам текстовых полей (по умолчанию - названия вакансии). Для каждого слова
+    хранится множество 'id' вакансий, в поле которых встречается это слово, а для поиска по началу слова ("pyth" -
+    'python', 'python3') - отсортированный список слов поля. Поиск вакансий по ключевым словам выполняется без
+    перебора всех вакансий: его стоимость пропорциональна количеству найденных вакансий. Индекс обновляется при
+    каждом добавлении и удалении вакансии.
+    """
+
+    def __init__(self, fields: Iterable[str] = ("name",)) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param fields: Текстовые поля вакансии (из TEXT_FIELDS). По умолчанию - только 'name': поля 'requirement' и
+        'responsibility' длиннее и заметно увеличивают индекс.
+        """
+        self.__fields = tuple(fields)
+        unknown = set(self.__fields) - set(TEXT_FIELDS)
+        if unknown:
+            raise ValueError(f"Поля {sorted(unknown)} нельзя проиндексировать!")
+        self.__postings: dict[str, dict[str, set[str]]] = {field: {} for field in self.__fields}
+        self.__tokens: dict[str, list[str]] = {field: [] for field in self.__fields}  # Отсортированные слова полей
+        self.__entries: dict[str, dict[str, frozenset]] = {}  # 'id' вакансии - слова полей на момент добавления
+        self.__order: dict[str, int] = {}  # 'id' вакансии - порядковый номер добавления
+        self.__counter = count()
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество вакансий в индексе.
+        @return: Количество вакансий.
+        """
+        return len(self.__entries)
+
+    def __entry(self, vacancy: Vacancy) -> dict[str, frozenset]:
+        """
+        Запоминает слова текстовых полей вакансии. Прежняя вакансия с тем же 'id' удаляется из индекса, но сохраняет
+        своё место в порядке добавления.
+        @param vacancy: Экземпляр класса Vacancy.
+        @return: Словарь: поле - множество слов.
+        """
+        order = self.__order.get(vacancy.id)
+        self.remove(vacancy.id)
+        self.__order[vacancy.id] = next(self.__counter) if order is None else order
+
+        entry = {
+            field: frozenset(sys.intern(token) for token in tokenize(getattr(vacancy, field, None)))
+            for field in self.__fields
+        }
+        self.__entries[vacancy.id] = entry
+        return entry
+
+    def add(self, vacancy: Vacancy) -> None:
+        """
+        Добавляет вакансию в индекс. Если вакансия с таким 'id' уже есть в индексе, то она заменяется.
+        @param vacancy: Экземпляр класса Vacancy.
+        @return: None
+        """
+        for field, tokens in self.__entry(vacancy).items():
+            postings = self.__postings[field]
+            for token in tokens:
+                if token not in postings:
+                    postings[token] = set()
+                    insort(self.__tokens[field], token)
+                postings[token].add(vacancy.id)
+
+    def add_many(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавляет вакансии в индекс пакетом: в отсортированные списки слов полей вставляются только новые слова
+        пакета (см. insort_many).
+        @param vacancies: Экземпляры класса Vacancy.
+        @return: None
+        """
+        # Прежние вакансии с теми же 'id' удаляем до добавления пакета, пока новые слова пакета ещё не попали в
+        # отсортированные списки (иначе удаление слова повторяющейся вакансии сместило бы чужое слово)
+        batch = {vacancy.id: vacancy for vacancy in vacancies}
+        for vacancy_id in batch.keys() & self.__entries.keys():
+            self.remove(vacancy_id)
+
+        new_tokens: dict[str, list[str]] = {field: [] for field in self.__fields}
+        for vacancy in batch.values():
+            for field, tokens in self.__entry(vacancy).items():
+                postings = self.__postings[field]
+                for token in tokens:
+                    if token not in postings:
+                        postings[token] = set()
+                        new_tokens[field].append(token)
+                    postings[token].add(vacancy.id)
+
+        for field, field_tokens in new_tokens.items():
+            if field_tokens:
+                insort_many(self.__tokens[field], field_tokens)
+
+    def remove(self, vacancy_id: str) -> None:
+        """
+        Удаляет вакансию из индекса.
+        @param vacancy_id: Идентификатор вакансии.
+        @return: None
+        """
+        self.remove_many((vacancy_id,))
+
+    def remove_many(self, vacancy_ids: Iterable[str]) -> None:
+        """
+        Удаляет вакансии из индекса пакетом: слова, которые больше не встречаются ни в одной вакансии, удаляются из
+        отсортированного списка слов поля одним проходом (см. remove_many модуля sorted_lists).
+        @param vacancy_ids: Идентификаторы вакансий (отсутствующие в индексе пропускаются).
+        @return: None
+        """
+        old_tokens: dict[str, list[str]] = {field: [] for field in self.__fields}
+        for vacancy_id in set(vacancy_ids):
+            entry = self.__entries.pop(vacancy_id, None)
+            if entry is None:
+                continue
+            del self.__order[vacancy_id]
+            for field, tokens in entry.items():
+                postings = self.__postings[field]
+                for token in tokens:
+                    ids = postings[token]
+                    ids.discard(vacancy_id)
+                    if not ids:
+                        del postings[token]
+                        old_tokens[field].append(token)
+
+        for field, field_tokens in old_tokens.items():
+            if field_tokens:
+                remove_many(self.__tokens[field], field_tokens)
+
+    def __token_ids(self, token: str, field: str, prefix: bool) -> set[str]:
+        """
+        Находит вакансии, в поле которых есть слово (или слово, начинающееся с token).
+        @param token: Слово в нижнем регистре.
+        @param field: Текстовое поле.
+        @param prefix: Искать по началу слова.
+        @return: Множество 'id' вакансий.
+        """
+        postings = self.__postings[field]
+        if not prefix:
+            return set(postings.get(token, ()))
+
+        ids: set[str] = set()
+        tokens = self.__tokens[field]
+        for position in range(bisect_left(tokens, token), len(tokens)):
+            if not tokens[position].startswith(token):
+                break
+            ids |= postings[tokens[position]]
+        return ids
+
+    def __word_ids(self, word: str, fields: tuple, prefix: bool) -> set[str]:
+        """
+        Находит вакансии, в одном из полей которых есть ключевое слово. Если ключевое слово состоит из нескольких
+        слов (например, "python developer"), то в поле должны быть все они.
+        @param word: Ключевое слово.
+        @param fields: Текстовые поля.
+        @param prefix: Искать по началу слова.
+        @return: Множество 'id' вакансий.
+        """
+        tokens = tokenize(word)
+        ids: set[str] = set()
+        if not tokens:
+            return ids
+
+        for field in fields:
+            field_ids = self.__token_ids(tokens[0], field, prefix)
+            for token in tokens[1:]:
+                if not field_ids:
+                    break
+                field_ids &= self.__token_ids(token, field, prefix)
+            ids |= field_ids
+        return ids
+
+    def search(
+        self, words: Iterable[str], match_all: bool = False, prefix: bool = True, fields: Iterable[str] = ("name",)
+    ) -> list[str]:
+        """
+        Находит вакансии по ключевым словам (без учёта регистра).
+        @param words: Ключевые слова.
+        @param match_all: Вакансия должна содержать все ключевые слова (AND). По умолчанию - хотя бы одно (OR).
+        @param prefix: Искать по началу слова ("pyth" - 'python'). По умолчанию - да.
+        @param fields: Текстовые поля, в которых ищутся ключевые слова. По умолчанию - 'name'.
+        @return: Список 'id' вакансий в порядке их добавления в индекс.
+        """
+        fields = tuple(fields)
+        unknown = set(fields) - set(self.__fields)
+        if unknown:
+            raise ValueError(f"Поля {sorted(unknown)} не проиндексированы!")
+
+        word_ids = [self.__word_ids(word, fields, prefix) for word in words]
+        if not word_ids:
+            return []
+
+        if match_all:
+            word_ids.sort(key=len)
+            ids = word_ids[0]
+            for other_ids in word_ids[1:]:
+                if not ids:
+                    break
+                ids &= other_ids
+        else:
+            ids = set().union(*word_ids)
+
+        return sorted(ids, key=self.__order.__getitem__)
@@ -0,0 +1,282 @@
+import hashlib
+import json
+import os
+import random
+import time
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+
+def cassette_key(path: str, params: dict | list[tuple]) -> str:
+    """
+    Вычисляет ключ записи кассеты по пути и параметрам запроса (хост и порядок параметров не важны, поэтому ответы,
+    записанные с api.hh.ru, находятся по запросам к локальному серверу).
+    @param path: Путь запроса (например, "/vacancies").
+    @param params: Параметры запроса.
+    @return: Ключ записи.
+    """
+    items = params.items() if isinstance(params, dict) else params
+    query = urlencode(sorted((str(key), str(value)) for key, value in items))
+    return hashlib.sha256(f"{path}?{query}".encode("utf-8")).hexdigest()
+
+
+class CassetteRecorder:
+    """
+    Класс для записи ответов API в каталог-кассету (по одному json-файлу на запрос). Экземпляр класса подключается
+    к сессии HeadHunterAPI как обработчик ответов на время записи: with recorder.recording(hh_api): ... (или парой
+    вызовов attach и detach). Записываются только успешные ответы (200): ответы 429/5xx, после которых запрос
+    повторяется, и ответы 304 без тела не затирают уже записанную страницу.
+    """
+
+    def __init__(self, cassette_dir: str = "data/cassette") -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param cassette_dir: Каталог кассеты. По умолчанию - "data/cassette".
+        """
+        self.__cassette_dir = os.path.abspath(cassette_dir)
+        os.makedirs(self.__cassette_dir, exist_ok=True)
+
+    def attach(self, api: Any) -> None:
+        """
+        Подключает запись ко всем ответам, которые получает сессия экземпляра HeadHunterAPI. Сессия общая для
+        экземпляров класса с тем же хостом и размером пула соединений, поэтому после записи запись нужно отключить
+        методом detach.
+        @param api: Экземпляр класса HeadHunterAPI.
+        @return: None
+        """
+        hooks = api.session.hooks["response"]
+        if self not in hooks:
+            hooks.append(self)
+
+    def detach(self, api: Any) -> None:
+        """
+        Отключает запись от сессии экземпляра HeadHunterAPI.
+        @param api: Экземпляр класса HeadHunterAPI.
+        @return: None
+        """
+        hooks = api.session.hooks["response"]
+        if self in hooks:
+            hooks.remove(self)
+
+    @contextmanager
+    def recording(self, api: Any) -> Iterator["CassetteRecorder"]:
+        """
+        Контекстный менеджер: подключает запись к сессии экземпляра HeadHunterAPI и отключает её при выходе.
+        @param api: Экземпляр класса HeadHunterAPI.
+        @return: Экземпляр класса.
+        """
+        self.attach(api)
+        try:
+            yield self
+        finally:
+            self.detach(api)
+
+    def __call__(self, response: requests.Response, *args: Any, **kwargs: Any) -> None:
+        """
+        Обработчик ответов сессии requests: сохраняет в кассету успешный ответ (200).
+        @param response: Ответ API.
+        @return: None
+        """
+        if response.status_code != 200:
+            return
+
+        parts = urlsplit(response.url)
+        self.save(parts.path, parse_qsl(parts.query), response.status_code, response.text)
+
+    def save(self, path: str, params: dict | list[tuple], status: int, body: str) -> None:
+        """
+        Сохраняет ответ в кассету.
+        @param path: Путь запроса.
+        @param params: Параметры запроса.
+        @param status: Статус-код ответа.
+        @param body: Тело ответа.
+        @return: None
+        """
+        file_name = os.path.join(self.__cassette_dir, f"{cassette_key(path, params)}.json")
+        with open(file_name, "w", encoding="utf-8") as file:
+            json.dump({"status": status, "body": body}, file, ensure_ascii=False)
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+class MockHeadHunterServer:
+    """
+    Локальный HTTP-сервер, который отдаёт ответы из кассеты вместо hh.ru. Позволяет задать задержку ответа, долю
+    ответов с ошибкой 503 и долю ответов 429 (с заголовком Retry-After). Адрес для HeadHunterAPI - свойство url.
+    Используется как контекстный менеджер: with MockHeadHunterServer(...) as server: ...
+    """
+
+    def __init__(
+        self,
+        cassette_dir: str = "data/cassette",
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param cassette_dir: Каталог кассеты. По умолчанию - "data/cassette".
+        @param latency: Задержка каждого ответа в секундах. По умолчанию - без задержки.
+        @param error_rate: Доля ответов с ошибкой 503. По умолчанию - 0.
+        @param throttle_rate: Доля ответов 429 "слишком много запросов". По умолчанию - 0.
+        @param retry_after: Значение заголовка Retry-After в ответах 429 (в секундах). По умолчанию - 1.
+        @param seed: Начальное значение генератора случайных чисел (для воспроизводимых замеров).
+        """
+        self.__cassette_dir = os.path.abspath(cassette_dir)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.__random = random.Random(seed)
+        self.__lock = Lock()
+        self.__counters = {"requests": 0, "served": 0, "errors": 0, "throttled": 0, "not_found": 0}
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), self.__make_handler())
+        self.__server.daemon_threads = True
+        self.__thread: Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """
+        URL-адрес поиска вакансий на локальном сервере.
+        @return: URL-адрес.
+        """
+        host, port = self.__server.server_address[:2]
+        return f"http://{host!s}:{port}/vacancies"
+
+    def __enter__(self) -> "MockHeadHunterServer":
+        """
+        Запускает сервер при входе в контекстный менеджер.
+        @return: Экземпляр класса.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Останавливает сервер при выходе из контекстного менеджера.
+        @param args: Параметры исключения (не используются).
+        @return: None
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Запускает сервер в фоновом потоке.
+        @return: None
+        """
+        self.__thread = Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        Останавливает сервер.
+        @return: None
+        """
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def stats(self) -> dict:
+        """
+        Возвращает счётчики запросов: всего, отдано из кассеты, ошибок 503, ответов 429, не найдено в кассете.
+        @return: Словарь счётчиков.
+        """
+        with self.__lock:
+            return dict(self.__counters)
+
+    def __count(self, event: str) -> None:
+        """
+        Увеличивает счётчик запросов.
+        @param event: Название счётчика.
+        @return: None
+        """
+        with self.__lock:
+            self.__counters[event] += 1
+
+    def __choose_response(self, path: str) -> tuple[int, dict, str]:
+        """
+        Выбирает ответ на запрос: ошибку, ограничение или запись из кассеты.
+        @param path: Путь запроса вместе со строкой параметров.
+        @return: Статус-код, заголовки и тело ответа.
+        """
+        self.__count("requests")
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self.__lock:
+            chance = self.__random.random()
+        if chance < self.throttle_rate:
+            self.__count("throttled")
+            return 429, {"Retry-After": str(self.retry_after)}, '{"errors": [{"type": "too_many_requests"}]}'
+        if chance < self.throttle_rate + self.error_rate:
+            self.__count("errors")
+            return 503, {}, '{"errors": [{"type": "service_unavailable"}]}'
+
+        parts = urlsplit(path)
+        file_name = os.path.join(self.__cassette_dir, f"{cassette_key(parts.path, parse_qsl(parts.query))}.json")
+        try:
+            with open(file_name, "r", encoding="utf-8") as file:
+                record = json.load(file)
+        except OSError:
+            self.__count("not_found")
+            return 404, {}, '{"errors": [{"type": "not_found"}]}'
+
+        self.__count("served")
+        return record["status"], {}, record["body"]
+
+    def __make_handler(self) -> type[BaseHTTPRequestHandler]:
+        """
+        Создаёт класс обработчика запросов, связанный с экземпляром сервера.
+        @return: Класс обработчика запросов.
+        """
+        choose_response = self.__choose_response
+
+        class Handler(BaseHTTPRequestHandler):
+            """Обработчик GET-запросов локального сервера."""
+
+            def do_GET(self) -> None:
+                """
+                Отвечает на GET-запрос.
+                @return: None
+                """
+                status, headers, body = choose_response(self.path)
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                """
+                Отключает вывод журнала запросов в консоль.
+                @return: None
+                """
+
+        return Handler
+
+
+if __name__ == "__main__":
+    from src.headhunter_api import HeadHunterAPI
+
+    # Запишем ответы hh.ru в кассету
+    print("Запишем 5 страниц выдачи по запросу 'Python' в кассету")
+    hh_api = HeadHunterAPI(per_page=100, pool_size=4)
+    with CassetteRecorder("data/cassette").recording(hh_api):
+        hh_api.load_vacancies("Python", pages=5)
+
+    # Замерим скорость загрузки с локального сервера с задержкой 50 мс и 10% ответов 429
+    with MockHeadHunterServer("data/cassette", latency=0.05, throttle_rate=0.1, retry_after=0, seed=1) as server:
+        mock_api = HeadHunterAPI(url=server.url, per_page=100, max_workers=4, backoff=0.01)
+        start = time.perf_counter()
+        mock_vacancies = mock_api.load_vacancies("Python", pages=5)
+        print(f"Загружено {len(mock_vacancies)} вакансий за {time.perf_counter() - start:.3f} сек, {server.stats()}")
@@ -0,0 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from src.headhunter_api import BASE_URL, BaseAPI, HeadHunterAPI
+from src.rate_limiter import TokenBucket
+
+# Сайты группы компаний HeadHunter (подробнее в документации на сайте компании)
+REGIONAL_URLS = [
+    BASE_URL,
+    "https://api.hh.kz/vacancies",
+    "https://api.headhunter.kg/vacancies",
+]
+
+
+class MultiHostAPI(BaseAPI):
+    """
+    Класс для параллельного поиска вакансий на нескольких сайтах группы компаний HeadHunter. Для каждого сайта
+    создаётся свой экземпляр HeadHunterAPI со своим пулом соединений и своим ограничителем частоты запросов.
+    Вакансии со всех сайтов объединяются без повторов (по 'id').
+    """
+
+    def __init__(
+        self,
+        urls: list[str] | None = None,
+        per_page: int = 1,
+        max_workers: int = 4,
+        rate: float | None = None,
+    ) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param urls: Список URL-адресов поиска вакансий. По умолчанию - REGIONAL_URLS.
+        @param per_page: Количество вакансий на странице. По умолчанию - 1.
+        @param max_workers: Количество потоков для загрузки страниц с каждого сайта. По умолчанию - 4.
+        @param rate: Ограничение частоты запросов к каждому сайту (запросов в секунду). По умолчанию - без
+        ограничения.
+        """
+        self.__apis = {
+            url: HeadHunterAPI(
+                url=url,
+                per_page=per_page,
+                max_workers=max_workers,
+                pool_size=max_workers,
+                rate_limiter=TokenBucket(rate) if rate else None,
+            )
+            for url in (urls or REGIONAL_URLS)
+        }
+
+    def load_by_host(self, keyword: str = "Python", pages: int | None = 1) -> dict[str, list[dict]]:
+        """
+        Метод для параллельного получения вакансий со всех сайтов.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param pages: Количество страниц выдачи на каждом сайте. None - все доступные страницы.
+        @return: Словарь: URL-адрес сайта - список вакансий.
+        """
+        with ThreadPoolExecutor(max_workers=len(self.__apis)) as executor:
+            results = executor.map(lambda api: api.load_vacancies(keyword, pages), self.__apis.values())
+            return dict(zip(self.__apis, results))
+
+    def load_vacancies(self, keyword: str = "Python", pages: int | None = 1) -> list[dict]:
+        """
+        Метод для получения списка вакансий со всех сайтов без повторов.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param pages: Количество страниц выдачи на каждом сайте. None - все доступные страницы.
+        @return: Список вакансий.
+        """
+        vacancies = []
+        seen_ids = set()
+        for host_vacancies in self.load_by_host(keyword, pages).values():
+            for vacancy in host_vacancies:
+                if vacancy["id"] not in seen_ids:
+                    seen_ids.add(vacancy["id"])
+                    vacancies.append(vacancy)
+
+        return vacancies
+
+
+if __name__ == "__main__":
+    multi_api = MultiHostAPI(per_page=100, max_workers=4, rate=5)
+    for host_url, host_vacancies in multi_api.load_by_host("Python", pages=2).items():
+        print(f"{host_url}: {len(host_vacancies)} вакансий")
+    print(f"Всего без повторов: {len(multi_api.load_vacancies('Python', pages=2))} вакансий")
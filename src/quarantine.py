@@ -0,0 +1,96 @@
+import json
+import os
+
+from threading import Lock
+from typing import Any
+
+
+def failure_reason(error: Exception) -> str:
+    """
+    Определяет тип ошибки обработки вакансии для статистики карантина.
+    @param error: Исключение, возникшее при обработке вакансии.
+    @return: Тип ошибки (например, "missing_key:salary" или "invalid_type").
+    """
+    if isinstance(error, KeyError):
+        return f"missing_key:{error.args[0] if error.args else ''}"
+    if isinstance(error, (TypeError, AttributeError)):
+        return "invalid_type"
+    if isinstance(error, ValueError):
+        return "invalid_value"
+    return type(error).__name__
+
+
+class Quarantine:
+    """
+    Класс карантина для вакансий, которые не удалось обработать. Вместо того чтобы прерывать обработку всего списка,
+    такие вакансии записываются в файл (по одной json-строке на вакансию вместе с причиной отказа), а обработка
+    продолжается. Метод stats возвращает количество отклонённых вакансий по типам ошибок.
+    """
+
+    def __init__(self, file_name: str = "data/quarantine.jsonl") -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param file_name: Путь к файлу карантина. По умолчанию - "data/quarantine.jsonl".
+        """
+        self.__file_name = os.path.abspath(file_name)
+        self.__counters: dict[str, int] = {}
+        self.__lock = Lock()
+        os.makedirs(os.path.dirname(self.__file_name), exist_ok=True)
+
+    @property
+    def file_name(self) -> str:
+        """
+        Путь к файлу карантина.
+        @return: Путь к файлу.
+        """
+        return self.__file_name
+
+    def add(self, item: Any, reason: str, error: str = "") -> None:
+        """
+        Записывает отклонённую вакансию в файл карантина.
+        @param item: Вакансия (сырые или прошедшие валидацию параметры).
+        @param reason: Тип ошибки.
+        @param error: Текст ошибки.
+        @return: None
+        """
+        line = json.dumps({"reason": reason, "error": error, "item": item}, ensure_ascii=False, default=str)
+        with self.__lock:
+            self.__counters[reason] = self.__counters.get(reason, 0) + 1
+            with open(self.__file_name, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+
+    def reject(self, item: Any, error: Exception) -> None:
+        """
+        Записывает в карантин вакансию, обработка которой завершилась исключением.
+        @param item: Вакансия.
+        @param error: Исключение.
+        @return: None
+        """
+        self.add(item, failure_reason(error), repr(error))
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество вакансий, отклонённых этим экземпляром класса.
+        @return: Количество вакансий.
+        """
+        with self.__lock:
+            return sum(self.__counters.values())
+
+    def stats(self) -> dict[str, int]:
+        """
+        Возвращает количество отклонённых вакансий по типам ошибок.
+        @return: Словарь: тип ошибки - количество вакансий.
+        """
+        with self.__lock:
+            return dict(self.__counters)
+
+    def read(self) -> list[dict]:
+        """
+        Читает записи из файла карантина (для разбора и повторной обработки).
+        @return: Список записей с ключами 'reason', 'error' и 'item'.
+        """
+        try:
+            with open(self.__file_name, "r", encoding="utf-8") as file:
+                return [json.loads(line) for line in file if line.strip()]
+        except FileNotFoundError:
+            return []
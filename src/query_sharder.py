@@ -0,0 +1,197 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from src.headhunter_api import MAX_DEPTH, HeadHunterAPI
+
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"  # Формат параметров 'date_from' и 'date_to' в запросах к API
+
+
+class QuerySharder:
+    """
+    Класс для загрузки всех вакансий по запросу, выдача которого больше ограничения глубины API (2000 вакансий).
+    Запрос разбивается на части (шарды): сначала по регионам (если они заданы), затем каждая часть, выдача которой
+    всё ещё больше ограничения, делится пополам по периоду публикации (параметры 'date_from' и 'date_to'), пока
+    выдача каждой части не станет меньше ограничения или период не станет меньше min_window. Части загружаются
+    параллельно, а вакансии из пересекающихся частей исключаются по 'id'. Первая страница выдачи, полученная при
+    подсчёте вакансий части, повторно не запрашивается. Части, выдачу которых не удалось уменьшить до ограничения,
+    загружаются не полностью: о них выводится предупреждение, а их параметры возвращает свойство truncated. Так же
+    сообщается о частях, запросы которых завершились ошибкой (свойство failed): ошибка запроса не считается пустой
+    выдачей.
+    """
+
+    def __init__(
+        self,
+        api: HeadHunterAPI,
+        max_workers: int = 4,
+        cap: int = MAX_DEPTH,
+        min_window: timedelta = timedelta(hours=1),
+    ) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param api: Экземпляр класса HeadHunterAPI, через который выполняются запросы.
+        @param max_workers: Количество частей запроса, которые загружаются одновременно. По умолчанию - 4.
+        @param cap: Максимальное количество вакансий в одной части. По умолчанию - ограничение глубины API.
+        @param min_window: Минимальный период публикации, дальше которого часть не делится. По умолчанию - 1 час.
+        """
+        self.__api = api
+        self.__max_workers = max_workers
+        self.__cap = cap
+        self.__min_window = min_window
+        self.__truncated: list[dict] = []
+        self.__failed: list[dict] = []
+
+    @property
+    def truncated(self) -> list[dict]:
+        """
+        Части последнего разбиения, выдача которых больше ограничения, а период публикации уже не делится (из них
+        загружаются только первые cap вакансий).
+        @return: Список параметров поиска частей запроса.
+        """
+        return list(self.__truncated)
+
+    @property
+    def failed(self) -> list[dict]:
+        """
+        Части последнего разбиения (или загрузки), запрос количества вакансий или одной из страниц выдачи которых
+        завершился ошибкой (вакансии таких частей загружены не полностью или не загружены).
+        @return: Список параметров поиска частей запроса.
+        """
+        return list(self.__failed)
+
+    def __split_by_date(self, filters: dict) -> list[dict]:
+        """
+        Метод делит часть запроса пополам по периоду публикации.
+        @param filters: Параметры поиска части запроса.
+        @return: Список из двух частей или пустой список, если период уже меньше минимального.
+        """
+        date_from = datetime.strptime(filters["date_from"], DATE_FORMAT)
+        date_to = datetime.strptime(filters["date_to"], DATE_FORMAT)
+        if date_to - date_from <= self.__min_window:
+            return []
+
+        middle = date_from + (date_to - date_from) / 2
+        return [
+            {**filters, "date_to": middle.strftime(DATE_FORMAT)},
+            {**filters, "date_from": middle.strftime(DATE_FORMAT)},
+        ]
+
+    def __split(
+        self, keyword: str, date_from: datetime, date_to: datetime, areas: list[str] | None
+    ) -> list[tuple[dict, dict]]:
+        """
+        Метод разбивает запрос на части (см. split) и запоминает первые страницы выдачи частей.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param date_from: Начало периода публикации вакансий.
+        @param date_to: Конец периода публикации вакансий.
+        @param areas: Список идентификаторов регионов.
+        @return: Список пар (параметры поиска части запроса, первая страница выдачи части).
+        """
+        period = {"date_from": date_from.strftime(DATE_FORMAT), "date_to": date_to.strftime(DATE_FORMAT)}
+        pending = [{**period, "area": area} for area in areas] if areas else [period]
+        shards = []
+        self.__truncated = []
+        self.__failed = []
+
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            while pending:
+                first_pages = list(executor.map(lambda filters: self.__api.get_page(keyword, 0, filters), pending))
+                next_pending = []
+                for filters, first_page in zip(pending, first_pages):
+                    # Пустой словарь - ошибка запроса, а не пустая выдача
+                    if not first_page:
+                        print(f"Не удалось получить выдачу части запроса {filters}: вакансии части не загружены")
+                        self.__failed.append(filters)
+                        continue
+                    found = int(first_page.get("found", 0))
+                    if found == 0:
+                        continue
+                    if found > self.__cap:
+                        parts = self.__split_by_date(filters)
+                        if parts:
+                            next_pending.extend(parts)
+                            continue
+                        print(
+                            f"Выдача части запроса {filters} ({found} вакансий) больше {self.__cap}, а период "
+                            f"публикации меньше {self.__min_window}: будут загружены не все вакансии"
+                        )
+                        self.__truncated.append(filters)
+                    shards.append((filters, first_page))
+                pending = next_pending
+
+        return shards
+
+    def split(
+        self, keyword: str, date_from: datetime, date_to: datetime, areas: list[str] | None = None
+    ) -> list[dict]:
+        """
+        Метод разбивает запрос на части, выдача каждой из которых не больше ограничения глубины API. Количество
+        найденных вакансий для частей одного уровня запрашивается параллельно. Части, которые не удалось уменьшить
+        до ограничения, возвращает свойство truncated, а части, запрос которых завершился ошибкой, - свойство failed.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param date_from: Начало периода публикации вакансий.
+        @param date_to: Конец периода публикации вакансий.
+        @param areas: Список идентификаторов регионов. По умолчанию - без разбиения по регионам.
+        @return: Список параметров поиска частей запроса.
+        """
+        return [filters for filters, _ in self.__split(keyword, date_from, date_to, areas)]
+
+    def __load_shard(self, keyword: str, filters: dict, first_page: dict) -> tuple[list[dict], bool]:
+        """
+        Метод загружает вакансии части запроса, начиная со второй страницы выдачи.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param filters: Параметры поиска части запроса.
+        @param first_page: Первая страница выдачи части, полученная при разбиении запроса.
+        @return: Пара (список вакансий части запроса, загружены ли все страницы).
+        """
+        vacancies = []
+        complete = True
+        for page_data in self.__api.iter_pages(keyword, None, filters, first_page):
+            if not page_data:
+                complete = False
+            vacancies.extend(page_data.get("items", []))
+
+        return vacancies, complete
+
+    def load_vacancies(
+        self,
+        keyword: str,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        areas: list[str] | None = None,
+    ) -> list[dict]:
+        """
+        Метод загружает все вакансии по запросу, разбивая его на части.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param date_from: Начало периода публикации вакансий. По умолчанию - 30 дней назад.
+        @param date_to: Конец периода публикации вакансий. По умолчанию - текущий момент.
+        @param areas: Список идентификаторов регионов. По умолчанию - без разбиения по регионам.
+        @return: Список вакансий без повторов. Части, загруженные не полностью, возвращает свойство failed.
+        """
+        date_to = date_to or datetime.now().replace(microsecond=0)
+        date_from = date_from or date_to - timedelta(days=30)
+        shards = self.__split(keyword, date_from, date_to, areas)
+
+        vacancies = []
+        seen_ids = set()
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            for (filters, _), (shard_vacancies, complete) in zip(
+                shards, executor.map(lambda shard: self.__load_shard(keyword, *shard), shards)
+            ):
+                if not complete:
+                    print(f"Не все страницы выдачи части запроса {filters} загружены")
+                    self.__failed.append(filters)
+                for vacancy in shard_vacancies:
+                    if vacancy["id"] not in seen_ids:
+                        seen_ids.add(vacancy["id"])
+                        vacancies.append(vacancy)
+
+        return vacancies
+
+
+if __name__ == "__main__":
+    hh_api = HeadHunterAPI(per_page=100, max_workers=4)
+    sharder = QuerySharder(hh_api, max_workers=4)
+
+    print("Загрузим все вакансии по запросу 'Python' за последние 7 дней")
+    python_vacancies = sharder.load_vacancies("Python", date_from=datetime.now() - timedelta(days=7))
+    print(f"Загружено {len(python_vacancies)} вакансий")
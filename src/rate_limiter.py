@@ -0,0 +1,177 @@
+import random
+import time
+
+from email.utils import parsedate_to_datetime
+from threading import Condition, Lock
+from types import TracebackType
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)  # Статус-коды, при которых запрос имеет смысл повторить
+THROTTLE_STATUSES = (429, 503)  # Статус-коды, которыми API сообщает о перегрузке
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты запросов по алгоритму "корзина токенов". Токены пополняются со скоростью rate в секунду,
+    но не больше capacity. Каждый запрос забирает один токен, а при их нехватке ждёт пополнения.
+    Один экземпляр можно разделять между потоками (в том числе потоками AsyncHeadHunterAPI).
+    """
+
+    def __init__(self, rate: float, capacity: int | None = None) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param rate: Количество запросов в секунду.
+        @param capacity: Максимальное количество запросов, которое можно выполнить "залпом". По умолчанию - rate
+        (но не меньше 1).
+        """
+        self.__rate = rate
+        self.__capacity = capacity if capacity is not None else max(1, int(rate))
+        self.__tokens = float(self.__capacity)
+        self.__updated = time.monotonic()
+        self.__lock = Lock()
+
+    def __reserve(self) -> float:
+        """
+        Резервирует один токен. Если токенов нет, то уходит "в долг" и возвращает время ожидания, после которого
+        токен можно считать полученным. Ожидание происходит вне блокировки.
+        @return: Время ожидания в секундах.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.__capacity, self.__tokens + (now - self.__updated) * self.__rate)
+            self.__updated = now
+            self.__tokens -= 1
+
+            return 0.0 if self.__tokens >= 0 else -self.__tokens / self.__rate
+
+    def acquire(self) -> None:
+        """
+        Получает токен, при необходимости блокируя поток до его появления.
+        @return: None
+        """
+        delay = self.__reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+class AdaptiveConcurrency:
+    """
+    Ограничитель количества одновременных запросов. В адаптивном режиме лимит уменьшается вдвое при получении
+    ответа "слишком много запросов" от API и увеличивается на единицу после серии успешных ответов.
+    Используется как контекстный менеджер: with limiter: ...
+    """
+
+    def __init__(
+        self, limit: int, minimum: int = 1, maximum: int | None = None, adaptive: bool = True, increase_after: int = 10
+    ) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param limit: Начальное количество одновременных запросов.
+        @param minimum: Минимальное количество одновременных запросов. По умолчанию - 1.
+        @param maximum: Максимальное количество одновременных запросов. По умолчанию - limit.
+        @param adaptive: Включает адаптивный режим. По умолчанию - включен.
+        @param increase_after: Количество успешных ответов подряд, после которого лимит увеличивается.
+        """
+        self.__limit = limit
+        self.__minimum = minimum
+        self.__maximum = maximum if maximum is not None else limit
+        self.__adaptive = adaptive
+        self.__increase_after = increase_after
+        self.__active = 0
+        self.__successes = 0
+        self.__condition = Condition()
+
+    @property
+    def limit(self) -> int:
+        """
+        Текущий лимит одновременных запросов.
+        @return: Лимит одновременных запросов.
+        """
+        return self.__limit
+
+    def __enter__(self) -> "AdaptiveConcurrency":
+        """
+        Занимает слот для запроса, ожидая освобождения, если лимит исчерпан.
+        @return: Экземпляр класса.
+        """
+        with self.__condition:
+            while self.__active >= self.__limit:
+                self.__condition.wait()
+            self.__active += 1
+
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        """
+        Освобождает слот.
+        @param exc_type: Тип исключения.
+        @param exc_val: Исключение.
+        @param exc_tb: Трассировка исключения.
+        @return: None
+        """
+        with self.__condition:
+            self.__active -= 1
+            self.__condition.notify()
+
+    def on_throttle(self) -> None:
+        """
+        Сообщает ограничителю, что API ограничивает запросы: лимит уменьшается вдвое.
+        @return: None
+        """
+        if not self.__adaptive:
+            return
+        with self.__condition:
+            self.__limit = max(self.__minimum, self.__limit // 2)
+            self.__successes = 0
+
+    def on_success(self) -> None:
+        """
+        Сообщает ограничителю об успешном ответе: после серии успешных ответов лимит увеличивается на единицу.
+        @return: None
+        """
+        if not self.__adaptive:
+            return
+        with self.__condition:
+            self.__successes += 1
+            if self.__successes >= self.__increase_after and self.__limit < self.__maximum:
+                self.__limit += 1
+                self.__successes = 0
+                self.__condition.notify()
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Разбирает значение заголовка Retry-After (количество секунд или HTTP-дата).
+    @param value: Значение заголовка.
+    @return: Время ожидания в секундах или None, если заголовок отсутствует или не разобран.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 0.5, retry_after: str | None = None, cap: float = 30.0) -> float:
+    """
+    Вычисляет паузу перед повторным запросом: значение заголовка Retry-After, если он есть, иначе экспоненциальная
+    задержка со случайным разбросом.
+    @param attempt: Номер попытки (нумерация с нуля).
+    @param base: Базовая задержка в секундах.
+    @param retry_after: Значение заголовка Retry-After.
+    @param cap: Максимальная задержка в секундах.
+    @return: Пауза в секундах.
+    """
+    delay = parse_retry_after(retry_after)
+    if delay is not None:
+        return min(cap, delay)
+
+    return min(cap, base * 2.0**attempt) * random.uniform(0.5, 1.0)
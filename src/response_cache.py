@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import time
+
+from collections import OrderedDict
+from threading import Lock
+from urllib.parse import urlencode
+
+
+class ResponseCache:
+    """
+    Дисковый кэш ответов API. Ключ записи - URL-адрес и параметры запроса. Запись хранит тело ответа и заголовки
+    ETag/Last-Modified, по которым устаревшая запись проверяется условным запросом (ответ 304 не содержит тела).
+    Свежие записи (моложе ttl секунд) отдаются без обращения к API. При превышении max_size байт удаляются записи,
+    которые дольше всего не использовались (LRU).
+    """
+
+    def __init__(self, cache_dir: str = "data/cache", ttl: float = 3600, max_size: int = 50 * 1024 * 1024) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param cache_dir: Каталог для хранения записей кэша. По умолчанию - "data/cache".
+        @param ttl: Время жизни записи в секундах. По умолчанию - 1 час.
+        @param max_size: Максимальный размер кэша в байтах. По умолчанию - 50 Мб.
+        """
+        self.__cache_dir = os.path.abspath(cache_dir)
+        self.__ttl = ttl
+        self.__max_size = max_size
+        self.__lock = Lock()
+        # Счётчики: hits - ответ отдан из кэша без обращения к API, misses - ответ загружен из API целиком,
+        # revalidations - API подтвердил актуальность записи ответом 304
+        self.__counters = {"hits": 0, "misses": 0, "revalidations": 0}
+
+        os.makedirs(self.__cache_dir, exist_ok=True)
+        # Записи в порядке последнего использования (в начале - самые старые): ключ - размер файла
+        self.__entries: OrderedDict[str, int] = OrderedDict()
+        files = [entry for entry in os.scandir(self.__cache_dir) if entry.name.endswith(".json")]
+        for entry in sorted(files, key=lambda item: item.stat().st_mtime):
+            self.__entries[entry.name[: -len(".json")]] = entry.stat().st_size
+        self.__size = sum(self.__entries.values())
+
+    @staticmethod
+    def make_key(url: str, params: dict | None = None) -> str:
+        """
+        Вычисляет ключ записи по URL-адресу и параметрам запроса (порядок параметров не важен).
+        @param url: URL-адрес запроса.
+        @param params: Параметры запроса.
+        @return: Ключ записи.
+        """
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+    def __path(self, key: str) -> str:
+        """
+        Возвращает путь к файлу записи.
+        @param key: Ключ записи.
+        @return: Путь к файлу.
+        """
+        return os.path.join(self.__cache_dir, f"{key}.json")
+
+    def get(self, url: str, params: dict | None = None) -> dict | None:
+        """
+        Возвращает запись кэша (свежую или устаревшую).
+        @param url: URL-адрес запроса.
+        @param params: Параметры запроса.
+        @return: Словарь с ключами 'body', 'etag', 'last_modified', 'stored_at' или None, если записи нет.
+        """
+        key = self.make_key(url, params)
+        with self.__lock:
+            if key not in self.__entries:
+                return None
+            try:
+                with open(self.__path(key), "r", encoding="utf-8") as file:
+                    entry: dict = json.load(file)
+            except (OSError, ValueError):
+                self.__remove(key)
+                return None
+            self.__entries.move_to_end(key)
+            # Время изменения файла хранит порядок использования записей между запусками
+            os.utime(self.__path(key))
+
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """
+        Проверяет, что запись моложе времени жизни кэша.
+        @param entry: Запись кэша.
+        @return: True, если запись можно отдать без обращения к API.
+        """
+        return time.time() - float(entry["stored_at"]) < self.__ttl
+
+    def put(
+        self, url: str, params: dict | None, body: str, etag: str | None = None, last_modified: str | None = None
+    ) -> None:
+        """
+        Сохраняет ответ API в кэш и удаляет давно не использованные записи при превышении размера кэша.
+        @param url: URL-адрес запроса.
+        @param params: Параметры запроса.
+        @param body: Тело ответа.
+        @param etag: Значение заголовка ETag.
+        @param last_modified: Значение заголовка Last-Modified.
+        @return: None
+        """
+        key = self.make_key(url, params)
+        entry = {"body": body, "etag": etag, "last_modified": last_modified, "stored_at": time.time()}
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        with self.__lock:
+            tmp_path = f"{self.__path(key)}.tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, self.__path(key))
+
+            self.__size += len(data) - self.__entries.get(key, 0)
+            self.__entries[key] = len(data)
+            self.__entries.move_to_end(key)
+            while self.__size > self.__max_size and len(self.__entries) > 1:
+                self.__remove(next(iter(self.__entries)))
+
+    def refresh(self, url: str, params: dict | None, entry: dict) -> None:
+        """
+        Продлевает время жизни записи после ответа 304.
+        @param url: URL-адрес запроса.
+        @param params: Параметры запроса.
+        @param entry: Запись кэша.
+        @return: None
+        """
+        self.put(url, params, entry["body"], entry["etag"], entry["last_modified"])
+
+    def __remove(self, key: str) -> None:
+        """
+        Удаляет запись из кэша (вызывается под блокировкой).
+        @param key: Ключ записи.
+        @return: None
+        """
+        self.__size -= self.__entries.pop(key, 0)
+        try:
+            os.remove(self.__path(key))
+        except OSError:
+            pass
+
+    def record(self, event: str) -> None:
+        """
+        Увеличивает счётчик использования кэша.
+        @param event: Название счётчика: 'hits', 'misses' или 'revalidations'.
+        @return: None
+        """
+        with self.__lock:
+            self.__counters[event] += 1
+
+    def stats(self) -> dict:
+        """
+        Возвращает счётчики использования кэша.
+        @return: Словарь с ключами 'hits', 'misses', 'revalidations', 'entries', 'size'.
+        """
+        with self.__lock:
+            return {**self.__counters, "entries": len(self.__entries), "size": self.__size}
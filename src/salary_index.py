@@ -0,0 +1,122 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from operator import itemgetter
+
+from src.sorted_lists import insort_many, remove_many
+from src.vacancy import Vacancy
+
+# Поля зарплаты, по которым строится индекс
+SALARY_FIELDS = ("salary_from", "salary_to", "salary_mid", "salary_mid_base")
+
+
+class SalaryIndex:
+    """
+    Индекс вакансий по зарплате. Для каждого поля зарплаты (SALARY_FIELDS) хранится отсортированный список пар
+    (значение, 'id' вакансии), поэтому запрос диапазона ("зарплата от X до Y", "от X и выше") выполняется двоичным
+    поиском за O(log n + k), где k - количество найденных вакансий. Значение 0 означает, что граница зарплаты не
+    указана: такие вакансии не попадают в списки поля. Индекс обновляется при каждом добавлении и удалении вакансии:
+    элемент находится двоичным поиском, а вставка и удаление сдвигают хвост списка (O(n), но это быстрый сдвиг
+    памяти, а не перебор вакансий).
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализатор экземпляра класса.
+        """
+        self.__keys: dict[str, list[tuple]] = {field: [] for field in SALARY_FIELDS}
+        self.__entries: dict[str, tuple] = {}  # 'id' вакансии - значения полей на момент добавления
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество вакансий в индексе.
+        @return: Количество вакансий.
+        """
+        return len(self.__entries)
+
+    def __entry(self, vacancy: Vacancy) -> tuple:
+        """
+        Запоминает значения полей зарплаты вакансии (по ним вакансия удаляется из индекса, даже если атрибуты
+        вакансии изменились после добавления). Прежняя вакансия с тем же 'id' удаляется из индекса.
+        @param vacancy: Экземпляр класса Vacancy.
+        @return: Значения полей зарплаты.
+        """
+        if vacancy.id in self.__entries:
+            self.remove(vacancy.id)
+
+        entry = tuple(getattr(vacancy, field, 0) or 0 for field in SALARY_FIELDS)
+        self.__entries[vacancy.id] = entry
+        return entry
+
+    def add(self, vacancy: Vacancy) -> None:
+        """
+        Добавляет вакансию в индекс. Если вакансия с таким 'id' уже есть в индексе, то она заменяется.
+        @param vacancy: Экземпляр класса Vacancy.
+        @return: None
+        """
+        for field, value in zip(SALARY_FIELDS, self.__entry(vacancy)):
+            if value:
+                insort(self.__keys[field], (value, vacancy.id))
+
+    def add_many(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавляет вакансии в индекс пакетом: небольшой пакет вставляется в списки по одной паре, большой (например,
+        при первом заполнении индекса) - сливается со списками за один проход (см. insort_many).
+        @param vacancies: Экземпляры класса Vacancy.
+        @return: None
+        """
+        # Прежние вакансии с теми же 'id' удаляем до добавления пакета, пока пары пакета ещё не попали в списки
+        batch = {vacancy.id: vacancy for vacancy in vacancies}
+        for vacancy_id in batch.keys() & self.__entries.keys():
+            self.remove(vacancy_id)
+
+        new_keys: dict[str, list[tuple]] = {field: [] for field in SALARY_FIELDS}
+        for vacancy in batch.values():
+            for field, value in zip(SALARY_FIELDS, self.__entry(vacancy)):
+                if value:
+                    new_keys[field].append((value, vacancy.id))
+
+        for field, keys in new_keys.items():
+            insort_many(self.__keys[field], keys)
+
+    def remove(self, vacancy_id: str) -> None:
+        """
+        Удаляет вакансию из индекса.
+        @param vacancy_id: Идентификатор вакансии.
+        @return: None
+        """
+        self.remove_many((vacancy_id,))
+
+    def remove_many(self, vacancy_ids: Iterable[str]) -> None:
+        """
+        Удаляет вакансии из индекса пакетом: каждый отсортированный список фильтруется не больше одного раза (см.
+        remove_many модуля sorted_lists).
+        @param vacancy_ids: Идентификаторы вакансий (отсутствующие в индексе пропускаются).
+        @return: None
+        """
+        old_keys: dict[str, list[tuple]] = {field: [] for field in SALARY_FIELDS}
+        for vacancy_id in set(vacancy_ids):
+            entry = self.__entries.pop(vacancy_id, None)
+            if entry is None:
+                continue
+            for field, value in zip(SALARY_FIELDS, entry):
+                if value:
+                    old_keys[field].append((value, vacancy_id))
+
+        for field, keys in old_keys.items():
+            if keys:
+                remove_many(self.__keys[field], keys)
+
+    def range(self, field: str, low: float | None = None, high: float | None = None) -> list[str]:
+        """
+        Возвращает вакансии, у которых значение поля зарплаты находится в диапазоне [low, high]. Вакансии без
+        значения поля (0) не возвращаются.
+        @param field: Поле зарплаты (одно из SALARY_FIELDS).
+        @param low: Нижняя граница диапазона. None - без ограничения.
+        @param high: Верхняя граница диапазона. None - без ограничения.
+        @return: Список 'id' вакансий в порядке возрастания значения поля.
+        """
+        keys = self.__keys[field]
+        start = 0 if low is None else bisect_left(keys, low, key=itemgetter(0))
+        end = len(keys) if high is None else bisect_right(keys, high, key=itemgetter(0))
+
+        return [vacancy_id for _, vacancy_id in keys[start:end]]
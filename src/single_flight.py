@@ -0,0 +1,80 @@
+import asyncio
+
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any
+
+
+class SingleFlight:
+    """
+    Класс для объединения одинаковых одновременных вызовов в потоках. Пока вызов с некоторым ключом выполняется,
+    остальные потоки с тем же ключом не выполняют его повторно, а ждут и получают тот же результат (или то же
+    исключение). Результат общий для всех ожидающих, поэтому изменять его нельзя.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализатор экземпляра класса.
+        """
+        self.__lock = Lock()
+        self.__calls: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Выполняет функцию или присоединяется к уже выполняющемуся вызову с тем же ключом.
+        @param key: Ключ вызова (например, URL-адрес и параметры запроса).
+        @param function: Функция без аргументов.
+        @return: Результат функции.
+        """
+        with self.__lock:
+            future = self.__calls.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self.__calls[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+
+        return result
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+class AsyncSingleFlight:
+    """
+    Класс для объединения одинаковых одновременных вызовов в асинхронных задачах одного цикла событий. Отмена одной
+    из ожидающих задач не отменяет общий вызов для остальных.
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализатор экземпляра класса.
+        """
+        self.__tasks: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Выполняет асинхронную функцию или присоединяется к уже выполняющемуся вызову с тем же ключом.
+        @param key: Ключ вызова.
+        @param function: Асинхронная функция без аргументов.
+        @return: Результат функции.
+        """
+        task = self.__tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(function())
+            self.__tasks[key] = task
+            task.add_done_callback(lambda _: self.__tasks.pop(key, None))
+
+        return await asyncio.shield(task)
@@ -0,0 +1,42 @@
+from bisect import bisect_left, insort
+from typing import Any
+
+# Пакет, начиная с которого (относительно размера списка) выгоднее один раз слить отсортированный пакет со списком
+# (или отфильтровать список), чем вставлять (удалять) элементы по одному: каждая вставка и удаление сдвигают хвост
+# списка, а слияние и фильтрация проходят весь список один раз.
+MERGE_RATIO = 200
+
+
+def insort_many(items: list, new_items: list[Any]) -> None:
+    """
+    Добавляет элементы в отсортированный список с сохранением порядка. Небольшой пакет вставляется по одному
+    элементу (двоичный поиск и сдвиг хвоста списка), большой пакет сортируется и сливается со списком за один проход
+    (сортировка Timsort сливает два отсортированных участка за линейное время).
+    @param items: Отсортированный список. Изменяется на месте.
+    @param new_items: Новые элементы (в любом порядке).
+    @return: None
+    """
+    if len(new_items) * MERGE_RATIO < len(items):
+        for item in new_items:
+            insort(items, item)
+        return
+
+    items.extend(sorted(new_items))
+    items.sort()
+
+
+def remove_many(items: list, old_items: list[Any]) -> None:
+    """
+    Удаляет элементы из отсортированного списка. Небольшой пакет удаляется по одному элементу (двоичный поиск и
+    сдвиг хвоста списка), большой - одним проходом фильтрации списка за O(n + k) вместо O(k * n).
+    @param items: Отсортированный список. Изменяется на месте.
+    @param old_items: Удаляемые элементы (в любом порядке, каждый должен быть в списке, элементы - хешируемые).
+    @return: None
+    """
+    if len(old_items) * MERGE_RATIO < len(items):
+        for item in old_items:
+            del items[bisect_left(items, item)]
+        return
+
+    old_set = set(old_items)
+    items[:] = [item for item in items if item not in old_set]
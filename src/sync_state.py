@@ -0,0 +1,118 @@
+import json
+import os
+
+from datetime import datetime
+from threading import Lock
+
+PUBLISHED_AT_FORMAT = "%Y-%m-%dT%H:%M:%S%z"  # Формат поля 'published_at' вакансий
+
+
+def parse_published_at(value: str) -> datetime:
+    """
+    Разбирает дату публикации вакансии.
+    @param value: Дата публикации в формате API (например, "2024-02-16T14:58:28+0300").
+    @return: Дата публикации с часовым поясом.
+    """
+    return datetime.strptime(value, PUBLISHED_AT_FORMAT)
+
+
+def merge_vacancies(existing: list[dict], new: list[dict]) -> list[dict]:
+    """
+    Объединяет ранее сохранённые вакансии с новыми. Вакансии с совпадающим 'id' заменяются новыми.
+    @param existing: Ранее сохранённые вакансии.
+    @param new: Новые вакансии.
+    @return: Объединённый список вакансий.
+    """
+    merged = {vacancy["id"]: vacancy for vacancy in existing}
+    for vacancy in new:
+        merged[vacancy["id"]] = vacancy
+
+    return list(merged.values())
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+class SyncState:
+    """
+    Класс для хранения состояния инкрементальной загрузки вакансий. Для каждого запроса в файле хранится отметка
+    самой поздней даты публикации среди загруженных вакансий и 'id' вакансий, опубликованных в этот момент (чтобы
+    не загрузить их повторно при запросе с 'date_from', равным отметке).
+    """
+
+    def __init__(self, file_name: str = "data/sync_state.json") -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param file_name: Путь к файлу состояния. По умолчанию - "data/sync_state.json".
+        """
+        self.__file_name = os.path.abspath(file_name)
+        self.__lock = Lock()
+        self.__marks: dict[str, dict] = {}
+        if os.path.exists(self.__file_name):
+            with open(self.__file_name, "r", encoding="utf-8") as file:
+                self.__marks = json.load(file)
+
+    @staticmethod
+    def make_key(keyword: str, filters: dict | None = None) -> str:
+        """
+        Формирует ключ запроса по ключевому слову и параметрам поиска.
+        @param keyword: Ключевое слово для поиска вакансий.
+        @param filters: Дополнительные параметры поиска.
+        @return: Ключ запроса.
+        """
+        return json.dumps([keyword, sorted((filters or {}).items())], ensure_ascii=False)
+
+    def get(self, key: str) -> dict | None:
+        """
+        Возвращает отметку запроса.
+        @param key: Ключ запроса.
+        @return: Словарь с ключами 'published_at' и 'ids' или None, если запрос ещё не выполнялся.
+        """
+        with self.__lock:
+            return self.__marks.get(key)
+
+    def is_new(self, key: str, vacancy: dict) -> bool:
+        """
+        Проверяет, что вакансия опубликована позже отметки запроса и ещё не была загружена.
+        @param key: Ключ запроса.
+        @param vacancy: Вакансия (словарь из API).
+        @return: True, если вакансия новая.
+        """
+        mark = self.get(key)
+        if mark is None:
+            return True
+
+        published_at = parse_published_at(vacancy["published_at"])
+        boundary = parse_published_at(mark["published_at"])
+
+        return published_at > boundary or (published_at == boundary and vacancy["id"] not in mark["ids"])
+
+    def update(self, key: str, vacancies: list[dict]) -> None:
+        """
+        Сдвигает отметку запроса на самую позднюю дату публикации среди новых вакансий и сохраняет состояние в файл.
+        @param key: Ключ запроса.
+        @param vacancies: Новые вакансии (словари из API).
+        @return: None
+        """
+        if not vacancies:
+            return
+
+        latest = max(vacancies, key=lambda vacancy: parse_published_at(vacancy["published_at"]))
+        latest_at = parse_published_at(latest["published_at"])
+        ids = [vacancy["id"] for vacancy in vacancies if parse_published_at(vacancy["published_at"]) == latest_at]
+
+        with self.__lock:
+            mark = self.__marks.get(key)
+            if mark is not None and parse_published_at(mark["published_at"]) == latest_at:
+                ids = sorted(set(mark["ids"]) | set(ids))
+            self.__marks[key] = {"published_at": latest["published_at"], "ids": ids}
+            self.__save()
+
+    def __save(self) -> None:
+        """
+        Сохраняет состояние в файл (вызывается под блокировкой).
+        @return: None
+        """
+        os.makedirs(os.path.dirname(self.__file_name), exist_ok=True)
+        tmp_name = f"{self.__file_name}.tmp"
+        with open(tmp_name, "w", encoding="utf-8") as file:
+            json.dump(self.__marks, file, ensure_ascii=False)
+        os.replace(tmp_name, self.__file_name)
@@ -1,3 +1,72 @@
+import sys
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Literal, overload
+
+from src.quarantine import Quarantine
+
+# Ключи сырой вакансии, без которых из неё нельзя создать экземпляр класса Vacancy
+REQUIRED_RAW_KEYS = ("id", "name", "salary", "published_at", "archived", "apply_alternate_url", "snippet")
+
+# Ошибки обработки отдельной вакансии, при которых вакансия отправляется в карантин
+VACANCY_ERRORS = (KeyError, TypeError, AttributeError, ValueError)
+
+# Ключи вакансии после валидации (порядок столбцов в Validator.validate_many)
+VALIDATED_KEYS = (
+    "id",
+    "name",
+    "salary_from",
+    "salary_to",
+    "currency",
+    "published_at",
+    "archived",
+    "url",
+    "requirement",
+    "responsibility",
+    "employer_id",
+    "published_ts",
+    "currency_code",
+    "salary_mid",
+    "name_lower",
+)
+
+
+def published_timestamp(value: str | None) -> float:
+    """
+    Переводит дату публикации вакансии в метку времени.
+    @param value: Дата публикации в формате API (например, "2024-02-16T14:58:28+0300").
+    @return: Количество секунд с начала эпохи Unix. 0, если дата не задана или не разбирается.
+    """
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def currency_code(value: str | int | None) -> str:
+    """
+    Приводит код валюты к интернированной строке (одинаковые коды - один объект, сравнение выполняется быстрее).
+    @param value: Код валюты (0 или None, если зарплата не указана).
+    @return: Код валюты или пустая строка.
+    """
+    return sys.intern(value) if isinstance(value, str) else ""
+
+
+def salary_midpoint(salary_from: int | float | None, salary_to: int | float | None) -> float:
+    """
+    Вычисляет середину вилки зарплат. Если указана только одна граница, то возвращается она.
+    @param salary_from: Нижняя граница зарплаты (0 или None - не указана).
+    @param salary_to: Верхняя граница зарплаты (0 или None - не указана).
+    @return: Середина вилки зарплат. 0, если зарплата не указана.
+    """
+    if salary_from and salary_to:
+        return (salary_from + salary_to) / 2
+    return float(salary_from or salary_to or 0)
+
+
 class Validator:
     """
     Класс валидации параметров для передачи в атрибуты экземпляров класса вакансий.
@@ -14,7 +83,8 @@ class Validator:
     * Выбираются ключи:
     * 'id', 'name', 'salary' (Внутри содержит вложенный словарь {'from' и 'to'}, разделяется на ключи 'salary_from' и
     * 'salary_to'), 'published_at', 'archived', 'apply_alternate_url', 'snippet' (Внутри содержит вложенный словарь
-    * {'requirement' и 'responsibility'}, разделяется на ключи 'requirement' и 'responsibility'.
+    * {'requirement' и 'responsibility'}, разделяется на ключи 'requirement' и 'responsibility'), 'employer' (из
+    * вложенного словаря сохраняется только идентификатор работодателя - ключ 'employer_id').
     -------------------------------------------------------------------------------------------------------------------
     """
 
@@ -22,61 +92,153 @@ class Validator:
     def validate(vacancy_params: dict) -> dict:
         """
         Производит выборку по ключам словаря вакансии и создаёт новый словарь с выбранными ключами и их значениями.
+        Нужные ключи берутся из словаря напрямую, без перебора всех ключей вакансии.
         @param vacancy_params: Содержит параметры одной вакансии.
         @return: Отобранные и валидные параметры одной вакансии.
         """
-        # __required_keys = ("id", "name", "salary", "published_at", "archived", "apply_alternate_url", "snippet")
-        __slots__ = (
-            "id",
-            "name",
-            "salary_from",
-            "salary",
-            "published_at",
-            "archived",
-            "apply_alternate_url",
-            "snippet",
-        )
-
         new_vacancy_params = {}
-        for key, value in vacancy_params.items():
-            if key in __slots__:
-                if key == "salary":
-                    if vacancy_params[key] is None:
-                        new_vacancy_params["salary_from"] = 0
-                        new_vacancy_params["salary_to"] = 0
-                        new_vacancy_params["currency"] = 0
-                    else:
-                        new_vacancy_params["salary_from"] = vacancy_params[key]["from"]
-                        new_vacancy_params["salary_to"] = vacancy_params[key]["to"]
-                        new_vacancy_params["currency"] = vacancy_params[key]["currency"]
-
-                        if vacancy_params[key]["from"] is None:
-                            new_vacancy_params["salary_from"] = 0
-
-                        if vacancy_params[key]["to"] is None:
-                            new_vacancy_params["salary_to"] = 0
-
-                elif key == "snippet":
-                    if vacancy_params[key] is None:
-                        new_vacancy_params["requirement"] = 0
-                        new_vacancy_params["responsibility"] = 0
-                    else:
-                        new_vacancy_params["requirement"] = vacancy_params[key]["requirement"]
-                        new_vacancy_params["responsibility"] = vacancy_params[key]["responsibility"]
-
-                elif key == "apply_alternate_url":
-                    new_vacancy_params["url"] = value
+        for key in ("id", "name", "published_at", "archived"):
+            if key in vacancy_params:
+                new_vacancy_params[key] = vacancy_params[key]
 
-                else:
-                    new_vacancy_params[key] = value
+        if "salary" in vacancy_params:
+            salary = vacancy_params["salary"]
+            if salary is None:
+                new_vacancy_params["salary_from"] = 0
+                new_vacancy_params["salary_to"] = 0
+                new_vacancy_params["currency"] = 0
+            else:
+                new_vacancy_params["salary_from"] = salary["from"] or 0
+                new_vacancy_params["salary_to"] = salary["to"] or 0
+                new_vacancy_params["currency"] = salary["currency"]
+
+        if "apply_alternate_url" in vacancy_params:
+            new_vacancy_params["url"] = vacancy_params["apply_alternate_url"]
+
+        if "snippet" in vacancy_params:
+            snippet = vacancy_params["snippet"]
+            if snippet is None:
+                new_vacancy_params["requirement"] = 0
+                new_vacancy_params["responsibility"] = 0
+            else:
+                new_vacancy_params["requirement"] = snippet["requirement"]
+                new_vacancy_params["responsibility"] = snippet["responsibility"]
+
+        if "employer" in vacancy_params:
+            employer = vacancy_params["employer"]
+            new_vacancy_params["employer_id"] = employer.get("id") if employer else None
+
+        # Типизированные поля, вычисленные один раз для сортировки и фильтрации
+        if "published_at" in new_vacancy_params:
+            new_vacancy_params["published_ts"] = published_timestamp(new_vacancy_params["published_at"])
+        if "currency" in new_vacancy_params:
+            new_vacancy_params["currency_code"] = currency_code(new_vacancy_params["currency"])
+            new_vacancy_params["salary_mid"] = salary_midpoint(
+                new_vacancy_params["salary_from"], new_vacancy_params["salary_to"]
+            )
+        if "name" in new_vacancy_params:
+            new_vacancy_params["name_lower"] = (new_vacancy_params["name"] or "").lower()
 
         return new_vacancy_params
 
+    @overload
+    @staticmethod
+    def validate_many(
+        vacancies_params: Iterable[dict], columns: Literal[False] = False, quarantine: Quarantine | None = None
+    ) -> list[dict]:
+        pass
+
+    @overload
+    @staticmethod
+    def validate_many(
+        vacancies_params: Iterable[dict], columns: Literal[True], quarantine: Quarantine | None = None
+    ) -> dict[str, list]:
+        pass
+
+    @staticmethod
+    def validate_many(
+        vacancies_params: Iterable[dict], columns: bool = False, quarantine: Quarantine | None = None
+    ) -> list[dict] | dict[str, list]:
+        """
+        Производит выборку по ключам для списка вакансий (например, страницы выдачи API).
+        @param vacancies_params: Параметры вакансий.
+        @param columns: Вернуть столбцы (словарь: ключ - список значений всех вакансий) вместо списка словарей. В
+        столбцах отсутствующие зарплата и описание заменяются на 0, как при значении None, а отсутствующие
+        остальные ключи - на None.
+        @param quarantine: Карантин для отклонённых вакансий. Если задан, то вакансии без обязательных ключей
+        (REQUIRED_RAW_KEYS) или с неверной структурой записываются в карантин, а обработка остальных продолжается.
+        @return: Список отобранных параметров вакансий или словарь столбцов.
+        """
+        validate = Validator.validate
+        if quarantine is not None:
+            accepted = []
+            records = []
+            for vacancy_params in vacancies_params:
+                try:
+                    for key in REQUIRED_RAW_KEYS:
+                        if key not in vacancy_params:
+                            raise KeyError(key)
+                    record = validate(vacancy_params)
+                except VACANCY_ERRORS as e:
+                    quarantine.reject(vacancy_params, e)
+                else:
+                    accepted.append(vacancy_params)
+                    records.append(record)
+            if not columns:
+                return records
+            vacancies_params = accepted
+
+        elif not columns:
+            return [validate(vacancy_params) for vacancy_params in vacancies_params]
+
+        result: dict[str, list] = {key: [] for key in VALIDATED_KEYS}
+        (
+            ids,
+            names,
+            salaries_from,
+            salaries_to,
+            currencies,
+            published_at,
+            archived,
+            urls,
+            requirements,
+            responsibilities,
+            employer_ids,
+            published_ts,
+            currency_codes,
+            salaries_mid,
+            names_lower,
+        ) = result.values()
+        for vacancy_params in vacancies_params:
+            get = vacancy_params.get
+            salary = get("salary") or {}
+            snippet = get("snippet") or {}
+            employer = get("employer") or {}
+            ids.append(get("id"))
+            names.append(get("name"))
+            salaries_from.append(salary.get("from") or 0)
+            salaries_to.append(salary.get("to") or 0)
+            currencies.append(salary.get("currency", 0))
+            published_at.append(get("published_at"))
+            archived.append(get("archived"))
+            urls.append(get("apply_alternate_url"))
+            requirements.append(snippet.get("requirement", 0))
+            responsibilities.append(snippet.get("responsibility", 0))
+            employer_ids.append(employer.get("id"))
+            published_ts.append(published_timestamp(published_at[-1]))
+            currency_codes.append(currency_code(currencies[-1]))
+            salaries_mid.append(salary_midpoint(salaries_from[-1], salaries_to[-1]))
+            names_lower.append((names[-1] or "").lower())
+
+        return result
+
 
 # ---------------------------------------------------------------------------------------------------------------------
 class Vacancy:
     """Класс вакансий. Экземпляр класса представляет собой объект, созданный из элементов JSON-файла, полученного
-    в результате запроса на сайт вакансий."""
+    в результате запроса на сайт вакансий. Экземпляры класса хранятся в хранилище вакансий (класс VacancyStore,
+    модуль vacancy_store). Общий список obj_vacancies_list и методы класса для работы с ним оставлены для
+    совместимости: в список попадают только вакансии, созданные методом cast_to_object_list."""
 
     obj_vacancies_list: list = []  # Список экземпляров класса Vacancy (объектов вакансий)
 
@@ -95,8 +257,23 @@ class Vacancy:
         self.url = params["url"]
         self.requirement = params["requirement"]
         self.responsibility = params["responsibility"]
-        # Добавляем вакансию в общий список вакансий
-        Vacancy.obj_vacancies_list.append(self)
+        # Сведения о работодателе (необязательные, см. модуль employer_enricher)
+        self.employer_id = params.get("employer_id")
+        self.employer = params.get("employer")
+        # Типизированные поля для сортировки и фильтрации (вычисляются, если их нет в параметрах, например, при
+        # чтении вакансий, сохранённых в файл до их появления)
+        self.published_ts = (
+            params["published_ts"] if "published_ts" in params else published_timestamp(self.published_at)
+        )
+        self.currency_code = params["currency_code"] if "currency_code" in params else currency_code(self.currency)
+        self.salary_mid = (
+            params["salary_mid"] if "salary_mid" in params else salary_midpoint(self.salary_from, self.salary_to)
+        )
+        self.name_lower = params["name_lower"] if "name_lower" in params else self.name.lower()
+        # Зарплаты в базовой валюте (0 - не пересчитаны, см. модуль currency_converter)
+        self.salary_from_base = params.get("salary_from_base", 0)
+        self.salary_to_base = params.get("salary_to_base", 0)
+        self.salary_mid_base = params.get("salary_mid_base", 0)
 
     def __str__(self) -> str:
         """
@@ -133,11 +310,15 @@ class Vacancy:
     def __lt__(self, other) -> bool:
         """
         Осуществляет сравнение экземпляров класса по трём параметрам: начальной зарплате, конечной зарплате и \
-        валюте: первый меньше, чем второй?
+        валюте: первый меньше, чем второй? Если зарплаты обеих вакансий пересчитаны в базовую валюту (модуль
+        currency_converter), то сравниваются середины вилок зарплат в базовой валюте, и валюты могут различаться.
         @param other: Указатель на второй экземпляр класса, с которым происходит сравнение.
         @return: Булево значение результата сравнения двух вакансий по ключам salary_from и salary_to при условии\
         равенства ключей currency.
         """
+        if self.salary_mid_base and other.salary_mid_base:
+            return bool(self.salary_mid_base < other.salary_mid_base)
+
         return (
             self.currency == other.currency
             and self.salary_from < other.salary_from
@@ -147,11 +328,15 @@ class Vacancy:
     def __gt__(self, other) -> bool:
         """
         Осуществляет сравнение экземпляров класса по трём параметрам: начальной зарплате, конечной зарплате и \
-        валюте: первый больше, чем второй?
+        валюте: первый больше, чем второй? Если зарплаты обеих вакансий пересчитаны в базовую валюту (модуль
+        currency_converter), то сравниваются середины вилок зарплат в базовой валюте, и валюты могут различаться.
         @param other: Указатель на второй экземпляр класса, с которым происходит сравнение.
         @return: Булево значение результата сравнения двух вакансий по ключам salary_from и salary_to при условии\
         равенства ключей currency.
         """
+        if self.salary_mid_base and other.salary_mid_base:
+            return bool(self.salary_mid_base > other.salary_mid_base)
+
         return (
             self.currency == other.currency
             and self.salary_from > other.salary_from
@@ -159,14 +344,22 @@ class Vacancy:
         )
 
     @classmethod
-    def cast_to_object_list(cls, vacancies_data: list[dict]) -> None:
+    def cast_to_object_list(cls, vacancies_data: list[dict], quarantine: Quarantine | None = None) -> None:
         """
         Осуществляет списковое создание экземпляров класса.
         @param vacancies_data: Список вакансий в виде списка словарей для инициализации экземпляров класса.
+        @param quarantine: Карантин для отклонённых вакансий. Если задан, то вакансии, из которых не удалось создать
+        экземпляр класса, записываются в карантин, а обработка остальных продолжается.
         @return: None
         """
         for data_item in vacancies_data:
-            cls(data_item)
+            if quarantine is None:
+                cls.obj_vacancies_list.append(cls(data_item))
+                continue
+            try:
+                cls.obj_vacancies_list.append(cls(data_item))
+            except VACANCY_ERRORS as e:
+                quarantine.reject(data_item, e)
 
     @classmethod
     def print_obj_vacancies_list(cls) -> None:
@@ -178,10 +371,10 @@ class Vacancy:
             print(vacancy)
 
     @staticmethod
-    def print_vacancies_list(data: list[dict], rows_to_print: int | None = None) -> None:
+    def print_vacancies_list(data: Sequence["Vacancy | dict"], rows_to_print: int | None = None) -> None:
         """
-        Выводит на экран список вакансий (список словарей).
-        @param data: Список вакансий (список словарей).
+        Выводит на экран список вакансий (экземпляров класса Vacancy или словарей).
+        @param data: Список вакансий (например, результат сортировки или фильтрации VacancyStore).
         @param rows_to_print: Определяет сколько элементов от начала списка вывести на экран.
         @return: None
         """
@@ -212,9 +405,7 @@ class Vacancy:
         @param dicts_list: Список словарей.
         @return: Список экземпляров класса Vacancy.
         """
-        cls.obj_vacancies_list = []
-        for current_dict in dicts_list:
-            cls(current_dict)
+        cls.obj_vacancies_list = [cls(current_dict) for current_dict in dicts_list]
 
     @classmethod
     def sort_vacancies_by_keyword(cls, key_word: str, top_n: int = 1, save_result: bool = False) -> None:
@@ -257,10 +448,10 @@ class Vacancy:
 
         # Производим фильтрацию
         try:
+            words_lower = [word.lower() for word in words]
             for vacancy in tmp_vacancies_list:
-                for word in words:
-                    if word.lower() in vacancy["name"].lower():
-                        filtered_vacancies_list.append(vacancy)
+                if any(word in vacancy["name_lower"] for word in words_lower):
+                    filtered_vacancies_list.append(vacancy)
         except KeyError:
             print(f"Список слов для фильтрации '{words}' пуст!")
         else:
@@ -308,18 +499,13 @@ class Vacancy:
         @param id: Уникальный идентификатор вакансии.
         @return: None
         """
-        # Сохраним список вакансий из списка объектов вакансий
-        tmp_vacancies_list = cls.__obj_vacancies_list_to_list_dicts()
-
-        # Удалим вакансию с номером id
-        for vacancy in tmp_vacancies_list:
-            if vacancy["id"] == id:
-                tmp_vacancies_list.remove(vacancy)
+        # Удалим вакансию с номером id из списка объектов вакансий без пересоздания остальных объектов. Для
+        # поиска и удаления за O(1) используйте хранилище вакансий (метод delete класса VacancyStore).
+        for index, vacancy in enumerate(cls.obj_vacancies_list):
+            if vacancy.id == id:
+                del cls.obj_vacancies_list[index]
                 break
 
-        # Сохраним изменённый список вакансий в список объектов вакансий.
-        cls.__list_dicts_to_obj_vacancies_list(tmp_vacancies_list)
-
 
 if __name__ == "__main__":
     validator = Validator()
@@ -455,9 +641,11 @@ if __name__ == "__main__":
     print(vacancy1 == vacancy2)
     print()
 
-    print("Список вакансий формируется внутри класса")
-    print("Выведем его на экран")
-    Vacancy.print_obj_vacancies_list()
+    print("Вакансии хранятся в хранилище VacancyStore. Добавим в него обе вакансии и выведем их на экран")
+    from src.vacancy_store import VacancyStore
+
+    store = VacancyStore([vacancy1, vacancy2])
+    store.print_vacancies()
     print()
 
     print("Внутри класса Vacancy из json-объекта создадим список объектов вакансий и выведем его на экран")
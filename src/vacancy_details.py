@@ -0,0 +1,54 @@
+from src.headhunter_api import HeadHunterAPI
+from src.id_cache_fetcher import IdCacheFetcher
+
+
+class VacancyDetailsFetcher:
+    """
+    Класс для загрузки полных описаний вакансий (полное описание, ключевые навыки и т.д.) по адресу
+    "/vacancies/{id}". Описания загружаются параллельно пулом потоков и сохраняются на диск по одному файлу на
+    вакансию вместе с датой публикации (см. IdCacheFetcher). Если дата публикации вакансии не изменилась, то описание
+    берётся с диска без запроса к API.
+    """
+
+    def __init__(self, api: HeadHunterAPI, cache_dir: str = "data/details", max_workers: int = 8) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param api: Экземпляр класса HeadHunterAPI, через который выполняются запросы.
+        @param cache_dir: Каталог для хранения описаний вакансий. По умолчанию - "data/details".
+        @param max_workers: Количество потоков для загрузки описаний. По умолчанию - 8.
+        """
+        base_url = api.url.rstrip("/")
+        self.__fetcher = IdCacheFetcher(
+            api.get_json, lambda vacancy_id: f"{base_url}/{vacancy_id}", cache_dir, max_workers=max_workers
+        )
+
+    def fetch(self, vacancies: list[dict]) -> dict[str, dict]:
+        """
+        Возвращает полные описания вакансий. Вакансии с неизменившейся датой публикации берутся с диска, остальные
+        загружаются параллельно. Повторяющиеся 'id' загружаются один раз.
+        @param vacancies: Вакансии (сырые или прошедшие валидацию словари с ключами 'id' и 'published_at').
+        @return: Словарь: идентификатор вакансии - полное описание вакансии.
+        """
+        versions: dict = {}
+        for vacancy in vacancies:
+            versions.setdefault(vacancy["id"], vacancy.get("published_at"))
+
+        return self.__fetcher.fetch(versions)
+
+    def stats(self) -> dict:
+        """
+        Возвращает счётчики работы: 'fetched' - загружено из API, 'cached' - взято с диска, 'failed' - ошибки.
+        @return: Словарь счётчиков.
+        """
+        return self.__fetcher.stats()
+
+
+if __name__ == "__main__":
+    hh_api = HeadHunterAPI(per_page=20)
+    fetcher = VacancyDetailsFetcher(hh_api, max_workers=8)
+
+    hh_vacancies = hh_api.load_vacancies("Python")
+    for vacancy_id, vacancy_details in fetcher.fetch(hh_vacancies).items():
+        key_skills = [skill["name"] for skill in vacancy_details.get("key_skills", [])]
+        print(vacancy_id, vacancy_details["name"], key_skills)
+    print(fetcher.stats())
@@ -0,0 +1,343 @@
+from collections.abc import Iterable, Iterator
+from operator import attrgetter
+
+from src.interval_index import IntervalIndex
+from src.keyword_index import KeywordIndex
+from src.quarantine import Quarantine
+from src.salary_index import SalaryIndex
+from src.vacancy import VACANCY_ERRORS, Vacancy
+
+
+class VacancyStore:
+    """
+    Класс хранилища вакансий. В отличие от общего списка Vacancy.obj_vacancies_list, каждое хранилище владеет
+    своими вакансиями: вакансии добавляются и удаляются явно, а после удаления хранилища освобождаются вместе с
+    ним, поэтому в одном процессе можно держать несколько независимых хранилищ (например, по одному на ключевое
+    слово). Методы сортировки и фильтрации возвращают списки экземпляров класса Vacancy и, если установлен флаг
+    save_result, заменяют ими содержимое хранилища.
+    Вакансии хранятся в словаре 'id' - вакансия (в порядке добавления), поэтому поиск по 'id' выполняется за O(1).
+    При удалении вакансия удаляется из словаря за O(1), а из отсортированных списков индекса по зарплате - за O(n)
+    (двоичный поиск и сдвиг хвоста списка). Вакансия с уже имеющимся в хранилище 'id' заменяет прежнюю.
+    Индекс по зарплате (класс SalaryIndex) и интервальные деревья вилок зарплат (класс IntervalIndex, в исходной и
+    в базовой валюте) обновляются при добавлении и удалении вакансий, поэтому запросы по диапазону зарплат
+    выполняются без полного перебора хранилища. Так же обновляется инвертированный индекс по словам текстовых полей
+    (класс KeywordIndex), по которому выполняется фильтрация по ключевым словам.
+    """
+
+    def __init__(self, vacancies: Iterable[Vacancy] = (), text_fields: Iterable[str] = ("name",)) -> None:
+        """
+        Инициализатор экземпляра класса.
+        @param vacancies: Начальный набор вакансий. По умолчанию - пустое хранилище.
+        @param text_fields: Текстовые поля, по которым строится инвертированный индекс для фильтрации по ключевым
+        словам: 'name', 'requirement', 'responsibility'. По умолчанию - только название вакансии.
+        """
+        self.__text_fields = tuple(text_fields)
+        self.__vacancies: dict[str, Vacancy] = {}
+        self.__salary_index = SalaryIndex()
+        self.__intervals = IntervalIndex()
+        self.__base_intervals = IntervalIndex("salary_from_base", "salary_to_base")
+        self.__keywords = KeywordIndex(self.__text_fields)
+        self.extend(vacancies)
+
+    @classmethod
+    def from_dicts(
+        cls,
+        vacancies_data: Iterable[dict],
+        quarantine: Quarantine | None = None,
+        text_fields: Iterable[str] = ("name",),
+    ) -> "VacancyStore":
+        """
+        Создаёт хранилище из списка словарей (прошедших валидацию или прочитанных из файла вакансий).
+        @param vacancies_data: Список вакансий в виде списка словарей.
+        @param quarantine: Карантин для вакансий, из которых не удалось создать экземпляр класса Vacancy. Если не
+        задан, то ошибка прерывает создание хранилища.
+        @param text_fields: Текстовые поля инвертированного индекса. По умолчанию - только название вакансии.
+        @return: Экземпляр класса.
+        """
+        store = cls(text_fields=text_fields)
+        for data_item in vacancies_data:
+            if quarantine is None:
+                store.add(Vacancy(data_item))
+                continue
+            try:
+                store.add(Vacancy(data_item))
+            except VACANCY_ERRORS as e:
+                quarantine.reject(data_item, e)
+
+        return store
+
+    def __len__(self) -> int:
+        """
+        Возвращает количество вакансий в хранилище.
+        @return: Количество вакансий.
+        """
+        return len(self.__vacancies)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        """
+        Возвращает итератор вакансий хранилища в порядке добавления (или в порядке последней сохранённой сортировки).
+        @return: Итератор вакансий.
+        """
+        return iter(self.__vacancies.values())
+
+    def __contains__(self, vacancy: object) -> bool:
+        """
+        Проверяет, находится ли вакансия (этот экземпляр класса Vacancy) в хранилище.
+        @param vacancy: Экземпляр класса Vacancy.
+        @return: True, если вакансия находится в хранилище.
+        """
+        return isinstance(vacancy, Vacancy) and self.__vacancies.get(vacancy.id) is vacancy
+
+    @property
+    def normalized(self) -> bool:
+        """
+        Пересчитаны ли зарплаты вакансий хранилища в базовую валюту (модуль currency_converter): есть хотя бы одна
+        вакансия с вилкой зарплат в базовой валюте.
+        @return: True, если зарплаты пересчитаны.
+        """
+        return len(self.__base_intervals) > 0
+
+    def add(self, vacancy: Vacancy) -> None:
+        """
+        Добавляет вакансию в хранилище. Если в хранилище уже есть вакансия с таким 'id', то она заменяется.
+        @param vacancy: Экземпляр класса Vacancy.
+        @return: None
+        """
+        self.__vacancies[vacancy.id] = vacancy
+        self.__salary_index.add(vacancy)
+        self.__intervals.add(vacancy)
+        self.__base_intervals.add(vacancy)
+        self.__keywords.add(vacancy)
+
+    def extend(self, vacancies: Iterable[Vacancy]) -> None:
+        """
+        Добавляет вакансии в хранилище.
+        @param vacancies: Экземпляры класса Vacancy.
+        @return: None
+        """
+        vacancies = list(vacancies)
+        for vacancy in vacancies:
+            self.__vacancies[vacancy.id] = vacancy
+        self.__salary_index.add_many(vacancies)
+        self.__intervals.add_many(vacancies)
+        self.__base_intervals.add_many(vacancies)
+        self.__keywords.add_many(vacancies)
+
+    def remove(self, vacancy: Vacancy) -> None:
+        """
+        Удаляет вакансию (этот экземпляр класса Vacancy) из хранилища. Вакансии с такой же зарплатой, которые
+        равны ей по __eq__, не удаляются.
+        @param vacancy: Экземпляр класса Vacancy.
+        @return: None
+        """
+        if vacancy not in self:
+            raise ValueError(f"Вакансия {vacancy.id} не найдена в хранилище!")
+
+        del self.__vacancies[vacancy.id]
+        self.__salary_index.remove(vacancy.id)
+        self.__intervals.remove(vacancy.id)
+        self.__base_intervals.remove(vacancy.id)
+        self.__keywords.remove(vacancy.id)
+
+    def clear(self) -> None:
+        """
+        Удаляет все вакансии из хранилища.
+        @return: None
+        """
+        self.__vacancies = {}
+        self.__salary_index = SalaryIndex()
+        self.__intervals = IntervalIndex()
+        self.__base_intervals = IntervalIndex("salary_from_base", "salary_to_base")
+        self.__keywords = KeywordIndex(self.__text_fields)
+
+    def to_dicts(self) -> list[dict]:
+        """
+        Приводит вакансии хранилища к списку словарей (например, для записи в файл).
+        @return: Список вакансий в виде списка словарей.
+        """
+        return [dict(vacancy.__dict__) for vacancy in self.__vacancies.values()]
+
+    def __save(self, vacancies: list[Vacancy], save_result: bool) -> list[Vacancy]:
+        """
+        Заменяет содержимое хранилища результатом сортировки или фильтрации, если установлен флаг save_result и
+        результат не пустой.
+        @param vacancies: Результат сортировки или фильтрации.
+        @param save_result: Флаг сохранения результата.
+        @return: Тот же результат.
+        """
+        if save_result and vacancies:
+            self.clear()
+            self.extend(vacancies)
+
+        return vacancies
+
+    def sort_by_keyword(self, key_word: str, reverse: bool = True, save_result: bool = False) -> list[Vacancy]:
+        """
+        Сортирует вакансии по заданному атрибуту (по умолчанию - по убыванию, для ТОП вакансий по зарплате).
+        @param key_word: Атрибут вакансии, по которому производится сортировка (например, 'salary_from').
+        @param reverse: Сортировать по убыванию. По умолчанию - да.
+        @param save_result: Сохранить отсортированный список в хранилище. По умолчанию - нет.
+        @return: Отсортированный список вакансий. Пустой список, если атрибут не найден.
+        """
+        try:
+            sorted_vacancies = sorted(self.__vacancies.values(), key=attrgetter(key_word), reverse=reverse)
+        except AttributeError:
+            print(f"Ключевое слово '{key_word}' не найдено в списке вакансий!")
+            return []
+
+        return self.__save(sorted_vacancies, save_result)
+
+    def filter_by_keyword(
+        self,
+        words: list[str],
+        save_result: bool = False,
+        match_all: bool = False,
+        prefix: bool = True,
+        fields: Iterable[str] = ("name",),
+    ) -> list[Vacancy]:
+        """
+        Фильтрует вакансии по ключевым словам (без учёта регистра) с помощью инвертированного индекса (см.
+        KeywordIndex.search): слово ищется по началу слов поля ("python" - "Python/Django developer", "pythonista").
+        Вакансия попадает в результат один раз, даже если в её названии есть несколько ключевых слов.
+        @param words: Ключевые слова.
+        @param save_result: Сохранить результат фильтрации в хранилище. По умолчанию - нет.
+        @param match_all: Вакансия должна содержать все ключевые слова. По умолчанию - хотя бы одно.
+        @param prefix: Искать по началу слова. По умолчанию - да (False - только целые слова).
+        @param fields: Текстовые поля из text_fields хранилища. По умолчанию - название вакансии.
+        @return: Список вакансий в порядке хранилища.
+        """
+        filtered_vacancies = [
+            self.__vacancies[vacancy_id] for vacancy_id in self.__keywords.search(words, match_all, prefix, fields)
+        ]
+
+        return self.__save(filtered_vacancies, save_result)
+
+    def filter_by_salary_diapason(
+        self, srange: str, save_result: bool = False, base: bool | None = None
+    ) -> list[Vacancy]:
+        """
+        Фильтрует вакансии по диапазону зарплат: в результат попадают вакансии, вилка зарплат которых пересекается с
+        диапазоном (неуказанная граница вилки считается открытой, см. IntervalIndex.overlaps).
+        @param srange: Диапазон зарплат (например, "100000 - 150000").
+        @param save_result: Сохранить результат фильтрации в хранилище. По умолчанию - нет.
+        @param base: Сравнивать зарплаты в базовой валюте. По умолчанию - если зарплаты пересчитаны (см. normalized).
+        @return: Список вакансий в порядке возрастания нижней границы вилки.
+        """
+        left, right = (int(value.strip()) for value in srange.split("-"))
+        base = self.normalized if base is None else base
+        filtered_vacancies = self.salary_overlaps(left, right, base)
+
+        return self.__save(filtered_vacancies, save_result)
+
+    def salary_range(self, field: str, low: float | None = None, high: float | None = None) -> list[Vacancy]:
+        """
+        Возвращает вакансии, у которых значение поля зарплаты находится в диапазоне [low, high] (например,
+        "нижняя граница от 150000": salary_range('salary_from', low=150000)).
+        @param field: Поле зарплаты: 'salary_from', 'salary_to', 'salary_mid' или 'salary_mid_base'.
+        @param low: Нижняя граница диапазона. None - без ограничения.
+        @param high: Верхняя граница диапазона. None - без ограничения.
+        @return: Список вакансий в порядке возрастания значения поля.
+        """
+        return [self.__vacancies[vacancy_id] for vacancy_id in self.__salary_index.range(field, low, high)]
+
+    def __intervals_for(self, base: bool) -> IntervalIndex:
+        """
+        Возвращает интервальное дерево вилок зарплат.
+        @param base: Вилки в базовой валюте ('salary_from_base' и 'salary_to_base') или в валюте вакансии.
+        @return: Экземпляр класса IntervalIndex.
+        """
+        return self.__base_intervals if base else self.__intervals
+
+    def salary_overlaps(
+        self, low: float | None = None, high: float | None = None, base: bool = False
+    ) -> list[Vacancy]:
+        """
+        Возвращает вакансии, вилка зарплат которых пересекается с диапазоном [low, high] (неуказанная граница вилки
+        считается открытой).
+        @param low: Нижняя граница диапазона. None - без ограничения.
+        @param high: Верхняя граница диапазона. None - без ограничения.
+        @param base: Сравнивать зарплаты в базовой валюте. По умолчанию - нет.
+        @return: Список вакансий в порядке возрастания нижней границы вилки.
+        """
+        return [self.__vacancies[vacancy_id] for vacancy_id in self.__intervals_for(base).overlaps(low, high)]
+
+    def salary_contains(self, low: float, high: float | None = None, base: bool = False) -> list[Vacancy]:
+        """
+        Возвращает вакансии, вилка зарплат которых целиком содержит диапазон [low, high].
+        @param low: Нижняя граница диапазона.
+        @param high: Верхняя граница диапазона. None - без ограничения.
+        @param base: Сравнивать зарплаты в базовой валюте. По умолчанию - нет.
+        @return: Список вакансий в порядке возрастания нижней границы вилки.
+        """
+        return [self.__vacancies[vacancy_id] for vacancy_id in self.__intervals_for(base).contains(low, high)]
+
+    def salary_within(self, low: float, high: float | None = None, base: bool = False) -> list[Vacancy]:
+        """
+        Возвращает вакансии, вилка зарплат которых целиком находится в диапазоне [low, high].
+        @param low: Нижняя граница диапазона.
+        @param high: Верхняя граница диапазона. None - без ограничения.
+        @param base: Сравнивать зарплаты в базовой валюте. По умолчанию - нет.
+        @return: Список вакансий в порядке возрастания нижней границы вилки.
+        """
+        return [self.__vacancies[vacancy_id] for vacancy_id in self.__intervals_for(base).within(low, high)]
+
+    def get(self, id: str) -> Vacancy | None:
+        """
+        Возвращает вакансию по номеру ID.
+        @param id: Уникальный идентификатор вакансии.
+        @return: Экземпляр класса Vacancy или None, если вакансии нет в хранилище.
+        """
+        return self.__vacancies.get(id)
+
+    def delete(self, id: str) -> bool:
+        """
+        Удаляет вакансию по номеру ID.
+        @param id: Уникальный идентификатор вакансии.
+        @return: True, если вакансия была найдена и удалена.
+        """
+        vacancy = self.__vacancies.get(id)
+        if vacancy is None:
+            return False
+
+        self.remove(vacancy)
+        return True
+
+    def delete_many(self, ids: Iterable[str]) -> int:
+        """
+        Удаляет вакансии по списку ID (например, архивные вакансии) без пересоздания остальных вакансий. Индексы
+        обновляются пакетом: каждый отсортированный список индексов проходится не больше одного раза, поэтому
+        удаление k вакансий стоит O(n + k), а не O(k * n).
+        @param ids: Идентификаторы вакансий.
+        @return: Количество удалённых вакансий.
+        """
+        found_ids = [id for id in dict.fromkeys(ids) if id in self.__vacancies]
+        for id in found_ids:
+            del self.__vacancies[id]
+        self.__salary_index.remove_many(found_ids)
+        self.__intervals.remove_many(found_ids)
+        self.__base_intervals.remove_many(found_ids)
+        self.__keywords.remove_many(found_ids)
+
+        return len(found_ids)
+
+    def print_vacancies(self, rows_to_print: int | None = None) -> None:
+        """
+        Выводит на экран строковые представления вакансий хранилища.
+        @param rows_to_print: Определяет сколько вакансий от начала хранилища вывести на экран.
+        @return: None
+        """
+        Vacancy.print_vacancies_list(list(self.__vacancies.values()), rows_to_print)
+
+
+if __name__ == "__main__":
+    from src.headhunter_api import HeadHunterAPI
+    from src.vacancy import Validator
+
+    hh_api = HeadHunterAPI(per_page=100)
+    stores = {
+        keyword: VacancyStore.from_dicts(Validator.validate_many(hh_api.load_vacancies(keyword)))
+        for keyword in ("Python", "Java")
+    }
+    for keyword, store in stores.items():
+        print(f"{keyword}: {len(store)} вакансий")
+        Vacancy.print_vacancies_list(store.sort_by_keyword("salary_from"), 3)
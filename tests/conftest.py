@@ -0,0 +1,42 @@
+from src.vacancy import Vacancy
+
+
+def make_params(
+    vacancy_id: str, name: str | None = None, salary_from: int = 0, salary_to: int = 0, requirement: str | int = 0
+) -> dict:
+    """
+    Создаёт параметры вакансии (прошедшие валидацию).
+    @param vacancy_id: Идентификатор вакансии.
+    @param name: Название вакансии. По умолчанию - "Вакансия {vacancy_id}".
+    @param salary_from: Нижняя граница зарплаты (0 - не указана).
+    @param salary_to: Верхняя граница зарплаты (0 - не указана).
+    @param requirement: Требования к кандидату (0 - не указаны).
+    @return: Параметры вакансии.
+    """
+    return {
+        "id": vacancy_id,
+        "name": name if name is not None else f"Вакансия {vacancy_id}",
+        "salary_from": salary_from,
+        "salary_to": salary_to,
+        "currency": "RUR",
+        "published_at": "2024-02-16T14:58:28+0300",
+        "archived": False,
+        "url": f"https://hh.ru/vacancy/{vacancy_id}",
+        "requirement": requirement,
+        "responsibility": 0,
+    }
+
+
+def make_vacancy(
+    vacancy_id: str, name: str | None = None, salary_from: int = 0, salary_to: int = 0, requirement: str | int = 0
+) -> Vacancy:
+    """
+    Создаёт экземпляр класса Vacancy (см. make_params).
+    @param vacancy_id: Идентификатор вакансии.
+    @param name: Название вакансии. По умолчанию - "Вакансия {vacancy_id}".
+    @param salary_from: Нижняя граница зарплаты (0 - не указана).
+    @param salary_to: Верхняя граница зарплаты (0 - не указана).
+    @param requirement: Требования к кандидату (0 - не указаны).
+    @return: Экземпляр класса Vacancy.
+    """
+    return Vacancy(make_params(vacancy_id, name, salary_from, salary_to, requirement))
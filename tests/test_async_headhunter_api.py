@@ -0,0 +1,77 @@
+import asyncio
+from unittest.mock import patch, MagicMock
+
+from src.async_headhunter_api import AsyncHeadHunterAPI
+from src.vacancy import Validator
+
+
+def fake_get(
+    url: str, headers: dict | None = None, params: dict | None = None, timeout: tuple | None = None
+) -> MagicMock:
+    """
+    Заглушка для метода requests.Session.get: возвращает по одной вакансии на страницу, всего 3 страницы.
+    @param url: URL-адрес запроса.
+    @param headers: Заголовки запроса.
+    @param params: Параметры запроса.
+    @return: Заглушка ответа API.
+    """
+    response = MagicMock()
+    page = params["page"] if params else 0
+    text = params["text"] if params else ""
+    response.json.return_value = {"items": [{"id": f"{text}-{page}", "name": text}], "pages": 3, "found": 3}
+    return response
+
+
+@patch("src.headhunter_api.requests.Session.get", side_effect=fake_get)
+def test_async_load_vacancies(mock_get: MagicMock) -> None:
+    """
+    Проверяем асинхронную загрузку всех страниц выдачи в порядке страниц.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @return: None
+    """
+
+    async def run() -> list[dict]:
+        async with AsyncHeadHunterAPI(per_page=1, concurrency=2) as hh_api:
+            return await hh_api.load_vacancies("Python", pages=None)
+
+    vacancies = asyncio.run(run())
+    assert [vacancy["id"] for vacancy in vacancies] == ["Python-0", "Python-1", "Python-2"]
+    assert Validator.validate(vacancies[0]) == {"id": "Python-0", "name": "Python", "name_lower": "python"}
+
+
+@patch("src.headhunter_api.requests.Session.get", side_effect=fake_get)
+def test_async_load_many(mock_get: MagicMock) -> None:
+    """
+    Проверяем параллельную загрузку вакансий по нескольким ключевым словам.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @return: None
+    """
+
+    async def run() -> dict[str, list[dict]]:
+        async with AsyncHeadHunterAPI(per_page=1, concurrency=4) as hh_api:
+            return await hh_api.load_many(["Python", "Java"], pages=2)
+
+    results = asyncio.run(run())
+    assert [vacancy["id"] for vacancy in results["Python"]] == ["Python-0", "Python-1"]
+    assert [vacancy["id"] for vacancy in results["Java"]] == ["Java-0", "Java-1"]
+    assert mock_get.call_count == 4
+
+
+@patch("src.headhunter_api.requests.Session.get", side_effect=fake_get)
+def test_async_iter_pages_prefetch(mock_get: MagicMock) -> None:
+    """
+    Проверяем, что запросы остальных страниц запускаются до того, как первая страница отдана потребителю.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @return: None
+    """
+
+    async def run() -> list[int]:
+        calls = []
+        async with AsyncHeadHunterAPI(per_page=1, concurrency=2) as hh_api:
+            async for _ in hh_api.iter_pages("Prefetch", pages=None):
+                # Пока потребитель обрабатывает страницу, остальные страницы уже загружаются
+                await asyncio.sleep(0.2)
+                calls.append(mock_get.call_count)
+        return calls
+
+    assert asyncio.run(run()) == [3, 3, 3]
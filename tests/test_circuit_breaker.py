@@ -0,0 +1,109 @@
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from src.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from src.headhunter_api import HeadHunterAPI
+
+
+@patch("src.circuit_breaker.time.monotonic")
+def test_circuit_breaker_states(mock_monotonic: MagicMock) -> None:
+    """
+    Проверяем переходы предохранителя: замкнут - разомкнут - полуразомкнут - замкнут.
+    @param mock_monotonic: Заглушка для функции time.monotonic.
+    @return: None
+    """
+    mock_monotonic.return_value = 100.0
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    mock_monotonic.return_value = 111.0
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()  # Пробный запрос уже выполняется
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    mock_monotonic.return_value = 122.0
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@patch("src.circuit_breaker.time.monotonic")
+def test_circuit_breaker_release(mock_monotonic: MagicMock) -> None:
+    """
+    Проверяем, что ответ 429 на пробный запрос не замыкает предохранитель, а только освобождает место пробного
+    запроса, и не сбрасывает счётчик ошибок замкнутого предохранителя.
+    @param mock_monotonic: Заглушка для функции time.monotonic.
+    @return: None
+    """
+    mock_monotonic.return_value = 0.0
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    breaker.release()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    mock_monotonic.return_value = 10.0
+    assert breaker.allow_request()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+
+@patch("src.headhunter_api.time.sleep")
+@patch("src.headhunter_api.requests.Session.get")
+def test_throttled_probe_keeps_breaker_half_open(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """
+    Проверяем, что пробный запрос, на который API ответил 429, не замыкает полуразомкнутый предохранитель.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @param mock_sleep: Заглушка для функции time.sleep.
+    @return: None
+    """
+    mock_get.return_value = MagicMock(status_code=429, headers={})
+    registry = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=0)
+    registry.get("https://api.hh.ru/vacancies").record_failure()
+
+    assert HeadHunterAPI(max_retries=1, breakers=registry).get_page("Python") == {}
+    assert mock_get.call_count == 2
+    assert registry.health() == {"api.hh.ru/vacancies": "half_open"}
+
+
+def test_registry_endpoints() -> None:
+    """
+    Проверяем, что запросы к "/vacancies/{id}" относятся к одному эндпоинту, а поиск вакансий - к другому.
+    @return: None
+    """
+    registry = CircuitBreakerRegistry()
+    assert registry.endpoint("https://api.hh.ru/vacancies/93353083") == "api.hh.ru/vacancies/{id}"
+    assert registry.get("https://api.hh.ru/vacancies/1") is registry.get("https://api.hh.ru/vacancies/2")
+    assert registry.get("https://api.hh.ru/vacancies") is not registry.get("https://api.hh.ru/vacancies/1")
+    assert registry.health() == {"api.hh.ru/vacancies/{id}": "closed", "api.hh.ru/vacancies": "closed"}
+
+
+@patch("src.headhunter_api.time.sleep")
+@patch("src.headhunter_api.requests.Session.get")
+def test_fail_fast_when_open(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """
+    Проверяем, что после серии таймаутов запросы к эндпоинту не выполняются, пока предохранитель разомкнут.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @param mock_sleep: Заглушка для функции time.sleep.
+    @return: None
+    """
+    mock_get.side_effect = requests.exceptions.ReadTimeout("timeout")
+    registry = CircuitBreakerRegistry(failure_threshold=3, reset_timeout=60)
+    hh_api = HeadHunterAPI(max_retries=5, breakers=registry, timeout=(1.0, 2.0))
+
+    assert hh_api.get_page("Python") == {}
+    assert mock_get.call_count == 3
+    assert mock_get.call_args.kwargs["timeout"] == (1.0, 2.0)
+    assert registry.health() == {"api.hh.ru/vacancies": "open"}
+
+    assert hh_api.get_page("Java") == {}
+    assert mock_get.call_count == 3
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from src.currency_converter import CurrencyConverter
+from src.vacancy import Vacancy, Validator
+
+RATES = {"RUR": 1, "USD": 0.01, "KZT": 5.0}
+
+
+@pytest.fixture
+def vacancies() -> list[dict]:
+    """
+    Фикстура вакансий с зарплатами в разных валютах.
+    @return: Вакансии, прошедшие валидацию.
+    """
+    items: list[dict] = [
+        {"id": "1", "name": "Python", "salary": {"from": 100000, "to": 200000, "currency": "RUR"}},
+        {"id": "2", "name": "Go", "salary": {"from": 2000, "to": None, "currency": "USD"}},
+        {"id": "3", "name": "Java", "salary": {"from": None, "to": 500000, "currency": "KZT"}},
+        {"id": "4", "name": "Rust", "salary": {"from": 100, "to": 200, "currency": "XYZ"}},
+        {"id": "5", "name": "C++", "salary": None},
+    ]
+    return Validator.validate_many(items)
+
+
+def test_normalize(vacancies: list[dict]) -> None:
+    """
+    Проверяем пересчёт зарплат в рубли и сортировку вакансий в разных валютах по пересчитанным значениям.
+    @param vacancies: Фикстура вакансий.
+    @return: None
+    """
+    converter = CurrencyConverter(RATES)
+    converter.normalize(vacancies)
+    assert [vacancy["salary_mid_base"] for vacancy in vacancies] == [150000.0, 200000.0, 100000.0, 0, 0]
+    assert vacancies[1]["salary_from_base"] == 200000.0
+    assert vacancies[1]["salary_to_base"] == 0
+    assert converter.unknown_currencies() == {"XYZ": 1}
+
+    ranked = sorted(vacancies, key=lambda vacancy: vacancy["salary_mid_base"], reverse=True)
+    assert [vacancy["id"] for vacancy in ranked[:3]] == ["2", "1", "3"]
+
+
+def test_vacancy_comparison_in_base_currency(vacancies: list[dict]) -> None:
+    """
+    Проверяем, что вакансии в разных валютах сравниваются по зарплате в базовой валюте.
+    @param vacancies: Фикстура вакансий.
+    @return: None
+    """
+    common = {"published_at": None, "archived": False, "url": None, "requirement": 0, "responsibility": 0}
+    rub, usd = ({**common, **vacancy} for vacancy in CurrencyConverter(RATES).normalize(vacancies)[:2])
+    assert Vacancy(usd) > Vacancy(rub)
+    assert Vacancy(rub) < Vacancy(usd)
+
+
+def test_normalize_columns_and_file(vacancies: list[dict], tmpdir: str) -> None:
+    """
+    Проверяем пересчёт столбцов и загрузку курсов из файла с другой базовой валютой.
+    @param vacancies: Фикстура вакансий.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    file_name = f"{tmpdir}/rates.json"
+    with open(file_name, "w", encoding="utf-8") as file:
+        json.dump(RATES, file)
+
+    converter = CurrencyConverter.from_file(file_name, base="USD")
+    columns = {
+        key: [vacancy.get(key) for vacancy in vacancies] for key in ("salary_from", "salary_to", "currency_code")
+    }
+    converter.normalize_columns(columns)
+    assert columns["salary_mid_base"] == [1500.0, 2000.0, 1000.0, 0, 0]
+    assert converter.convert(100000, "RUR") == 1000.0
+
+    with pytest.raises(ValueError):
+        CurrencyConverter(RATES, base="EUR")
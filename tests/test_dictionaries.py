@@ -0,0 +1,100 @@
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from src.dictionaries import DictionaryCache
+from src.headhunter_api import HeadHunterAPI
+
+RESPONSES = {
+    "/dictionaries": {
+        "currency": [
+            {"code": "RUR", "name": "Рубли", "rate": 1.0},
+            {"code": "USD", "name": "Доллары", "rate": 0.0125},
+        ]
+    },
+    "/areas": [
+        {
+            "id": "113",
+            "name": "Россия",
+            "areas": [{"id": "1620", "name": "Республика Марий Эл", "areas": [{"id": "1624", "name": "Йошкар-Ола"}]}],
+        }
+    ],
+    "/professional_roles": {
+        "categories": [{"id": "11", "name": "IT", "roles": [{"id": "96", "name": "Программист"}]}]
+    },
+}
+
+
+@pytest.fixture
+def api() -> MagicMock:
+    """
+    Фикстура заглушки HeadHunterAPI, которая отдаёт справочники.
+    @return: Заглушка экземпляра класса HeadHunterAPI.
+    """
+    api = MagicMock(spec=HeadHunterAPI)
+    api.url = "https://api.hh.ru/vacancies"
+    api.get_json.side_effect = lambda url: RESPONSES[url.removeprefix("https://api.hh.ru")]
+    return api
+
+
+def test_lookups(api: MagicMock, tmpdir: str) -> None:
+    """
+    Проверяем таблицы поиска по справочникам.
+    @param api: Заглушка экземпляра класса HeadHunterAPI.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    dictionaries = DictionaryCache(api, file_name=str(tmpdir.join("dictionaries.json")))
+    assert dictionaries.currency_rate("USD") == 0.0125
+    assert dictionaries.currency_name("RUR") == "Рубли"
+    assert dictionaries.currency_rate("EUR") is None
+    assert dictionaries.area_path("1624") == ("Россия", "Республика Марий Эл", "Йошкар-Ола")
+    assert dictionaries.area_path("0") == ()
+    assert dictionaries.role_name("96") == "Программист"
+    assert api.get_json.call_count == 3
+
+
+def test_load_from_file(api: MagicMock, tmpdir: str) -> None:
+    """
+    Проверяем, что справочники читаются с диска без запросов, пока файл не устарел.
+    @param api: Заглушка экземпляра класса HeadHunterAPI.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    file_name = str(tmpdir.join("dictionaries.json"))
+    DictionaryCache(api, file_name=file_name).load()
+    api.get_json.reset_mock()
+
+    assert DictionaryCache(api, file_name=file_name).currency_rate("USD") == 0.0125
+    api.get_json.assert_not_called()
+
+    assert DictionaryCache(api, file_name=file_name, ttl=0).currency_rate("USD") == 0.0125
+    assert api.get_json.call_count == 3
+
+
+@patch("src.dictionaries.time.monotonic")
+def test_retry_after_failed_load(mock_monotonic: MagicMock, api: MagicMock, tmp_path: Path) -> None:
+    """
+    Проверяем, что после неудачной загрузки поиск не обращается к API при каждом обращении: справочники
+    загружаются заново только через retry_interval секунд, загруженные таблицы доступны, а файл не сохраняется.
+    @param mock_monotonic: Заглушка для функции time.monotonic.
+    @param api: Заглушка экземпляра класса HeadHunterAPI.
+    @param tmp_path: Временный каталог.
+    @return: None
+    """
+    mock_monotonic.return_value = 0.0
+    responses = api.get_json.side_effect
+    api.get_json.side_effect = lambda url: {} if url.endswith("/areas") else responses(url)
+    dictionaries = DictionaryCache(api, file_name=str(tmp_path / "dictionaries.json"), retry_interval=60)
+    for _ in range(100):
+        assert dictionaries.currency_rate("RUR") == 1.0
+        assert dictionaries.area_path("1624") == ()
+    assert api.get_json.call_count == 3
+    assert not (tmp_path / "dictionaries.json").exists()
+
+    api.get_json.side_effect = responses
+    mock_monotonic.return_value = 60.0
+    assert dictionaries.area_path("1624") == ("Россия", "Республика Марий Эл", "Йошкар-Ола")
+    assert dictionaries.role_name("96") == "Программист"
+    assert api.get_json.call_count == 6
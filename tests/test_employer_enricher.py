@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+from src.employer_enricher import EmployerEnricher
+from src.headhunter_api import HeadHunterAPI
+
+
+def fake_employer(url: str) -> dict:
+    """
+    Заглушка ответа API "/employers/{id}".
+    @param url: URL-адрес запроса.
+    @return: Описание работодателя.
+    """
+    employer_id = url.rsplit("/", 1)[-1]
+    return {
+        "id": employer_id,
+        "name": f"Работодатель {employer_id}",
+        "type": "company",
+        "industries": [{"id": "7.540", "name": "Разработка программного обеспечения"}],
+        "area": {"id": "1", "name": "Москва"},
+        "open_vacancies": 12,
+        "trusted": True,
+        "logo_urls": {"90": "https://hhcdn.ru/employer-logo/1.png"},
+    }
+
+
+def test_enrich(tmpdir: str) -> None:
+    """
+    Проверяем, что каждый работодатель загружается один раз, сведения добавляются во все его вакансии, а при
+    повторном запуске берутся с диска.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    api = MagicMock(spec=HeadHunterAPI)
+    api.url = "https://api.hh.ru/vacancies"
+    api.get_json.side_effect = fake_employer
+
+    vacancies: list[dict] = [
+        {"id": "1", "employer_id": "10"},
+        {"id": "2", "employer_id": "20"},
+        {"id": "3", "employer_id": "10"},
+        {"id": "4", "employer_id": None},
+    ]
+    enricher = EmployerEnricher(api, cache_dir=str(tmpdir), max_workers=2)
+    enricher.enrich(vacancies)
+    assert api.get_json.call_count == 2
+    api.get_json.assert_any_call("https://api.hh.ru/employers/10")
+    assert vacancies[0]["employer"] is vacancies[2]["employer"]
+    assert vacancies[0]["employer"] == {
+        "id": "10",
+        "name": "Работодатель 10",
+        "type": "company",
+        "industries": ["Разработка программного обеспечения"],
+        "area": "Москва",
+        "open_vacancies": 12,
+        "trusted": True,
+        "accredited_it_employer": None,
+    }
+    assert vacancies[3]["employer"] is None
+
+    enricher = EmployerEnricher(api, cache_dir=str(tmpdir), max_workers=2)
+    assert set(enricher.fetch(["10", "20", "10"])) == {"10", "20"}
+    assert api.get_json.call_count == 2
+    assert enricher.stats() == {"fetched": 0, "cached": 2, "failed": 0}
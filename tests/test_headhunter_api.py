@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import patch, MagicMock
+from src.circuit_breaker import CircuitBreakerRegistry
 from src.headhunter_api import HeadHunterAPI
 
 
@@ -12,27 +13,33 @@ def hh_api() -> HeadHunterAPI:
     return HeadHunterAPI()
 
 
-@patch("src.headhunter_api.requests.get")
+@patch("src.headhunter_api.requests.Session.get")
 def test_connect_to_api(mock_get: MagicMock, hh_api: MagicMock) -> None:
     """
-    Проверяем подключение к API.
-    @param mock_get: Заглушка для метода requests.get.
+    Проверяем подключение к API: выполняется один запрос с параметрами поиска, без предварительного запроса-пробы.
+    @param mock_get: Заглушка для метода requests.Session.get.
     @param hh_api: Заглушка для экземпляра класса HeadHunterAPI.
     @return:
     """
     mock_response = mock_get.return_value  # Заглушка для имитации валидного ответа.
     mock_response.raise_for_status.return_value = None  # Заглушка для имитации ответа None из метода __connect_to_api.
 
-    response = hh_api._HeadHunterAPI__connect_to_api()
+    params = {"text": "Python", "page": 0}
+    response = hh_api._HeadHunterAPI__connect_to_api(params)
     assert response is not None
-    mock_get.assert_called_once_with(hh_api._HeadHunterAPI__url)
+    mock_get.assert_called_once_with(
+        hh_api._HeadHunterAPI__url,
+        headers=hh_api._HeadHunterAPI__headers,
+        params=params,
+        timeout=hh_api._HeadHunterAPI__timeout,
+    )
 
 
-@patch("src.headhunter_api.requests.get")
+@patch("src.headhunter_api.requests.Session.get")
 def test_load_vacancies(mock_get: MagicMock, hh_api: MagicMock) -> None:
     """
     Проверяем получение данных из API.
-    @param mock_get: Заглушка для метода requests.get.
+    @param mock_get: Заглушка для метода requests.Session.get.
     @param hh_api: Заглушка для экземпляра класса HeadHunterAPI.
     @return: None
     """
@@ -41,6 +48,7 @@ def test_load_vacancies(mock_get: MagicMock, hh_api: MagicMock) -> None:
     mock_response.json.return_value = {"items": [{"id": 1, "name": "Охраняющий"}]}
 
     vacancies = hh_api.load_vacancies("Python")
+    assert mock_get.call_count == 1
     assert len(vacancies) == 1
     assert vacancies[0]["id"] == 1
     assert vacancies[0]["name"] == "Охраняющий"
@@ -48,4 +56,128 @@ def test_load_vacancies(mock_get: MagicMock, hh_api: MagicMock) -> None:
         hh_api._HeadHunterAPI__url,
         headers=hh_api._HeadHunterAPI__headers,
         params=hh_api._HeadHunterAPI__params,
+        timeout=hh_api._HeadHunterAPI__timeout,
     )
+
+
+@patch("src.headhunter_api.requests.Session.get")
+def test_load_vacancies_all_pages(mock_get: MagicMock) -> None:
+    """
+    Проверяем загрузку всех страниц выдачи и объединение вакансий в порядке страниц.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @return: None
+    """
+
+    def fake_get(
+        url: str, headers: dict | None = None, params: dict | None = None, timeout: tuple | None = None
+    ) -> MagicMock:
+        response = MagicMock()
+        page = params["page"] if params else 0
+        response.json.return_value = {"items": [{"id": page}], "pages": 3, "found": 3}
+        return response
+
+    mock_get.side_effect = fake_get
+    hh_api = HeadHunterAPI(per_page=1, max_workers=2)
+
+    vacancies = hh_api.load_vacancies("Python", pages=None)
+    assert [vacancy["id"] for vacancy in vacancies] == [0, 1, 2]
+
+    vacancies = hh_api.load_vacancies("Python", pages=2)
+    assert [vacancy["id"] for vacancy in vacancies] == [0, 1]
+
+
+def test_session_is_shared() -> None:
+    """
+    Проверяем, что экземпляры класса с одним хостом и размером пула используют общую сессию.
+    @return: None
+    """
+    hh_api_1 = HeadHunterAPI(pool_size=5)
+    hh_api_2 = HeadHunterAPI(pool_size=5)
+    hh_api_3 = HeadHunterAPI(pool_size=20)
+    assert hh_api_1.session is hh_api_2.session
+    assert hh_api_1.session is not hh_api_3.session
+
+
+@patch("src.headhunter_api.time.sleep")
+@patch("src.headhunter_api.requests.Session.get")
+def test_load_vacancies_retry(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """
+    Проверяем повтор запроса после ответа 429 с паузой из заголовка Retry-After.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @param mock_sleep: Заглушка для функции time.sleep.
+    @return: None
+    """
+    throttled = MagicMock(status_code=429, headers={"Retry-After": "2"})
+    success = MagicMock(status_code=200)
+    success.json.return_value = {"items": [{"id": 1}]}
+    mock_get.side_effect = [throttled, success]
+
+    vacancies = HeadHunterAPI(max_retries=2).load_vacancies("Python")
+    assert vacancies == [{"id": 1}]
+    assert mock_get.call_count == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+
+@patch("src.headhunter_api.time.sleep")
+@patch("src.headhunter_api.requests.Session.get")
+def test_load_vacancies_retries_exhausted(mock_get: MagicMock, mock_sleep: MagicMock) -> None:
+    """
+    Проверяем, что после исчерпания повторов метод возвращает пустой список.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @param mock_sleep: Заглушка для функции time.sleep.
+    @return: None
+    """
+    mock_get.return_value = MagicMock(status_code=503, headers={})
+
+    assert HeadHunterAPI(max_retries=2, breakers=CircuitBreakerRegistry()).load_vacancies("Python") == []
+    assert mock_get.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@patch("src.headhunter_api.AdaptiveConcurrency.on_throttle")
+@patch("src.headhunter_api.time.sleep")
+@patch("src.headhunter_api.requests.Session.get")
+def test_throttle_statuses(mock_get: MagicMock, mock_sleep: MagicMock, mock_throttle: MagicMock) -> None:
+    """
+    Проверяем, что количество одновременных запросов уменьшается только при ответах 429/503, а не при ошибках 5xx.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @param mock_sleep: Заглушка для функции time.sleep.
+    @param mock_throttle: Заглушка для метода AdaptiveConcurrency.on_throttle.
+    @return: None
+    """
+    success = MagicMock(status_code=200)
+    success.json.return_value = {"items": []}
+    mock_get.side_effect = [MagicMock(status_code=500, headers={}), MagicMock(status_code=502, headers={}), success]
+    HeadHunterAPI(max_retries=2, breakers=CircuitBreakerRegistry()).load_vacancies("Python")
+    mock_throttle.assert_not_called()
+
+    mock_get.side_effect = [MagicMock(status_code=503, headers={}), MagicMock(status_code=429, headers={}), success]
+    HeadHunterAPI(max_retries=2, breakers=CircuitBreakerRegistry()).load_vacancies("Python")
+    assert mock_throttle.call_count == 2
+
+
+@patch("src.headhunter_api.requests.Session.get")
+def test_iter_vacancies(mock_get: MagicMock) -> None:
+    """
+    Проверяем, что генератор отдаёт вакансии в порядке страниц и не загружает страницы дальше окна из max_workers.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @return: None
+    """
+
+    def fake_get(
+        url: str, headers: dict | None = None, params: dict | None = None, timeout: tuple | None = None
+    ) -> MagicMock:
+        response = MagicMock()
+        page = params["page"] if params else 0
+        response.json.return_value = {"items": [{"id": page}, {"id": page + 0.5}], "pages": 10, "found": 20}
+        return response
+
+    mock_get.side_effect = fake_get
+    hh_api = HeadHunterAPI(per_page=2, max_workers=2)
+
+    vacancies = hh_api.iter_vacancies("Python", pages=None)
+    assert next(vacancies) == {"id": 0}
+    assert mock_get.call_count <= 3
+    vacancies.close()
+
+    assert [vacancy["id"] for vacancy in hh_api.iter_vacancies("Python", pages=3)] == [0, 0.5, 1, 1.5, 2, 2.5]
@@ -0,0 +1,99 @@
+import json
+import os
+
+from typing import Any
+from unittest.mock import MagicMock
+
+from src.id_cache_fetcher import IdCacheFetcher
+
+
+def make_fetcher(tmpdir: str, **kwargs: Any) -> tuple:
+    """
+    Создаёт загрузчик с поддельной функцией запроса к API.
+    @param tmpdir: Временный каталог.
+    @param kwargs: Параметры загрузчика.
+    @return: Пара (поддельная функция запроса, загрузчик).
+    """
+    get_json = MagicMock(side_effect=lambda url: {"id": url.rsplit("/", 1)[-1]})
+    fetcher = IdCacheFetcher(
+        get_json, lambda resource_id: f"https://api.hh.ru/items/{resource_id}", str(tmpdir), **kwargs
+    )
+    return get_json, fetcher
+
+
+def test_fetch_invalid_ids(tmpdir: str) -> None:
+    """
+    Проверяем, что идентификаторы не из цифр не загружаются, не становятся путями к файлам и считаются ошибками.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    get_json, fetcher = make_fetcher(tmpdir)
+    result = fetcher.fetch({"1": None, "../secret": None, "2/3": None, "": None})
+
+    assert result == {"1": {"id": "1"}}
+    get_json.assert_called_once_with("https://api.hh.ru/items/1")
+    assert os.listdir(str(tmpdir)) == ["1.json"]
+    assert fetcher.stats() == {"fetched": 1, "cached": 0, "failed": 3}
+
+
+def test_fetch_malformed_cache(tmpdir: str) -> None:
+    """
+    Проверяем, что повреждённые записи на диске (не JSON, без нужных ключей, не словарь) загружаются заново.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    files = {"1": "{not json", "2": json.dumps({"data": {"id": "2"}}), "3": json.dumps([1, 2, 3])}
+    for resource_id, content in files.items():
+        with open(os.path.join(str(tmpdir), f"{resource_id}.json"), "w", encoding="utf-8") as file:
+            file.write(content)
+
+    get_json, fetcher = make_fetcher(tmpdir)
+    result = fetcher.fetch(dict.fromkeys(files))
+
+    assert result == {resource_id: {"id": resource_id} for resource_id in files}
+    assert get_json.call_count == 3
+    assert fetcher.stats() == {"fetched": 3, "cached": 0, "failed": 0}
+
+
+def test_fetch_version_and_ttl(tmpdir: str) -> None:
+    """
+    Проверяем, что запись на диске используется, пока совпадает её версия и она не устарела.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    get_json, fetcher = make_fetcher(tmpdir, ttl=3600)
+    fetcher.fetch({"1": "v1", "2": "v1"})
+    assert get_json.call_count == 2
+
+    path = os.path.join(str(tmpdir), "2.json")
+    with open(path, "r", encoding="utf-8") as file:
+        entry = json.load(file)
+    entry["fetched_at"] -= 7200
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(entry, file)
+
+    get_json, fetcher = make_fetcher(tmpdir, ttl=3600)
+    fetcher.fetch({"1": "v2", "2": "v1"})
+    assert sorted(call.args[0] for call in get_json.call_args_list) == [
+        "https://api.hh.ru/items/1",
+        "https://api.hh.ru/items/2",
+    ]
+
+    get_json, fetcher = make_fetcher(tmpdir, ttl=3600)
+    fetcher.fetch({"1": "v2", "2": "v1"})
+    get_json.assert_not_called()
+    assert fetcher.stats() == {"fetched": 0, "cached": 2, "failed": 0}
+
+
+def test_fetch_failed_response(tmpdir: str) -> None:
+    """
+    Проверяем, что неудачный запрос (пустой ответ) не сохраняется на диск и считается ошибкой.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    get_json = MagicMock(return_value={})
+    fetcher = IdCacheFetcher(get_json, lambda resource_id: resource_id, str(tmpdir))
+
+    assert fetcher.fetch({"1": None}) == {}
+    assert os.listdir(str(tmpdir)) == []
+    assert fetcher.stats() == {"fetched": 0, "cached": 0, "failed": 1}
@@ -0,0 +1,154 @@
+import random
+
+import pytest
+
+from src.interval_index import IntervalIndex
+from src.vacancy import Vacancy
+from tests.conftest import make_vacancy
+
+
+@pytest.fixture
+def index() -> IntervalIndex:
+    """
+    Фикстура интервального дерева вилок зарплат.
+    @return: Экземпляр класса IntervalIndex.
+    """
+    index = IntervalIndex()
+    for vacancy in (
+        make_vacancy("1", salary_from=100000, salary_to=150000),
+        make_vacancy("2", salary_from=200000, salary_to=300000),
+        make_vacancy("3", salary_from=120000),
+        make_vacancy("4", salary_to=110000),
+        make_vacancy("5"),
+        make_vacancy("6", salary_from=160000, salary_to=180000),
+    ):
+        index.add(vacancy)
+    return index
+
+
+def test_overlaps(index: IntervalIndex) -> None:
+    """
+    Проверяем поиск вакансий, вилка которых пересекается с диапазоном (неуказанная граница - открытая).
+    @param index: Фикстура интервального дерева.
+    @return: None
+    """
+    assert len(index) == 5
+    assert index.overlaps(105000, 125000) == ["4", "1", "3"]
+    assert index.overlaps(400000, 500000) == ["3"]
+    assert index.overlaps(10000, 20000) == ["4"]
+    assert index.overlaps(low=170000) == ["3", "6", "2"]
+    assert index.overlaps() == ["4", "1", "3", "6", "2"]
+
+
+def test_contains_and_within(index: IntervalIndex) -> None:
+    """
+    Проверяем поиск вакансий, вилка которых содержит диапазон или находится в диапазоне.
+    @param index: Фикстура интервального дерева.
+    @return: None
+    """
+    assert index.contains(120000, 140000) == ["1", "3"]
+    assert index.contains(100000, 105000) == ["4", "1"]
+    assert index.contains(250000) == ["3"]
+    assert index.within(100000, 200000) == ["1", "6"]
+    assert index.within(150000) == ["6", "2"]
+    assert index.within(0, 120000) == ["4"]
+
+
+def test_incremental_updates(index: IntervalIndex) -> None:
+    """
+    Проверяем, что дерево обновляется при добавлении, замене и удалении вакансий и совпадает с полным перебором.
+    @param index: Фикстура интервального дерева.
+    @return: None
+    """
+    index.remove("1")
+    index.remove("404")
+    index.add(make_vacancy("3", salary_from=50000, salary_to=60000))
+    index.add(make_vacancy("6"))
+    assert len(index) == 3
+    assert index.overlaps(105000, 125000) == ["4"]
+
+    generator = random.Random(1)
+    vacancies = {}
+    for number in range(500):
+        vacancy = make_vacancy(
+            f"r{number}",
+            salary_from=generator.choice([0, 1, 2, 3]) * 50000,
+            salary_to=generator.choice([0, 4, 5, 6]) * 50000,
+        )
+        vacancies[vacancy.id] = vacancy
+        index.add(vacancy)
+    for number in range(0, 500, 3):
+        index.remove(f"r{number}")
+        del vacancies[f"r{number}"]
+    for vacancy_id in ("2", "3", "4"):
+        index.remove(vacancy_id)
+
+    def interval(vacancy: Vacancy) -> tuple:
+        """
+        Определяет вилку зарплат вакансии (неуказанная граница - открытая).
+        @param vacancy: Экземпляр класса Vacancy.
+        @return: Пара (нижняя граница, верхняя граница).
+        """
+        return vacancy.salary_from, vacancy.salary_to or float("inf")
+
+    intervals = {
+        vacancy.id: interval(vacancy) for vacancy in vacancies.values() if vacancy.salary_from or vacancy.salary_to
+    }
+    for low, high in ((0, 40000), (60000, 140000), (210000, 260000), (300000, 400000)):
+        assert set(index.overlaps(low, high)) == {i for i, (s, e) in intervals.items() if s <= high and e >= low}
+        assert set(index.contains(low, high)) == {i for i, (s, e) in intervals.items() if s <= low and e >= high}
+        assert set(index.within(low, high)) == {i for i, (s, e) in intervals.items() if s >= low and e <= high}
+
+
+def test_add_many(index: IntervalIndex) -> None:
+    """
+    Проверяем пакетное добавление вакансий, в том числе с 'id', которые уже есть в дереве или повторяются в пакете.
+    @param index: Фикстура интервального дерева.
+    @return: None
+    """
+    index.add_many(
+        [
+            make_vacancy("7", salary_from=90000, salary_to=95000),
+            make_vacancy("2"),
+            make_vacancy("7", salary_from=80000, salary_to=85000),
+        ]
+    )
+    assert len(index) == 5
+    assert index.overlaps(80000, 100000) == ["4", "7", "1"]
+    assert index.overlaps(low=250000) == ["3"]
+
+    index.remove("7")
+    index.add(make_vacancy("8", salary_to=90000))
+    assert index.overlaps(80000, 100000) == ["4", "8", "1"]
+
+
+def test_add_many_incremental(index: IntervalIndex) -> None:
+    """
+    Проверяем пакетное добавление в заполненное дерево: вакансии добавляются по одной, прежние заменяются.
+    @param index: Фикстура интервального дерева.
+    @return: None
+    """
+    index.add_many(
+        [
+            make_vacancy("7", salary_from=90000),
+            make_vacancy("1"),
+            make_vacancy("8", salary_from=500000, salary_to=600000),
+        ]
+    )
+    index.add_many([make_vacancy("7", salary_from=95000, salary_to=96000)])
+    assert len(index) == 6
+    assert index.overlaps(90000, 100000) == ["4", "7"]
+    assert index.overlaps(low=550000) == ["3", "8"]
+
+
+def test_remove_many(index: IntervalIndex) -> None:
+    """
+    Проверяем пакетное удаление вакансий из дерева и из списка вилок без верхней границы.
+    @param index: Фикстура интервального дерева.
+    @return: None
+    """
+    index.add_many(make_vacancy(f"r{number}", salary_from=100000 + number) for number in range(1000))
+    index.remove_many([f"r{number}" for number in range(1, 1000)] + ["1", "404"])
+    assert len(index) == 5
+    assert index.overlaps() == ["4", "r0", "3", "6", "2"]
+    assert index.overlaps(400000) == ["r0", "3"]
@@ -0,0 +1,119 @@
+import pytest
+
+from src.keyword_index import TEXT_FIELDS, KeywordIndex, tokenize
+from tests.conftest import make_vacancy
+
+
+@pytest.fixture
+def index() -> KeywordIndex:
+    """
+    Фикстура инвертированного индекса.
+    @return: Экземпляр класса KeywordIndex.
+    """
+    index = KeywordIndex(TEXT_FIELDS)
+    index.add_many(
+        [
+            make_vacancy("1", "Python Developer", requirement="Опыт работы с Django"),
+            make_vacancy("2", "Senior Python/Django developer"),
+            make_vacancy("3", "Java стажер", requirement="Знание Python будет плюсом"),
+            make_vacancy("4", "JavaScript developer"),
+        ]
+    )
+    return index
+
+
+def test_tokenize() -> None:
+    """
+    Проверяем разбиение текста на слова.
+    @return: None
+    """
+    assert tokenize("Senior Python/Django developer") == ["senior", "python", "django", "developer"]
+    assert tokenize("Java-стажёр (C++)") == ["java", "стажёр", "c"]
+    assert tokenize(None) == []
+    assert tokenize(0) == []
+
+
+def test_search(index: KeywordIndex) -> None:
+    """
+    Проверяем поиск по ключевым словам: OR, AND, по началу слова и по целым словам, по разным полям.
+    @param index: Фикстура инвертированного индекса.
+    @return: None
+    """
+    assert index.search(["python", "DJANGO"]) == ["1", "2"]
+    assert index.search(["python", "developer"], match_all=True) == ["1", "2"]
+    assert index.search(["java"]) == ["3", "4"]
+    assert index.search(["java"], prefix=False) == ["3"]
+    assert index.search(["senior developer"]) == ["2"]
+    assert index.search(["python"], fields=("name", "requirement")) == ["1", "2", "3"]
+    assert index.search(["django"], match_all=True, fields=("requirement",)) == ["1"]
+    assert index.search(["go"]) == []
+    assert index.search([]) == []
+    with pytest.raises(ValueError):
+        index.search(["python"], fields=("description",))
+
+
+def test_incremental_updates(index: KeywordIndex) -> None:
+    """
+    Проверяем, что индекс обновляется при добавлении, замене и удалении вакансий.
+    @param index: Фикстура инвертированного индекса.
+    @return: None
+    """
+    index.remove("2")
+    index.remove("404")
+    assert len(index) == 3
+    assert index.search(["django"]) == []
+    assert index.search(["sen"]) == []
+
+    index.add(make_vacancy("5", "Golang developer"))
+    index.add(make_vacancy("1", "Django Team Lead"))
+    assert len(index) == 4
+    assert index.search(["django", "go"]) == ["1", "5"]
+    assert index.search(["python"]) == []
+    assert index.search(["developer"]) == ["4", "5"]
+
+
+def test_fields() -> None:
+    """
+    Проверяем, что по умолчанию индексируется только название вакансии, а неизвестные поля не индексируются.
+    @return: None
+    """
+    index = KeywordIndex()
+    index.add(make_vacancy("1", "Python Developer", requirement="Опыт работы с Django"))
+    assert index.search(["python"]) == ["1"]
+    with pytest.raises(ValueError):
+        index.search(["django"], fields=("requirement",))
+    with pytest.raises(ValueError):
+        KeywordIndex(["description"])
+
+
+def test_add_many_new_tokens(index: KeywordIndex) -> None:
+    """
+    Проверяем, что новые слова пакета, добавленного в заполненный индекс, находятся поиском по началу слова.
+    @param index: Фикстура инвертированного индекса.
+    @return: None
+    """
+    index.add_many([make_vacancy("5", "Kotlin developer"), make_vacancy("6", "Kotlin/Java стажер")])
+    index.add_many([make_vacancy("7", "Javac")])
+    assert index.search(["kot"]) == ["5", "6"]
+    assert index.search(["java"]) == ["3", "4", "6", "7"]
+    assert index.search(["стаж"], match_all=True) == ["3", "6"]
+
+
+def test_add_many_duplicate_ids(index: KeywordIndex) -> None:
+    """
+    Проверяем, что повторяющийся 'id' внутри пакета не портит отсортированные списки слов: в индекс попадает
+    последняя версия вакансии, а слова остальных вакансий не теряются.
+    @param index: Фикстура инвертированного индекса.
+    @return: None
+    """
+    index.add_many([make_vacancy("5", "Scala engineer")])
+    index.add_many([make_vacancy("6", "Rust"), make_vacancy("6", "Rust developer")])
+    assert index.search(["scala"]) == ["5"]
+    assert index.search(["engineer"]) == ["5"]
+    assert index.search(["rust"], match_all=True) == ["6"]
+    assert index.search(["rust developer"]) == ["6"]
+
+    empty = KeywordIndex()
+    empty.add_many([make_vacancy("2", "Rust"), make_vacancy("2", "Rust")])
+    assert empty.search(["rust"]) == ["2"]
+    assert len(empty) == 1
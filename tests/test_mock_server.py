@@ -0,0 +1,100 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.headhunter_api import HeadHunterAPI
+from src.mock_server import CassetteRecorder, MockHeadHunterServer
+
+
+@pytest.fixture
+def cassette_dir(tmpdir: str) -> str:
+    """
+    Фикстура кассеты с тремя страницами выдачи по запросу 'Python' (по одной вакансии на странице).
+    @param tmpdir: Временный каталог.
+    @return: Путь к каталогу кассеты.
+    """
+    recorder = CassetteRecorder(str(tmpdir))
+    for page in range(3):
+        params = {"text": "Python", "page": page, "per_page": 1, "only_with_salary": True}
+        body = {"items": [{"id": str(page), "name": "Python"}], "pages": 3, "found": 3}
+        recorder.save("/vacancies", params, 200, json.dumps(body))
+    return str(tmpdir)
+
+
+def test_replay(cassette_dir: str) -> None:
+    """
+    Проверяем, что HeadHunterAPI загружает все страницы выдачи с локального сервера.
+    @param cassette_dir: Путь к каталогу кассеты.
+    @return: None
+    """
+    with MockHeadHunterServer(cassette_dir) as server:
+        hh_api = HeadHunterAPI(url=server.url, per_page=1, max_workers=2)
+        vacancies = hh_api.load_vacancies("Python", pages=None)
+        stats = server.stats()
+
+    assert [vacancy["id"] for vacancy in vacancies] == ["0", "1", "2"]
+    assert stats["served"] == 3
+
+
+def test_throttle_injection(cassette_dir: str) -> None:
+    """
+    Проверяем, что сервер отвечает 429 с заголовком Retry-After, а HeadHunterAPI повторяет запрос.
+    @param cassette_dir: Путь к каталогу кассеты.
+    @return: None
+    """
+    with MockHeadHunterServer(cassette_dir, throttle_rate=0.5, retry_after=0, seed=3) as server:
+        hh_api = HeadHunterAPI(url=server.url, per_page=1, max_workers=2, max_retries=10, backoff=0.0)
+        vacancies = hh_api.load_vacancies("Python", pages=None)
+        stats = server.stats()
+
+    assert len(vacancies) == 3
+    assert stats["throttled"] > 0
+    assert stats["requests"] == stats["served"] + stats["throttled"]
+
+
+def test_recorder(tmpdir: str) -> None:
+    """
+    Проверяем, что записанный ответ отдаётся сервером по тому же пути и параметрам запроса на другом хосте.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    response = MagicMock(url="https://api.hh.ru/vacancies?text=Java&page=0", status_code=200, text='{"items": []}')
+    CassetteRecorder(str(tmpdir))(response)
+
+    with MockHeadHunterServer(str(tmpdir)) as server:
+        hh_api = HeadHunterAPI(url=server.url)
+        assert hh_api.get_json(server.url, {"page": 0, "text": "Java"}) == {"items": []}
+        assert hh_api.get_json(server.url, {"page": 1, "text": "Java"}) == {}
+
+
+def test_recorder_skips_unsuccessful_responses(tmpdir: str) -> None:
+    """
+    Проверяем, что ответы 429, 503 и 304 не затирают записанную страницу.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    recorder = CassetteRecorder(str(tmpdir))
+    url = "https://api.hh.ru/vacancies?text=Java&page=0"
+    recorder(MagicMock(url=url, status_code=200, text='{"items": [{"id": "1"}]}'))
+    for status_code, text in ((429, '{"errors": []}'), (503, '{"errors": []}'), (304, "")):
+        recorder(MagicMock(url=url, status_code=status_code, text=text))
+
+    with MockHeadHunterServer(str(tmpdir)) as server:
+        hh_api = HeadHunterAPI(url=server.url)
+        assert hh_api.get_json(server.url, {"page": 0, "text": "Java"}) == {"items": [{"id": "1"}]}
+
+
+def test_recorder_detach(tmpdir: str) -> None:
+    """
+    Проверяем, что запись отключается от общей сессии при выходе из контекстного менеджера.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    recorder = CassetteRecorder(str(tmpdir))
+    hh_api = HeadHunterAPI(url="https://api.hh.ru/vacancies", pool_size=3)
+    other_api = HeadHunterAPI(url="https://api.hh.ru/vacancies", pool_size=3)
+    with recorder.recording(hh_api):
+        assert recorder in other_api.session.hooks["response"]
+    assert recorder not in other_api.session.hooks["response"]
+    recorder.detach(hh_api)
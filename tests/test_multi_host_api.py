@@ -0,0 +1,37 @@
+import json
+
+from src.mock_server import CassetteRecorder, MockHeadHunterServer
+from src.multi_host_api import MultiHostAPI
+
+
+def make_cassette(cassette_dir: str, ids: list[str]) -> None:
+    """
+    Записывает в кассету одну страницу выдачи по запросу 'Python'.
+    @param cassette_dir: Путь к каталогу кассеты.
+    @param ids: Идентификаторы вакансий на странице.
+    @return: None
+    """
+    params = {"text": "Python", "page": 0, "per_page": 10, "only_with_salary": True}
+    body = {"items": [{"id": vacancy_id} for vacancy_id in ids], "pages": 1, "found": len(ids)}
+    CassetteRecorder(cassette_dir).save("/vacancies", params, 200, json.dumps(body))
+
+
+def test_multi_host_load_vacancies(tmpdir: str) -> None:
+    """
+    Проверяем параллельную загрузку вакансий с двух сайтов и объединение вакансий без повторов.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    make_cassette(str(tmpdir.join("ru")), ["1", "2"])
+    make_cassette(str(tmpdir.join("kz")), ["2", "3"])
+
+    with (
+        MockHeadHunterServer(str(tmpdir.join("ru"))) as server_ru,
+        MockHeadHunterServer(str(tmpdir.join("kz"))) as server_kz,
+    ):
+        multi_api = MultiHostAPI([server_ru.url, server_kz.url], per_page=10, rate=100)
+        by_host = multi_api.load_by_host("Python")
+        vacancies = multi_api.load_vacancies("Python")
+
+    assert [vacancy["id"] for vacancy in by_host[server_kz.url]] == ["2", "3"]
+    assert [vacancy["id"] for vacancy in vacancies] == ["1", "2", "3"]
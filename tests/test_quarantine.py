@@ -0,0 +1,91 @@
+import pytest
+
+from src.quarantine import Quarantine, failure_reason
+from src.vacancy import Vacancy, Validator
+
+
+@pytest.fixture
+def raw_vacancies() -> list:
+    """
+    Фикстура сырых вакансий, среди которых есть испорченные.
+    @return: Список сырых вакансий.
+    """
+    valid = {
+        "id": "1",
+        "name": "Python Developer",
+        "salary": None,
+        "published_at": "2024-02-16T14:58:28+0300",
+        "archived": False,
+        "apply_alternate_url": "https://hh.ru/applicant/vacancy_response?vacancyId=1",
+        "snippet": None,
+    }
+    return [
+        valid,
+        {key: value for key, value in valid.items() if key != "salary"},
+        {**valid, "id": "3", "salary": "100000"},
+        None,
+        {**valid, "id": "5"},
+    ]
+
+
+def test_validate_many_with_quarantine(raw_vacancies: list, tmpdir: str) -> None:
+    """
+    Проверяем, что испорченные вакансии записываются в карантин с причиной, а остальные обрабатываются.
+    @param raw_vacancies: Фикстура сырых вакансий.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    quarantine = Quarantine(f"{tmpdir}/quarantine.jsonl")
+    validated = Validator.validate_many(raw_vacancies, quarantine=quarantine)
+    assert [vacancy["id"] for vacancy in validated] == ["1", "5"]
+    assert quarantine.stats() == {"missing_key:salary": 1, "invalid_type": 2}
+    assert len(quarantine) == 3
+
+    records = quarantine.read()
+    assert [record["reason"] for record in records] == ["missing_key:salary", "invalid_type", "invalid_type"]
+    assert records[1]["item"]["id"] == "3"
+    assert records[2]["item"] is None
+
+    columns = Validator.validate_many(raw_vacancies, columns=True, quarantine=quarantine)
+    assert columns["id"] == ["1", "5"]
+    assert len(quarantine) == 6
+
+
+def test_cast_to_object_list_with_quarantine(tmpdir: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Проверяем, что ошибка создания одного экземпляра класса Vacancy не прерывает создание остальных.
+    @param tmpdir: Временный каталог.
+    @param monkeypatch: Фикстура для подмены общего списка вакансий на время теста.
+    @return: None
+    """
+    monkeypatch.setattr(Vacancy, "obj_vacancies_list", [])
+    params = {
+        "id": "1",
+        "name": "Python Developer",
+        "salary_from": 0,
+        "salary_to": 0,
+        "currency": 0,
+        "published_at": None,
+        "archived": False,
+        "url": None,
+        "requirement": 0,
+        "responsibility": 0,
+    }
+    quarantine = Quarantine(f"{tmpdir}/quarantine.jsonl")
+    Vacancy.cast_to_object_list([params, {"id": "2"}, {**params, "id": "3"}], quarantine=quarantine)
+    assert [vacancy.id for vacancy in Vacancy.obj_vacancies_list] == ["1", "3"]
+    assert quarantine.stats() == {"missing_key:name": 1}
+
+    with pytest.raises(KeyError):
+        Vacancy.cast_to_object_list([{"id": "2"}])
+
+
+def test_failure_reason() -> None:
+    """
+    Проверяем определение типа ошибки.
+    @return: None
+    """
+    assert failure_reason(KeyError("id")) == "missing_key:id"
+    assert failure_reason(AttributeError("x")) == "invalid_type"
+    assert failure_reason(ValueError("x")) == "invalid_value"
+    assert failure_reason(ZeroDivisionError()) == "ZeroDivisionError"
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.headhunter_api import HeadHunterAPI
+from src.query_sharder import DATE_FORMAT, QuerySharder
+
+
+def fake_found(keyword: str, page: int, filters: dict) -> dict:
+    """
+    Заглушка для метода get_page: 100 вакансий в день, в регионе '2' вакансий нет.
+    @param keyword: Ключевое слово для поиска вакансий.
+    @param page: Номер страницы выдачи.
+    @param filters: Параметры поиска части запроса.
+    @return: Страница выдачи с количеством найденных вакансий.
+    """
+    if filters.get("area") == "2":
+        return {"found": 0}
+    period = datetime.strptime(filters["date_to"], DATE_FORMAT) - datetime.strptime(filters["date_from"], DATE_FORMAT)
+    return {"found": int(period.total_seconds() / 86400 * 100)}
+
+
+def test_split_by_date() -> None:
+    """
+    Проверяем, что запрос делится по периоду публикации, пока выдача части больше ограничения.
+    @return: None
+    """
+    api = MagicMock(spec=HeadHunterAPI)
+    api.get_page.side_effect = fake_found
+    sharder = QuerySharder(api, cap=250)
+
+    shards = sharder.split("Python", datetime(2024, 1, 1), datetime(2024, 1, 9), areas=["1", "2"])
+    assert len(shards) == 4
+    assert all(shard["area"] == "1" for shard in shards)
+    assert shards[0]["date_from"] == "2024-01-01T00:00:00"
+    assert shards[-1]["date_to"] == "2024-01-09T00:00:00"
+
+
+def test_load_vacancies_deduplicates() -> None:
+    """
+    Проверяем, что вакансии из пересекающихся частей запроса не повторяются, а первая страница выдачи части,
+    полученная при подсчёте вакансий, повторно не запрашивается.
+    @return: None
+    """
+    api = MagicMock(spec=HeadHunterAPI)
+    api.get_page.side_effect = fake_found
+    api.iter_pages.side_effect = lambda keyword, pages, filters, first_page: [
+        {**first_page, "items": [{"id": filters["date_from"]}]},
+        {"items": [{"id": "boundary"}]},
+    ]
+    sharder = QuerySharder(api, cap=250)
+
+    vacancies = sharder.load_vacancies("Python", datetime(2024, 1, 1), datetime(2024, 1, 5))
+    ids = [vacancy["id"] for vacancy in vacancies]
+    assert ids == ["2024-01-01T00:00:00", "boundary", "2024-01-03T00:00:00"]
+    assert api.get_page.call_count == 3
+    assert [call.args[3] for call in api.iter_pages.call_args_list] == [{"found": 200}, {"found": 200}]
+
+
+def test_split_truncated(capsys: pytest.CaptureFixture) -> None:
+    """
+    Проверяем, что часть запроса, выдача которой больше ограничения при периоде меньше min_window, не теряется
+    молча: выводится предупреждение, а часть попадает в свойство truncated.
+    @param capsys: Фикстура для перехвата вывода.
+    @return: None
+    """
+    api = MagicMock(spec=HeadHunterAPI)
+    api.get_page.side_effect = fake_found
+    sharder = QuerySharder(api, cap=150, min_window=timedelta(days=2))
+
+    shards = sharder.split("Python", datetime(2024, 1, 1), datetime(2024, 1, 9))
+    assert len(shards) == 4
+    assert sharder.truncated == shards
+    assert "будут загружены не все вакансии" in capsys.readouterr().out
+
+    sharder.split("Python", datetime(2024, 1, 1), datetime(2024, 1, 2))
+    assert sharder.truncated == []
+
+
+def test_failed_shards(capsys: pytest.CaptureFixture) -> None:
+    """
+    Проверяем, что ошибка запроса части (пустой словарь) не принимается за пустую выдачу: часть попадает в
+    свойство failed и о ней выводится предупреждение, как и о части, одна из страниц которой не загрузилась.
+    @param capsys: Фикстура для перехвата вывода.
+    @return: None
+    """
+    api = MagicMock(spec=HeadHunterAPI)
+    api.get_page.side_effect = lambda keyword, page, filters: {} if filters["area"] == "3" else {"found": 50}
+    api.iter_pages.side_effect = lambda keyword, pages, filters, first_page: [
+        {**first_page, "items": [{"id": filters["area"]}]},
+        {} if filters["area"] == "4" else {"items": []},
+    ]
+    sharder = QuerySharder(api)
+
+    vacancies = sharder.load_vacancies("Python", datetime(2024, 1, 1), datetime(2024, 1, 2), areas=["1", "3", "4"])
+    assert [vacancy["id"] for vacancy in vacancies] == ["1", "4"]
+    assert [shard["area"] for shard in sharder.failed] == ["3", "4"]
+    assert sharder.truncated == []
+    output = capsys.readouterr().out
+    assert "Не удалось получить выдачу части запроса" in output
+    assert "Не все страницы выдачи части запроса" in output
@@ -0,0 +1,55 @@
+from unittest.mock import patch, MagicMock
+
+from src.rate_limiter import AdaptiveConcurrency, TokenBucket, backoff_delay, parse_retry_after
+
+
+@patch("src.rate_limiter.time.sleep")
+def test_token_bucket(mock_sleep: MagicMock) -> None:
+    """
+    Проверяем, что после исчерпания токенов запрос ждёт пополнения корзины.
+    @param mock_sleep: Заглушка для функции time.sleep.
+    @return: None
+    """
+    bucket = TokenBucket(rate=2, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+    mock_sleep.assert_not_called()
+
+    bucket.acquire()
+    mock_sleep.assert_called_once()
+    assert 0.4 < mock_sleep.call_args[0][0] <= 0.5
+
+
+def test_adaptive_concurrency() -> None:
+    """
+    Проверяем уменьшение лимита при ограничении запросов и его восстановление после серии успешных ответов.
+    @return: None
+    """
+    limiter = AdaptiveConcurrency(8, minimum=1, increase_after=2)
+    limiter.on_throttle()
+    assert limiter.limit == 4
+    limiter.on_throttle()
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.limit == 1
+
+    for _ in range(4):
+        limiter.on_success()
+    assert limiter.limit == 3
+
+    fixed = AdaptiveConcurrency(8, adaptive=False)
+    fixed.on_throttle()
+    assert fixed.limit == 8
+
+
+def test_backoff_delay() -> None:
+    """
+    Проверяем вычисление паузы перед повтором: по заголовку Retry-After и экспоненциально.
+    @return: None
+    """
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("abc") is None
+    assert backoff_delay(0, retry_after="2") == 2.0
+    assert 2.0 <= backoff_delay(2, base=1.0) <= 4.0
+    assert backoff_delay(10, base=1.0, cap=5.0) <= 5.0
@@ -0,0 +1,83 @@
+import json
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from src.headhunter_api import HeadHunterAPI
+from src.response_cache import ResponseCache
+
+
+@pytest.fixture
+def cache(tmpdir: str) -> ResponseCache:
+    """
+    Фикстура дискового кэша во временном каталоге.
+    @param tmpdir: Временный каталог.
+    @return: Экземпляр класса ResponseCache.
+    """
+    return ResponseCache(cache_dir=str(tmpdir), ttl=60)
+
+
+def test_put_and_get(cache: ResponseCache) -> None:
+    """
+    Проверяем сохранение записи и её получение (порядок параметров запроса не важен).
+    @param cache: Фикстура дискового кэша.
+    @return: None
+    """
+    assert cache.get("http://test/vacancies", {"text": "Python", "page": 0}) is None
+
+    cache.put("http://test/vacancies", {"text": "Python", "page": 0}, '{"items": []}', etag='"abc"')
+    entry = cache.get("http://test/vacancies", {"page": 0, "text": "Python"})
+    assert entry is not None
+    assert entry["body"] == '{"items": []}'
+    assert entry["etag"] == '"abc"'
+    assert cache.is_fresh(entry)
+
+
+def test_lru_eviction(tmpdir: str) -> None:
+    """
+    Проверяем, что при превышении размера кэша удаляется давно не использованная запись.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    cache = ResponseCache(cache_dir=str(tmpdir), max_size=300)  # Одна запись занимает ~130 байт
+    cache.put("http://test", {"page": 0}, "x" * 50)
+    cache.put("http://test", {"page": 1}, "x" * 50)
+    cache.get("http://test", {"page": 0})
+    cache.put("http://test", {"page": 2}, "x" * 50)
+
+    assert cache.get("http://test", {"page": 1}) is None
+    assert cache.get("http://test", {"page": 0}) is not None
+    assert cache.get("http://test", {"page": 2}) is not None
+    assert cache.stats()["entries"] == 2
+
+    # Новый экземпляр кэша подхватывает записи с диска
+    assert ResponseCache(cache_dir=str(tmpdir)).stats()["entries"] == 2
+
+
+@patch("src.headhunter_api.requests.Session.get")
+def test_load_vacancies_with_cache(mock_get: MagicMock, tmpdir: str) -> None:
+    """
+    Проверяем работу HeadHunterAPI с кэшем: загрузка, попадание в кэш и проверка устаревшей записи ответом 304.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    body = {"items": [{"id": "1"}], "pages": 1}
+    response = MagicMock(status_code=200, text=json.dumps(body), headers={"ETag": '"v1"'})
+    response.json.return_value = body
+    mock_get.return_value = response
+
+    cache = ResponseCache(cache_dir=str(tmpdir), ttl=60)
+    hh_api = HeadHunterAPI(cache=cache)
+    assert hh_api.load_vacancies("Python") == [{"id": "1"}]
+    assert hh_api.load_vacancies("Python") == [{"id": "1"}]
+    assert mock_get.call_count == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+
+    # Устаревшая запись проверяется условным запросом
+    stale_cache = ResponseCache(cache_dir=str(tmpdir), ttl=0)
+    mock_get.return_value = MagicMock(status_code=304, headers={})
+    assert HeadHunterAPI(cache=stale_cache).load_vacancies("Python") == [{"id": "1"}]
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert stale_cache.stats()["revalidations"] == 1
@@ -0,0 +1,135 @@
+import random
+
+import pytest
+
+from src.salary_index import SalaryIndex
+from tests.conftest import make_vacancy
+
+
+@pytest.fixture
+def index() -> SalaryIndex:
+    """
+    Фикстура индекса по зарплате.
+    @return: Экземпляр класса SalaryIndex.
+    """
+    index = SalaryIndex()
+    for vacancy in (
+        make_vacancy("1", salary_from=100000, salary_to=150000),
+        make_vacancy("2", salary_from=200000, salary_to=300000),
+        make_vacancy("3", salary_from=120000),
+        make_vacancy("4", salary_to=110000),
+        make_vacancy("5"),
+        make_vacancy("6", salary_from=160000, salary_to=180000),
+    ):
+        index.add(vacancy)
+    return index
+
+
+def test_range(index: SalaryIndex) -> None:
+    """
+    Проверяем запросы диапазона по одному полю зарплаты.
+    @param index: Фикстура индекса по зарплате.
+    @return: None
+    """
+    assert index.range("salary_from", low=150000) == ["6", "2"]
+    assert index.range("salary_from", 100000, 120000) == ["1", "3"]
+    assert index.range("salary_mid", high=130000) == ["4", "3", "1"]
+    assert index.range("salary_to") == ["4", "1", "6", "2"]
+
+
+def test_incremental_updates(index: SalaryIndex) -> None:
+    """
+    Проверяем, что индекс обновляется при удалении и замене вакансий и совпадает с полным перебором.
+    @param index: Фикстура индекса по зарплате.
+    @return: None
+    """
+    index.remove("1")
+    index.remove("404")
+    index.add(make_vacancy("3", salary_from=50000, salary_to=60000))
+    assert len(index) == 5
+    assert index.range("salary_from", high=120000) == ["3"]
+    assert index.range("salary_to", high=120000) == ["3", "4"]
+
+    generator = random.Random(1)
+    vacancies = {}
+    for number in range(300):
+        vacancy = make_vacancy(
+            f"r{number}",
+            salary_from=generator.choice([0, 1, 2, 3]) * 50000,
+            salary_to=generator.choice([0, 4, 5]) * 50000,
+        )
+        vacancies[vacancy.id] = vacancy
+        index.add(vacancy)
+    for number in range(0, 300, 3):
+        index.remove(f"r{number}")
+        del vacancies[f"r{number}"]
+
+    def expected(field: str, low: int, high: int) -> set:
+        """
+        Находит полным перебором вакансии, у которых значение поля зарплаты находится в диапазоне.
+        @param field: Поле зарплаты.
+        @param low: Нижняя граница диапазона.
+        @param high: Верхняя граница диапазона.
+        @return: Множество 'id' вакансий.
+        """
+        return {
+            vacancy.id
+            for vacancy in vacancies.values()
+            if getattr(vacancy, field) and low <= getattr(vacancy, field) <= high
+        }
+
+    for vacancy_id in ("2", "3", "4", "6"):
+        index.remove(vacancy_id)
+    for field in ("salary_from", "salary_to", "salary_mid"):
+        for low, high in ((0, 40000), (60000, 140000), (100000, 250000), (300000, 400000)):
+            assert set(index.range(field, low, high)) == expected(field, low, high)
+
+
+def test_add_many(index: SalaryIndex) -> None:
+    """
+    Проверяем пакетное добавление вакансий, в том числе с 'id', которые уже есть в индексе или повторяются в пакете.
+    @param index: Фикстура индекса по зарплате.
+    @return: None
+    """
+    index.add_many(
+        [
+            make_vacancy("7", salary_from=90000, salary_to=95000),
+            make_vacancy("2"),
+            make_vacancy("7", salary_from=80000, salary_to=85000),
+        ]
+    )
+    assert len(index) == 7
+    assert index.range("salary_from", high=100000) == ["7", "1"]
+    assert index.range("salary_to", low=200000) == []
+    index.remove("7")
+    assert index.range("salary_from", high=100000) == ["1"]
+
+
+def test_add_many_incremental(index: SalaryIndex) -> None:
+    """
+    Проверяем, что пакеты, добавленные в заполненный индекс, вставляются на свои места.
+    @param index: Фикстура индекса по зарплате.
+    @return: None
+    """
+    index.add_many([make_vacancy(f"r{number}", salary_from=1000 * number) for number in range(1, 1001)])
+    index.add_many([make_vacancy("8", salary_from=150500), make_vacancy("r1")])
+    assert index.range("salary_from", 150000, 151000) == ["r150", "8", "r151"]
+    assert index.range("salary_from", high=2000) == ["r2"]
+
+
+def test_remove_many(index: SalaryIndex) -> None:
+    """
+    Проверяем пакетное удаление вакансий: отсутствующие 'id' и повторы пропускаются, большой пакет удаляется
+    фильтрацией списков.
+    @param index: Фикстура индекса по зарплате.
+    @return: None
+    """
+    index.remove_many(["1", "3", "404", "1"])
+    assert len(index) == 4
+    assert index.range("salary_from") == ["6", "2"]
+    assert index.range("salary_mid") == ["4", "6", "2"]
+
+    index.add_many(make_vacancy(f"r{number}", salary_from=100000 + number) for number in range(1000))
+    index.remove_many(f"r{number}" for number in range(1, 1000))
+    assert index.range("salary_from", high=150000) == ["r0"]
+    assert len(index) == 5
@@ -0,0 +1,99 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from src.headhunter_api import HeadHunterAPI
+from src.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight() -> None:
+    """
+    Проверяем, что одновременные вызовы с одним ключом выполняются один раз и получают общий результат.
+    @return: None
+    """
+    single_flight = SingleFlight()
+    started = Event()
+    calls = []
+
+    def slow_call() -> list:
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return ["result"]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(single_flight.do, "key", slow_call)
+        started.wait()
+        others = [executor.submit(single_flight.do, "key", slow_call) for _ in range(3)]
+        results = [first.result()] + [future.result() for future in others]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+    # После завершения вызова ключ освобождается
+    single_flight.do("key", slow_call)
+    assert len(calls) == 2
+
+
+def test_single_flight_exception() -> None:
+    """
+    Проверяем, что исключение вызова передаётся вызывающему и ключ освобождается.
+    @return: None
+    """
+    single_flight = SingleFlight()
+
+    def failing_call() -> None:
+        raise ValueError("error")
+
+    with pytest.raises(ValueError):
+        single_flight.do("key", failing_call)
+    assert single_flight.do("key", lambda: 1) == 1
+
+
+def test_async_single_flight() -> None:
+    """
+    Проверяем объединение одинаковых одновременных вызовов в асинхронных задачах.
+    @return: None
+    """
+    calls = []
+
+    async def slow_call() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def run() -> list:
+        single_flight = AsyncSingleFlight()
+        return await asyncio.gather(*(single_flight.do("key", slow_call) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["result"] * 5
+    assert len(calls) == 1
+
+
+@patch("src.headhunter_api.requests.Session.get")
+def test_get_page_coalescing(mock_get: MagicMock) -> None:
+    """
+    Проверяем, что одновременные запросы одной и той же страницы разными экземплярами HeadHunterAPI выполняются один
+    раз.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @return: None
+    """
+
+    def slow_get(
+        url: str, headers: dict | None = None, params: dict | None = None, timeout: tuple | None = None
+    ) -> MagicMock:
+        time.sleep(0.1)
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"items": [{"id": "1"}]}
+        return response
+
+    mock_get.side_effect = slow_get
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pages = list(executor.map(lambda _: HeadHunterAPI().get_page("Python", 0), range(4)))
+
+    assert mock_get.call_count == 1
+    assert all(page == {"items": [{"id": "1"}]} for page in pages)
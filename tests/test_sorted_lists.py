@@ -0,0 +1,31 @@
+import random
+
+from src.sorted_lists import insort_many, remove_many
+
+
+def test_insort_many() -> None:
+    """
+    Проверяем вставку пакетов в отсортированный список: по одному элементу и слиянием.
+    @return: None
+    """
+    generator = random.Random(1)
+    items: list = []
+    for size in (1000, 3, 50, 0, 2000):
+        new_items = [generator.randrange(10000) for _ in range(size)]
+        expected = sorted(items + new_items)
+        insort_many(items, new_items)
+        assert items == expected
+
+
+def test_remove_many() -> None:
+    """
+    Проверяем удаление пакетов из отсортированного списка: по одному элементу и одним проходом фильтрации.
+    @return: None
+    """
+    generator = random.Random(2)
+    items = sorted(generator.sample(range(100000), 5000))
+    for size in (3, 0, 2000, 10):
+        old_items = generator.sample(items, size)
+        expected = sorted(set(items) - set(old_items))
+        remove_many(items, old_items)
+        assert items == expected
@@ -0,0 +1,96 @@
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+
+from src.headhunter_api import HeadHunterAPI
+from src.sync_state import SyncState, merge_vacancies
+
+
+@pytest.fixture
+def state_file(tmpdir: str) -> str:
+    """
+    Фикстура пути к файлу состояния инкрементальной загрузки.
+    @param tmpdir: Временный каталог.
+    @return: Путь к файлу состояния.
+    """
+    return str(tmpdir.join("sync_state.json"))
+
+
+def make_response(items: list[dict]) -> MagicMock:
+    """
+    Создаёт заглушку ответа API.
+    @param items: Вакансии на странице.
+    @return: Заглушка ответа API.
+    """
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"items": items, "pages": 1, "found": len(items)}
+    return response
+
+
+@patch("src.headhunter_api.requests.Session.get")
+def test_load_new_vacancies(mock_get: MagicMock, state_file: str) -> None:
+    """
+    Проверяем, что повторная загрузка запрашивает вакансии начиная с отметки и возвращает только новые вакансии.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @param state_file: Путь к файлу состояния.
+    @return: None
+    """
+    first_run = [
+        {"id": "1", "published_at": "2024-02-16T10:00:00+0300"},
+        {"id": "2", "published_at": "2024-02-16T12:00:00+0300"},
+    ]
+    second_run = [
+        {"id": "2", "published_at": "2024-02-16T12:00:00+0300"},
+        {"id": "3", "published_at": "2024-02-16T12:00:00+0300"},
+        {"id": "4", "published_at": "2024-02-16T09:30:00+0000"},
+    ]
+    mock_get.side_effect = [make_response(first_run), make_response(second_run)]
+    hh_api = HeadHunterAPI()
+
+    assert hh_api.load_new_vacancies("Python", SyncState(state_file)) == first_run
+    assert "date_from" not in mock_get.call_args.kwargs["params"]
+
+    # Новый экземпляр состояния читает отметку из файла
+    new_vacancies = hh_api.load_new_vacancies("Python", SyncState(state_file))
+    assert mock_get.call_args.kwargs["params"]["date_from"] == "2024-02-16T12:00:00+0300"
+    assert [vacancy["id"] for vacancy in new_vacancies] == ["3", "4"]
+
+    mark = SyncState(state_file).get(SyncState.make_key("Python"))
+    assert mark == {"published_at": "2024-02-16T09:30:00+0000", "ids": ["4"]}
+
+
+def test_merge_vacancies() -> None:
+    """
+    Проверяем объединение ранее сохранённых и новых вакансий по 'id'.
+    @return: None
+    """
+    existing = [{"id": "1", "name": "old"}, {"id": "2", "name": "old"}]
+    new = [{"id": "2", "name": "new"}, {"id": "3", "name": "new"}]
+    assert merge_vacancies(existing, new) == [
+        {"id": "1", "name": "old"},
+        {"id": "2", "name": "new"},
+        {"id": "3", "name": "new"},
+    ]
+
+
+@patch("src.headhunter_api.requests.Session.get")
+def test_load_new_vacancies_partial(mock_get: MagicMock, state_file: str) -> None:
+    """
+    Проверяем, что отметка не сдвигается, если страница выдачи не загрузилась или выдача обрезана параметром pages.
+    @param mock_get: Заглушка для метода requests.Session.get.
+    @param state_file: Путь к файлу состояния.
+    @return: None
+    """
+    first_page = make_response([{"id": "1", "published_at": "2024-02-16T10:00:00+0300"}])
+    first_page.json.return_value["pages"] = 2
+    failed_page = MagicMock(status_code=404)
+    failed_page.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
+    mock_get.side_effect = [first_page, failed_page, first_page]
+    hh_api = HeadHunterAPI(max_retries=0)
+    state = SyncState(state_file)
+
+    assert [vacancy["id"] for vacancy in hh_api.load_new_vacancies("Python", state)] == ["1"]
+    assert state.get(SyncState.make_key("Python")) is None
+
+    assert [vacancy["id"] for vacancy in hh_api.load_new_vacancies("Python", state, pages=1)] == ["1"]
+    assert state.get(SyncState.make_key("Python")) is None
@@ -77,7 +77,10 @@ def test_vacancy_repr(sample_vacancy_params: dict) -> None:
         "'published_at': '2024-02-16T14:58:28+0300', 'archived': False, "
         "'url': 'https://hh.ru/applicant/vacancy_response?vacancyId=93353083', 'requirement': "
         "'Занимать активную жизненную позицию, уметь активно танцевать и громко петь. Обладать навыками коммуникации, чтобы налаживать добрососедские отношения. Обладать системным мышлением...', "
-        "'responsibility': 'Оценивать вид из окна: встречать рассветы на кухне, и провожать алые закаты в спальне. Оценивать инфраструктуру района: ежедневно ходить на...'}"
+        "'responsibility': 'Оценивать вид из окна: встречать рассветы на кухне, и провожать алые закаты в спальне. Оценивать инфраструктуру района: ежедневно ходить на...', "
+        "'employer_id': None, 'employer': None, 'published_ts': 1708084708.0, 'currency_code': 'RUB', "
+        "'salary_mid': 400000.0, 'name_lower': 'тестировщик комфорта квартир', "
+        "'salary_from_base': 0, 'salary_to_base': 0, 'salary_mid_base': 0}"
     )
     assert repr(vacancy) == expected_repr
 
@@ -139,7 +142,7 @@ def test_cast_to_object_list(sample_vacancy_params: dict) -> None:
     """
     vacancies_data = [sample_vacancy_params]
     Vacancy.cast_to_object_list(vacancies_data)
-    assert len(Vacancy.obj_vacancies_list) == 12
+    assert len(Vacancy.obj_vacancies_list) == 1
     assert isinstance(Vacancy.obj_vacancies_list[0], Vacancy)
 
 
@@ -164,7 +167,7 @@ def test_filter_vacancies_by_keyword(sample_vacancy_params: dict) -> None:
     vacancies_data = [sample_vacancy_params]
     Vacancy.cast_to_object_list(vacancies_data)
     Vacancy.filter_vacancies_by_keyword(["Python"])
-    assert len(Vacancy.obj_vacancies_list) == 14
+    assert len(Vacancy.obj_vacancies_list) == 3
     assert Vacancy.obj_vacancies_list[0].name == "Тестировщик комфорта квартир"
 
 
@@ -177,7 +180,7 @@ def test_filter_vacancies_by_salary_diapason(sample_vacancy_params: dict) -> Non
     vacancies_data = [sample_vacancy_params]
     Vacancy.cast_to_object_list(vacancies_data)
     Vacancy.filter_vacancies_by_salary_diapason("1000-2000")
-    assert len(Vacancy.obj_vacancies_list) == 15
+    assert len(Vacancy.obj_vacancies_list) == 4
     assert Vacancy.obj_vacancies_list[0].salary_from == 350000
     assert Vacancy.obj_vacancies_list[0].salary_to == 450000
 
@@ -195,3 +198,17 @@ def test_delete_vacancy(sample_vacancy_params: dict) -> None:
     assert Vacancy.obj_vacancies_list[0].id == "1"
     Vacancy.delete_vacancy("1")
     assert Vacancy.obj_vacancies_list == []
+
+
+def test_vacancy_typed_fields_from_legacy_params(sample_vacancy_params: dict) -> None:
+    """
+    Проверяем, что типизированные поля вычисляются для параметров без них (например, прочитанных из старого файла).
+    @param sample_vacancy_params: Фикстура параметров вакансии.
+    @return: None
+    """
+    sample_vacancy_params["salary_to"] = 0
+    vacancy = Vacancy(sample_vacancy_params)
+    assert vacancy.published_ts == 1708084708.0
+    assert vacancy.currency_code == "RUB"
+    assert vacancy.salary_mid == 350000.0
+    assert vacancy.name_lower == "тестировщик комфорта квартир"
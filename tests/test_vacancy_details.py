@@ -0,0 +1,33 @@
+from unittest.mock import MagicMock
+
+from src.headhunter_api import HeadHunterAPI
+from src.vacancy_details import VacancyDetailsFetcher
+
+
+def test_fetch_details(tmpdir: str) -> None:
+    """
+    Проверяем загрузку описаний вакансий: повторяющиеся 'id' загружаются один раз, неизменившиеся вакансии берутся
+    с диска, а вакансии с новой датой публикации загружаются заново.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    api = MagicMock(spec=HeadHunterAPI)
+    api.url = "https://api.hh.ru/vacancies"
+    api.get_json.side_effect = lambda url: {"id": url.rsplit("/", 1)[-1], "key_skills": [{"name": "Python"}]}
+
+    vacancies = [
+        {"id": "1", "published_at": "2024-02-16T14:58:28+0300"},
+        {"id": "2", "published_at": "2024-02-16T14:58:28+0300"},
+        {"id": "1", "published_at": "2024-02-16T14:58:28+0300"},
+    ]
+    fetcher = VacancyDetailsFetcher(api, cache_dir=str(tmpdir), max_workers=2)
+    details = fetcher.fetch(vacancies)
+    assert set(details) == {"1", "2"}
+    assert details["1"]["key_skills"] == [{"name": "Python"}]
+    assert api.get_json.call_count == 2
+
+    vacancies[1]["published_at"] = "2024-02-17T10:00:00+0300"
+    fetcher = VacancyDetailsFetcher(api, cache_dir=str(tmpdir), max_workers=2)
+    assert set(fetcher.fetch(vacancies)) == {"1", "2"}
+    api.get_json.assert_called_with("https://api.hh.ru/vacancies/2")
+    assert fetcher.stats() == {"fetched": 1, "cached": 1, "failed": 0}
@@ -0,0 +1,186 @@
+import pytest
+
+from src.currency_converter import CurrencyConverter
+from src.quarantine import Quarantine
+from src.vacancy import Vacancy
+from src.vacancy_store import VacancyStore
+from tests.conftest import make_params, make_vacancy
+
+
+@pytest.fixture
+def store() -> VacancyStore:
+    """
+    Фикстура хранилища вакансий.
+    @return: Экземпляр класса VacancyStore.
+    """
+    return VacancyStore.from_dicts(
+        [
+            make_params("1", "Python Developer", 100000, 150000),
+            make_params("2", "Senior Python/Django developer", 250000, 300000),
+            make_params("3", "Java стажер", 50000, 60000),
+        ]
+    )
+
+
+def test_store_is_independent(store: VacancyStore) -> None:
+    """
+    Проверяем, что хранилища независимы друг от друга и от общего списка Vacancy.obj_vacancies_list.
+    @param store: Фикстура хранилища вакансий.
+    @return: None
+    """
+    list_before = list(Vacancy.obj_vacancies_list)
+    other = VacancyStore([make_vacancy("4", "Go Developer", 1, 2)])
+    assert len(store) == 3
+    assert len(other) == 1
+    assert Vacancy.obj_vacancies_list == list_before
+
+    vacancy = next(iter(store))
+    assert vacancy in store
+    assert vacancy not in other
+    store.remove(vacancy)
+    assert len(store) == 2
+    assert vacancy not in store
+    with pytest.raises(ValueError):
+        store.remove(vacancy)
+
+    store.add(vacancy)
+    assert [item.id for item in store] == ["2", "3", "1"]
+    store.clear()
+    assert len(store) == 0
+
+
+def test_store_sort_filter_delete(store: VacancyStore) -> None:
+    """
+    Проверяем сортировку, фильтрацию и удаление вакансий в хранилище.
+    @param store: Фикстура хранилища вакансий.
+    @return: None
+    """
+    assert [vacancy.id for vacancy in store.sort_by_keyword("salary_from")] == ["2", "1", "3"]
+    assert store.sort_by_keyword("unknown") == []
+    assert [vacancy.id for vacancy in store] == ["1", "2", "3"]
+
+    assert [vacancy.id for vacancy in store.filter_by_keyword(["python", "DJANGO"])] == ["1", "2"]
+    assert [vacancy.id for vacancy in store.filter_by_salary_diapason("50000 - 60000")] == ["3"]
+
+    store.sort_by_keyword("salary_from", reverse=False, save_result=True)
+    assert [vacancy.id for vacancy in store] == ["3", "1", "2"]
+
+    assert store.delete("1")
+    assert not store.delete("1")
+    assert [vacancy["id"] for vacancy in store.to_dicts()] == ["3", "2"]
+
+
+def test_store_from_dicts_with_quarantine(tmpdir: str) -> None:
+    """
+    Проверяем, что испорченные вакансии при создании хранилища отправляются в карантин.
+    @param tmpdir: Временный каталог.
+    @return: None
+    """
+    quarantine = Quarantine(f"{tmpdir}/quarantine.jsonl")
+    store = VacancyStore.from_dicts([make_params("1", "Python", 1, 2), {"id": "2"}], quarantine=quarantine)
+    assert len(store) == 1
+    assert quarantine.stats() == {"missing_key:name": 1}
+
+
+def test_store_id_index(store: VacancyStore) -> None:
+    """
+    Проверяем поиск и удаление вакансий по 'id', в том числе пакетное, и замену вакансии с тем же 'id'.
+    @param store: Фикстура хранилища вакансий.
+    @return: None
+    """
+    vacancy = store.get("2")
+    assert vacancy is not None
+    assert vacancy.name == "Senior Python/Django developer"
+    assert store.get("404") is None
+
+    replacement = make_vacancy("2", "Python Team Lead", 400000, 500000)
+    store.add(replacement)
+    assert len(store) == 3
+    assert store.get("2") is replacement
+
+    assert store.delete_many(["1", "3", "404", "1"]) == 2
+    assert [vacancy.id for vacancy in store] == ["2"]
+
+
+def test_store_extend_duplicate_ids(store: VacancyStore) -> None:
+    """
+    Проверяем, что повторяющийся 'id' внутри пакета не ломает индексы хранилища.
+    @param store: Фикстура хранилища вакансий.
+    @return: None
+    """
+    store.add(make_vacancy("4", "Scala engineer", 0, 0))
+    duplicate = make_vacancy("5", "Rust", 120000, 0)
+    store.extend([duplicate, duplicate])
+    assert len(store) == 5
+    assert [vacancy.id for vacancy in store.filter_by_keyword(["scala"])] == ["4"]
+    assert [vacancy.id for vacancy in store.filter_by_keyword(["rust"])] == ["5"]
+    assert [vacancy.id for vacancy in VacancyStore([duplicate, duplicate]).filter_by_keyword(["rust"])] == ["5"]
+
+
+def test_store_salary_queries(store: VacancyStore) -> None:
+    """
+    Проверяем запросы по зарплате в хранилище: индекс обновляется при добавлении и удалении вакансий.
+    @param store: Фикстура хранилища вакансий.
+    @return: None
+    """
+    assert [vacancy.id for vacancy in store.filter_by_salary_diapason("140000 - 260000")] == ["1", "2"]
+    assert [vacancy.id for vacancy in store.salary_range("salary_from", low=100000)] == ["1", "2"]
+
+    store.add(make_vacancy("4", "Python Developer", 0, 270000))
+    store.delete("2")
+    assert [vacancy.id for vacancy in store.filter_by_salary_diapason("140000 - 260000")] == ["4", "1"]
+    assert [vacancy.id for vacancy in store.salary_range("salary_mid", high=130000)] == ["3", "1"]
+
+
+def test_store_salary_queries_normalized() -> None:
+    """
+    Проверяем, что после пересчёта зарплат в базовую валюту фильтрация по диапазону зарплат и сортировка сравнивают
+    зарплаты в базовой валюте, а не в валюте вакансии.
+    @return: None
+    """
+    usd = make_params("1", "Go Developer", 2000, 3000)
+    usd["currency"] = "USD"
+    records = [usd, make_params("2", "Python Developer", 100000, 150000)]
+
+    raw_store = VacancyStore.from_dicts(records)
+    assert not raw_store.normalized
+    assert [vacancy.id for vacancy in raw_store.filter_by_salary_diapason("1000 - 5000")] == ["1"]
+
+    store = VacancyStore.from_dicts(CurrencyConverter({"RUR": 1, "USD": 0.01}).normalize(records))
+    assert store.normalized
+    assert [vacancy.id for vacancy in store.filter_by_salary_diapason("160000 - 400000")] == ["1"]
+    assert store.filter_by_salary_diapason("1000 - 5000") == []
+    assert [vacancy.id for vacancy in store.filter_by_salary_diapason("1000 - 5000", base=False)] == ["1"]
+    assert [vacancy.id for vacancy in store.sort_by_keyword("salary_mid_base")] == ["1", "2"]
+
+
+def test_store_keyword_filter(store: VacancyStore) -> None:
+    """
+    Проверяем фильтрацию по ключевым словам в хранилище: без повторов, AND/OR, по началу слова и после удаления.
+    @param store: Фикстура хранилища вакансий.
+    @return: None
+    """
+    assert [vacancy.id for vacancy in store.filter_by_keyword(["python", "developer"])] == ["1", "2"]
+    assert [vacancy.id for vacancy in store.filter_by_keyword(["python", "django"], match_all=True)] == ["2"]
+    assert [vacancy.id for vacancy in store.filter_by_keyword(["стаж"])] == ["3"]
+    assert store.filter_by_keyword(["стаж"], prefix=False) == []
+
+    store.add(make_vacancy("4", "Python стажер", 0, 0))
+    store.delete("3")
+    assert [vacancy.id for vacancy in store.filter_by_keyword(["стажер"], save_result=True)] == ["4"]
+    assert [vacancy.id for vacancy in store] == ["4"]
+    assert [vacancy.id for vacancy in store.filter_by_keyword(["python"])] == ["4"]
+
+
+def test_store_text_fields() -> None:
+    """
+    Проверяем фильтрацию по требованиям к кандидату, если поле 'requirement' включено в индекс хранилища.
+    @return: None
+    """
+    params = make_params("1", "Backend developer", 0, 0)
+    params["requirement"] = "Опыт работы с Python"
+    store = VacancyStore.from_dicts([params], text_fields=("name", "requirement"))
+    assert [vacancy.id for vacancy in store.filter_by_keyword(["python"], fields=("requirement",))] == ["1"]
+    assert store.filter_by_keyword(["python"]) == []
+    with pytest.raises(ValueError):
+        VacancyStore().filter_by_keyword(["python"], fields=("requirement",))
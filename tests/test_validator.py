@@ -1,4 +1,9 @@
+import sys
+
 import pytest
+
+from datetime import datetime
+
 from src.vacancy import Validator
 
 
@@ -44,6 +49,10 @@ def test_validate(sample_vacancy: dict) -> None:
         "url": "http://example.com/apply",
         "requirement": "3+ years of experience",
         "responsibility": "Develop software",
+        "published_ts": datetime(2023, 1, 1).timestamp(),
+        "currency_code": "RUR",
+        "salary_mid": 150000.0,
+        "name_lower": "python developer",
     }
 
     assert validated == expected
@@ -67,6 +76,63 @@ def test_validate_with_missing_keys(sample_vacancy: dict) -> None:
         "published_at": "2023-01-01",
         "archived": False,
         "url": "http://example.com/apply",
+        "published_ts": datetime(2023, 1, 1).timestamp(),
+        "name_lower": "python developer",
     }
 
     assert validated == expected
+
+
+def test_validate_employer_id(sample_vacancy: dict) -> None:
+    """
+    Проверяет, что из вложенного словаря 'employer' сохраняется идентификатор работодателя.
+    @param sample_vacancy:  Фикстура параметров сырой вакансии.
+    @return: None
+    """
+    sample_vacancy["employer"] = {"id": "3499705", "name": "BM GROUP", "logo_urls": {"90": "https://hhcdn.ru/1.png"}}
+    assert Validator.validate(sample_vacancy)["employer_id"] == "3499705"
+
+    sample_vacancy["employer"] = None
+    assert Validator.validate(sample_vacancy)["employer_id"] is None
+
+
+def test_validate_many(sample_vacancy: dict) -> None:
+    """
+    Проверяет, что метод 'validate_many' возвращает то же, что и 'validate' для каждой вакансии, а в режиме
+    столбцов - списки значений по ключам.
+    @param sample_vacancy:  Фикстура параметров сырой вакансии.
+    @return: None
+    """
+    other_vacancy = {"id": "456", "name": "Java Developer", "salary": None, "snippet": None}
+    items = [sample_vacancy, other_vacancy]
+
+    assert Validator.validate_many(items) == [Validator.validate(item) for item in items]
+
+    columns = Validator.validate_many(items, columns=True)
+    assert columns["id"] == ["123", "456"]
+    assert columns["salary_from"] == [100000, 0]
+    assert columns["currency"] == ["RUR", 0]
+    assert columns["url"] == ["http://example.com/apply", None]
+    assert columns["requirement"] == ["3+ years of experience", 0]
+    assert columns["employer_id"] == [None, None]
+
+
+def test_validate_typed_fields(sample_vacancy: dict) -> None:
+    """
+    Проверяет вычисление типизированных полей: метки времени публикации, кода валюты и середины вилки зарплат.
+    @param sample_vacancy:  Фикстура параметров сырой вакансии.
+    @return: None
+    """
+    sample_vacancy["published_at"] = "2024-02-16T14:58:28+0300"
+    sample_vacancy["salary"] = {"from": None, "to": 90000, "currency": "".join(["K", "ZT"])}
+    validated = Validator.validate(sample_vacancy)
+    assert validated["published_ts"] == 1708084708.0
+    assert validated["currency_code"] is sys.intern("KZT")
+    assert validated["salary_mid"] == 90000.0
+
+    sample_vacancy["salary"] = None
+    sample_vacancy["published_at"] = None
+    validated = Validator.validate(sample_vacancy)
+    assert validated["published_ts"] == 0.0
+    assert validated["currency_code"] == ""
+    assert validated["salary_mid"] == 0.0